@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import gzip
+import hashlib
 import json
 import os
 from datetime import datetime, timedelta, timezone
@@ -8,58 +10,236 @@ from airflow import DAG
 from airflow.decorators import task
 from airflow.operators.python import get_current_context
 import boto3
+import requests
+
+try:
+    # same summarizer and index record as the MCP server (./src is on PYTHONPATH in docker-compose)
+    from incident_triage_mcp.adapters.incident_index import index_key, index_record
+    from incident_triage_mcp.tools.triage import build_triage_summary
+except ImportError:
+    build_triage_summary = index_record = index_key = None
 
 
 ARTIFACT_DIR = os.getenv("INCIDENT_ARTIFACT_DIR", "/opt/airflow/dags/artifacts")
+# v1: indented JSON at evidence/v1/<id>.json (fs: <id>.json)
+# v2: compact JSON compressed with EVIDENCE_ENCODING (gzip|zstd) at evidence/v2/<id>.json,
+#     encoding recorded in object metadata (fs: <id>.json.gz / <id>.json.zst)
+EVIDENCE_FORMAT = os.getenv("EVIDENCE_FORMAT", "v1").lower()
+EVIDENCE_ENCODING = os.getenv("EVIDENCE_ENCODING", "gzip").lower()
+FS_SUFFIXES = {"identity": ".json", "gzip": ".json.gz", "zstd": ".json.zst"}
+
+# MCP server's /hooks/evidence endpoint; wakes evidence_wait_for_bundle callers immediately
+MCP_EVIDENCE_WEBHOOK_URL = os.getenv("MCP_EVIDENCE_WEBHOOK_URL")
+MCP_EVIDENCE_WEBHOOK_TOKEN = os.getenv("EVIDENCE_WEBHOOK_TOKEN")
 
 
 def utc_now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+def encode_bundle(bundle: dict) -> tuple[bytes, str, int]:
+    """-> (payload, encoding, uncompressed length)"""
+    if EVIDENCE_FORMAT != "v2":
+        data = json.dumps(bundle, ensure_ascii=False, indent=2).encode("utf-8")
+        return data, "identity", len(data)
+    data = json.dumps(bundle, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    if EVIDENCE_ENCODING == "zstd":
+        import zstandard  # optional; only needed for EVIDENCE_ENCODING=zstd
+
+        return zstandard.ZstdCompressor(level=3).compress(data), "zstd", len(data)
+    if EVIDENCE_ENCODING == "gzip":
+        return gzip.compress(data, compresslevel=6, mtime=0), "gzip", len(data)
+    return data, "identity", len(data)
+
+
+def summary_artifact(bundle: dict, bundle_sha256: str, uri: str) -> bytes | None:
+    """Precomputed triage summary, keyed by the bundle content hash; None if the summarizer isn't importable."""
+    if build_triage_summary is None:
+        return None
+    doc = {
+        "schema_version": "v1",
+        "bundle_sha256": bundle_sha256,
+        "summary": build_triage_summary(bundle, evidence_uri=uri),
+    }
+    return json.dumps(doc, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def notify_mcp(incident_id: str, uri: str, index: dict | None = None) -> None:
+    """Best effort: waiters fall back to HEAD polling if the ping is lost."""
+    if not MCP_EVIDENCE_WEBHOOK_URL:
+        return
+    headers = {"Authorization": f"Bearer {MCP_EVIDENCE_WEBHOOK_TOKEN}"} if MCP_EVIDENCE_WEBHOOK_TOKEN else {}
+    try:
+        payload = {"incident_id": incident_id, "uri": uri}
+        if index is not None:
+            payload["index"] = index
+        requests.post(MCP_EVIDENCE_WEBHOOK_URL, json=payload, headers=headers, timeout=5)
+    except requests.RequestException as e:
+        print(f"[notify_mcp] webhook ping failed: {e}")
+
+
+def write_bundle(bundle: dict, final: bool = True) -> str:
+    """
+    Store the bundle (v1/v2 per EVIDENCE_FORMAT) and ping the MCP server.
+    Final bundles also get their precomputed summary and incident index record.
+    """
+    ARTIFACT_STORE = os.getenv("ARTIFACT_STORE", "fs").lower()
+    S3_ENDPOINT_URL = os.getenv("S3_ENDPOINT_URL")
+    S3_BUCKET = os.getenv("S3_BUCKET", "triage-artifacts")
+    S3_REGION = os.getenv("S3_REGION", "us-east-1")
+
+    incident_id = bundle["incident_id"]
+    fmt = "v2" if EVIDENCE_FORMAT == "v2" else "v1"
+    key = f"evidence/{fmt}/{incident_id}.json"
+    payload, encoding, length = encode_bundle(bundle)
+    bundle_sha256 = hashlib.sha256(payload).hexdigest()
+
+    if ARTIFACT_STORE == "s3":
+        s3 = boto3.client(
+            "s3",
+            endpoint_url=S3_ENDPOINT_URL,
+            region_name=S3_REGION,
+        )
+        metadata = {"bundle-sha256": bundle_sha256}
+        extra = {}
+        if encoding != "identity":
+            metadata.update({"evidence-encoding": encoding, "evidence-length": str(length)})
+            extra = {"ContentEncoding": encoding}
+        s3.put_object(
+            Bucket=S3_BUCKET,
+            Key=key,
+            Body=payload,
+            ContentType="application/json",
+            Metadata=metadata,
+            **extra,
+        )
+        uri = f"s3://{S3_BUCKET}/{key}"
+        if not final:
+            notify_mcp(incident_id, uri)
+            return uri
+        summary = summary_artifact(bundle, bundle_sha256, uri)
+        if summary is not None:
+            s3.put_object(
+                Bucket=S3_BUCKET,
+                Key=f"summaries/v1/{incident_id}.json",
+                Body=summary,
+                ContentType="application/json",
+            )
+        index = index_record(bundle, uri) if index_record is not None else None
+        if index is not None:
+            s3.put_object(
+                Bucket=S3_BUCKET,
+                Key=index_key(index),
+                Body=json.dumps(index).encode("utf-8"),
+                ContentType="application/json",
+            )
+        notify_mcp(incident_id, uri, index)
+        return uri
+
+    os.makedirs(ARTIFACT_DIR, exist_ok=True)
+    path = os.path.join(ARTIFACT_DIR, f"{incident_id}{FS_SUFFIXES[encoding]}")
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(payload)
+    os.replace(tmp, path)
+    # drop the other format's file so readers never pick up a stale bundle
+    for suffix in FS_SUFFIXES.values():
+        other = os.path.join(ARTIFACT_DIR, f"{incident_id}{suffix}")
+        if other != path and os.path.exists(other):
+            os.remove(other)
+    if not final:
+        notify_mcp(incident_id, path)
+        return path
+
+    summary = summary_artifact(bundle, bundle_sha256, path)
+    if summary is not None:
+        os.makedirs(os.path.join(ARTIFACT_DIR, "summaries"), exist_ok=True)
+        summary_path = os.path.join(ARTIFACT_DIR, "summaries", f"{incident_id}.json")
+        with open(f"{summary_path}.tmp", "wb") as f:
+            f.write(summary)
+        os.replace(f"{summary_path}.tmp", summary_path)
+
+    index = index_record(bundle, path) if index_record is not None else None
+    if index is not None:
+        index_path = os.path.join(ARTIFACT_DIR, index_key(index))
+        os.makedirs(os.path.dirname(index_path), exist_ok=True)
+        with open(f"{index_path}.tmp", "w", encoding="utf-8") as f:
+            json.dump(index, f)
+        os.replace(f"{index_path}.tmp", index_path)
+
+    notify_mcp(incident_id, path, index)
+    return path
+
+
+def _timeout(name: str, default: int) -> timedelta:
+    return timedelta(seconds=int(os.getenv(f"EVIDENCE_{name}_TIMEOUT_SECONDS", str(default))))
+
+
+COLLECTORS = ("alerts", "metrics", "runbooks", "deploys")
+
+
+def assemble(window: dict, parts: dict[str, dict | None]) -> dict:
+    merged: dict = {"alerts": [], "signals": [], "runbook_hits": [], "hypotheses": [], "links": []}
+    for part in parts.values():
+        for field, values in (part or {}).items():
+            merged[field].extend(values)
+    for h in ("Downstream dependency timeout", "DB connection pool saturation"):
+        if h not in merged["hypotheses"]:
+            merged["hypotheses"].append(h)
+    missing = sorted(name for name, part in parts.items() if part is None)
+    return {
+        "schema_version": "v1",
+        "incident_id": window["incident_id"],
+        "service": window["service"],
+        "time_window": {"start_iso": window["start_iso"], "end_iso": window["end_iso"]},
+        **merged,
+        "recommended_next_steps": [
+            "Confirm if a deploy happened in the last 30 minutes",
+            "Check dependency health and error budgets",
+            "Inspect logs for top failing endpoint",
+        ],
+        "partial": bool(missing),
+        "missing_evidence": missing,
+        "generated_at_iso": utc_now_iso(),
+    }
+
+
+
 with DAG(
     dag_id="incident_evidence_v1",
     start_date=datetime(2024, 1, 1),
     schedule=None,
     catchup=False,
     tags=["incident", "triage"],
+    # a collector that times out is reported as missing evidence, not retried
+    default_args={"retries": 0},
 ) as dag:
 
     @task
-    def build_bundle(window_minutes: int = 30) -> str:
-        """
-        MVP evidence collector:
-        - Uses local/demo data (no external creds)
-        - Writes a single EvidenceBundle JSON to ARTIFACT_DIR/<incident_id>.json
-        """
-
-        ARTIFACT_STORE = os.getenv("ARTIFACT_STORE", "fs").lower()
-        S3_ENDPOINT_URL = os.getenv("S3_ENDPOINT_URL")
-        S3_BUCKET = os.getenv("S3_BUCKET", "triage-artifacts")
-        S3_REGION = os.getenv("S3_REGION", "us-east-1")
-
-
+    def incident_window(window_minutes: int = 30) -> dict:
         context = get_current_context()
         conf = (context.get("dag_run") or {}).conf or {}
-        incident_id = conf.get("incident_id", "unknown_incident")
-        service = conf.get("service", "unknown_service")
-
-        os.makedirs(ARTIFACT_DIR, exist_ok=True)
-
         end = datetime.now(timezone.utc)
         start = end - timedelta(minutes=window_minutes)
-        query = f"{service} 5xx latency timeout db"
-        runbook_hits = search_runbooks(query=query, limit=5)
-        bundle = {
-            "schema_version": "v1",
-            "incident_id": incident_id,
-            "service": service,
-            "time_window": {"start_iso": start.isoformat(), "end_iso": end.isoformat()},
+        return {
+            "incident_id": conf.get("incident_id", "unknown_incident"),
+            "service": conf.get("service", "unknown_service"),
+            "start_iso": start.isoformat(),
+            "end_iso": end.isoformat(),
+        }
+
+    # Collectors run in parallel, each bounded by its own EVIDENCE_<NAME>_TIMEOUT_SECONDS.
+    # MVP: local/demo data (no external creds); swap in real alert/metric/deploy sources here.
+
+    @task(execution_timeout=_timeout("ALERTS", 60))
+    def collect_alerts(window: dict) -> dict:
+        end = datetime.fromisoformat(window["end_iso"])
+        return {
             "alerts": [
                 {
                     "alert_id": "mock_501",
                     "provider": "mock",
-                    "service": service,
+                    "service": window["service"],
                     "name": "5xx rate high",
                     "status": "triggered",
                     "started_at_iso": (end - timedelta(minutes=6)).isoformat(),
@@ -67,52 +247,58 @@ with DAG(
                     "signal": {"metric": "http.server.errors", "value": 0.12, "threshold": 0.05},
                 }
             ],
+        }
+
+    @task(execution_timeout=_timeout("METRICS", 120))
+    def collect_metrics(window: dict) -> dict:
+        return {
             "signals": [
                 {"key": "error_rate", "value": 0.12, "unit": "ratio"},
                 {"key": "latency_p95_ms", "value": 840, "unit": "ms"},
                 {"key": "rps", "value": 2100, "unit": "rps"},
                 {"key": "top_endpoint", "value": "POST /checkout"},
             ],
-            "runbook_hits": runbook_hits,
-            "hypotheses": [
-                "Recent deploy regression",
-                "Downstream dependency timeout",
-                "DB connection pool saturation",
-            ],
-            "recommended_next_steps": [
-                "Confirm if a deploy happened in the last 30 minutes",
-                "Check dependency health and error budgets",
-                "Inspect logs for top failing endpoint",
-            ],
             "links": [
                 {"type": "dashboard", "url": "https://example.local/dashboards/payments"},
                 {"type": "logs", "url": "https://example.local/logs?q=5xx"},
             ],
-            "generated_at_iso": utc_now_iso(),
         }
 
-        
-        key = f"evidence/v1/{incident_id}.json"
-        payload = json.dumps(bundle, ensure_ascii=False, indent=2).encode("utf-8")
+    @task(execution_timeout=_timeout("RUNBOOKS", 60))
+    def collect_runbooks(window: dict) -> dict:
+        query = f"{window['service']} 5xx latency timeout db"
+        return {"runbook_hits": search_runbooks(query=query, limit=5)}
 
-        if ARTIFACT_STORE == "s3":
-            s3 = boto3.client(
-                "s3",
-                endpoint_url=S3_ENDPOINT_URL,
-                region_name=S3_REGION,
-            )
-            s3.put_object(
-                Bucket=S3_BUCKET,
-                Key=key,
-                Body=payload,
-                ContentType="application/json",
-            )
-            return f"s3://{S3_BUCKET}/{key}"
-        path = os.path.join(ARTIFACT_DIR, f"{incident_id}.json")
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(bundle, f, ensure_ascii=False, indent=2)
+    @task(execution_timeout=_timeout("DEPLOYS", 60))
+    def collect_deploys(window: dict) -> dict:
+        end = datetime.fromisoformat(window["end_iso"])
+        deployed_at = end - timedelta(minutes=12)
+        return {
+            "signals": [
+                {"key": "last_deploy", "value": f"{window['service']}@2024.06.1 at {deployed_at.isoformat()}"},
+            ],
+            "hypotheses": ["Recent deploy regression"],
+        }
 
-        return path
+    @task
+    def write_partial(window: dict, alerts: dict) -> str:
+        """Alerts-only bundle as soon as alerts are in; consumers see something before slower collectors finish."""
+        parts = {name: None for name in COLLECTORS}
+        parts["alerts"] = alerts
+        return write_bundle(assemble(window, parts), final=False)
+
+    @task(trigger_rule="all_done")
+    def merge_bundle(window: dict, alerts: dict | None, metrics: dict | None, runbooks: dict | None, deploys: dict | None) -> str:
+        """Final EvidenceBundle; failed or timed-out collectors are listed in missing_evidence."""
+        parts = {"alerts": alerts, "metrics": metrics, "runbooks": runbooks, "deploys": deploys}
+        return write_bundle(assemble(window, parts), final=True)
 
-    # Create the task in the DAG.
-    build_bundle()
+    window = incident_window()
+    alerts = collect_alerts(window)
+    metrics = collect_metrics(window)
+    runbooks = collect_runbooks(window)
+    deploys = collect_deploys(window)
+    partial = write_partial(window, alerts)
+    final = merge_bundle(window, alerts, metrics, runbooks, deploys)
+    # the final write must never be overtaken by the early partial one
+    partial >> final
@@ -1,31 +1,26 @@
 from pathlib import Path
-import re
-import math
 import os
 
 RUNBOOKS_DIR = os.getenv("RUNBOOKS_DIR", "/opt/airflow/runbooks")
+# Prebuilt index shared with the MCP server, built offline by incident-triage-runbooks-index
+# (and kept current by the server); a DAG run only maps the file instead of reading every runbook.
+RUNBOOKS_INDEX_PATH = os.getenv("RUNBOOKS_INDEX_PATH", "")
 
-def tokenize(s: str) -> list[str]:
-    return [t for t in re.split(r"[^a-zA-Z0-9]+", s.lower()) if t]
-
-def score_doc(query_tokens: list[str], text: str) -> float:
-    hay = text.lower()
-    hits = sum(1 for t in query_tokens if t in hay)
-    # smooth score 0..1
-    return 1.0 - math.exp(-hits / 4.0)
 
 def search_runbooks(query: str, limit: int = 5) -> list[dict]:
-    base = Path(RUNBOOKS_DIR)
-    if not base.exists():
+    try:
+        # same search code as the MCP server (./src is mounted on PYTHONPATH in docker-compose)
+        from incident_triage_mcp.tools.runbooks import get_index, get_prebuilt
+    except ImportError as e:
+        raise RuntimeError(
+            "runbook search needs the incident_triage_mcp package: mount ./src and put it on "
+            "PYTHONPATH (see docker-compose.yml), or pip install the package on the Airflow workers"
+        ) from e
+
+    if RUNBOOKS_INDEX_PATH and Path(RUNBOOKS_INDEX_PATH).exists():
+        # re-mapped when the file is replaced; never rebuilt from here
+        return get_prebuilt(RUNBOOKS_INDEX_PATH).search(query, limit)
+    if not Path(RUNBOOKS_DIR).exists():
         return []
-    q = tokenize(query)
-    scored = []
-    for p in base.glob("*.md"):
-        body = p.read_text(encoding="utf-8", errors="ignore")
-        s = score_doc(q, body)
-        if s > 0:
-            title = body.splitlines()[0].lstrip("# ").strip() if body.strip() else p.stem
-            summary = " ".join(body.splitlines()[0:20])[:220]
-            scored.append((s, {"doc_id": p.stem, "title": title, "score": round(s, 3), "summary": summary}))
-    scored.sort(key=lambda x: x[0], reverse=True)
-    return [d for _, d in scored[:limit]]
\ No newline at end of file
+    # no prebuilt index yet: the in-process index over the runbooks directory
+    return get_index(RUNBOOKS_DIR).search(query, limit)
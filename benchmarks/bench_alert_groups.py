@@ -0,0 +1,112 @@
+"""
+Alert storm grouping through the alerts_fetch_active tool: the storm is served
+by a cursor-API feed, synced into the server's alert store, then grouped over
+the whole window while only --max-alerts raw alerts are returned. Reports tool
+latency (first call includes the sync) and the size of what reaches the agent
+(raw alerts JSON vs. the tool's JSON), and checks no alert was lost to the cap.
+
+    python benchmarks/bench_alert_groups.py --alerts 100000 --services 20
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+NAMES = [
+    ("5xx rate high", "http.server.errors"),
+    ("p95 latency high", "http.server.latency.p95"),
+    ("db connections saturated", "db.pool.in_use"),
+    ("consumer lag", "kafka.consumer.lag"),
+]
+
+
+def make_storm(n: int, services: int, minutes: int):
+    rng = random.Random(3)
+    now = datetime.now(timezone.utc)
+    for i in range(n):
+        name, metric = NAMES[rng.randrange(len(NAMES))]
+        yield {
+            "alert_id": f"dd_{i}",
+            "provider": "datadog",
+            "service": f"svc-{rng.randrange(services)}",
+            "name": name,
+            "status": rng.choice(("triggered", "triggered", "warning")),
+            "started_at": (now - timedelta(seconds=rng.randrange(minutes * 60))).isoformat(),
+            "priority": rng.choice(("P1", "P2", "P3")),
+            "signal": {"metric": metric, "value": round(rng.random(), 3), "threshold": 0.5},
+        }
+
+
+class StormFeed:
+    """fetch_alerts_since over a fixed list: the store pages through it like a real cursor API."""
+
+    def __init__(self, alerts: List[Dict[str, Any]]) -> None:
+        self.alerts = alerts
+
+    def fetch_alerts_since(self, cursor: Optional[str], limit: int) -> Dict[str, Any]:
+        start = int(cursor or 0)
+        page = self.alerts[start : start + limit]
+        return {"alerts": page, "cursor": str(start + len(page)), "has_more": start + len(page) < len(self.alerts)}
+
+
+async def call(tool, **kwargs) -> tuple[dict, float]:
+    start = time.perf_counter()
+    out = await tool(**kwargs)
+    return out, time.perf_counter() - start
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--alerts", type=int, default=100000)
+    ap.add_argument("--services", type=int, default=20)
+    ap.add_argument("--minutes", type=int, default=30)
+    ap.add_argument("--window-seconds", type=float, default=300)
+    ap.add_argument("--max-groups", type=int, default=50)
+    ap.add_argument("--max-alerts", type=int, default=50)
+    args = ap.parse_args()
+
+    tmp = tempfile.mkdtemp()
+    os.environ.update(
+        ARTIFACT_STORE="fs",
+        AIRFLOW_ARTIFACT_DIR=tmp,
+        AUDIT_MODE="file",
+        AUDIT_PATH=os.path.join(tmp, "audit.jsonl"),
+        ALERT_GROUP_WINDOW_SECONDS=str(args.window_seconds),
+    )
+    from incident_triage_mcp import server
+    from incident_triage_mcp.lazy import Lazy
+    from incident_triage_mcp.tools.alert_store import AlertStore
+
+    alerts = list(make_storm(args.alerts, args.services, args.minutes))
+    server.alert_store = Lazy(lambda: AlertStore(StormFeed(alerts)))
+    kwargs = dict(since_minutes=args.minutes + 1, max_alerts=args.max_alerts, max_groups=args.max_groups)
+
+    out, first = asyncio.run(call(server.alerts_fetch_active, **kwargs))
+    _, warm = asyncio.run(call(server.alerts_fetch_active, **kwargs))
+    grouping = out["grouping"]
+    print(f"alerts_fetch_active: {args.alerts:,} alerts -> {grouping['total_groups']:,} groups; "
+          f"first call (sync + group) {first * 1000:.0f} ms, next call {warm * 1000:.0f} ms "
+          f"({grouping['total_alerts'] / warm:,.0f} alerts/s)")
+
+    raw_bytes = len(json.dumps(alerts))
+    grouped_bytes = len(json.dumps(out))
+    print(f"payload: raw {raw_bytes:,} bytes -> tool result {grouped_bytes:,} bytes "
+          f"({raw_bytes / grouped_bytes:.0f}x smaller, {len(grouping['groups'])} groups returned, truncated={grouping['truncated']})")
+
+    with_alerts = asyncio.run(server.alerts_fetch_active(include_alerts=True, **kwargs))
+    counted = sum(g["alerts"] for g in grouping["by_service"].values())
+    if grouping["total_alerts"] != args.alerts or counted != args.alerts or len(with_alerts["alerts"]) != min(args.max_alerts, args.alerts):
+        print(f"FAIL: grouped {grouping['total_alerts']:,} of {args.alerts:,} alerts, returned {len(with_alerts['alerts'])} raw")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
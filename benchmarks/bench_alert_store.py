@@ -0,0 +1,59 @@
+"""
+Repeated alerts_fetch_active polling against a high-volume feed: full-window
+refetch on every call (old behavior) vs. cursor sync into the local AlertStore
+plus since_cursor deltas. Reports time per poll and alerts pulled from upstream.
+
+    python benchmarks/bench_alert_store.py --open 5000 --events-per-poll 50 --polls 200
+"""
+from __future__ import annotations
+
+import argparse
+import time
+
+from incident_triage_mcp.adapters.datadog_mock import DatadogFeedMock
+from incident_triage_mcp.tools.alert_store import AlertStore
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--open", type=int, default=5000, help="steady-state open alerts in the feed")
+    ap.add_argument("--events-per-poll", type=int, default=50)
+    ap.add_argument("--polls", type=int, default=200)
+    args = ap.parse_args()
+
+    feed = DatadogFeedMock(rate_per_minute=0, max_open=args.open, retention_minutes=24 * 60, seed=11)
+    feed.advance(args.open * 3)
+
+    # old: every poll refetches the whole 30-minute window
+    served = feed.upstream_alerts_served
+    start = time.perf_counter()
+    for _ in range(args.polls):
+        feed.advance(args.events_per_poll)
+        feed.fetch_active_alerts([], 30, 10**9)
+    full_ms = (time.perf_counter() - start) * 1000 / args.polls
+    full_alerts = (feed.upstream_alerts_served - served) / args.polls
+
+    # new: sync deltas into the store, answer with changes since the caller's cursor
+    store = AlertStore(feed, retention_minutes=24 * 60)
+    store.sync()
+    cursor = store.cursor
+    served = feed.upstream_alerts_served
+    returned = 0
+    start = time.perf_counter()
+    for _ in range(args.polls):
+        feed.advance(args.events_per_poll)
+        store.sync()
+        delta = store.changes_since(cursor, None, 10**9)
+        cursor = delta["cursor"]
+        returned += len(delta["alerts"])
+    delta_ms = (time.perf_counter() - start) * 1000 / args.polls
+    delta_alerts = (feed.upstream_alerts_served - served) / args.polls
+
+    print(f"feed: {store.stats()['size']:,} alerts retained, {args.events_per_poll} changes per poll")
+    print(f"full refetch:    {full_ms:7.2f} ms/poll, {full_alerts:8,.0f} alerts from upstream per poll")
+    print(f"cursor + store:  {delta_ms:7.2f} ms/poll, {delta_alerts:8,.0f} alerts from upstream per poll, "
+          f"{returned / args.polls:,.0f} returned")
+
+
+if __name__ == "__main__":
+    main()
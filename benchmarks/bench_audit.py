@@ -0,0 +1,76 @@
+"""
+Per-call overhead of AuditLog.write on the tool's critical path.
+
+- legacy: open/append/close per event (file) or print(flush=True) per event (stdout)
+- sync:   current AuditLog with AUDIT_ASYNC=false (batched code path, inline commit)
+- async:  current AuditLog with the background group-commit writer
+
+    python benchmarks/bench_audit.py --events 20000
+    python benchmarks/bench_audit.py --events 20000 --fsync always
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import tempfile
+import time
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+
+from incident_triage_mcp.audit import AuditLog
+
+ARGS = {"incident_id": "INC-123", "service": "payments-api"}
+
+
+def legacy_write(path: Path) -> str:
+    corr = f"corr_{uuid.uuid4().hex}"
+    evt = {
+        "ts": datetime.now(timezone.utc).isoformat(),
+        "correlation_id": corr,
+        "tool": "incident.triage_summary",
+        "arguments": ARGS,
+        "ok": True,
+        "meta": {},
+    }
+    with path.open("a", encoding="utf-8") as f:
+        f.write(json.dumps(evt, ensure_ascii=False) + "\n")
+    return corr
+
+
+def _time_calls(n: int, fn) -> float:
+    t0 = time.perf_counter()
+    for _ in range(n):
+        fn()
+    return (time.perf_counter() - t0) / n * 1e6
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--events", type=int, default=20000)
+    ap.add_argument("--fsync", default="none", choices=["none", "interval", "always"])
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy_path = Path(tmp) / "legacy.jsonl"
+        us = _time_calls(args.events, lambda: legacy_write(legacy_path))
+        print(f"legacy  {us:8.2f} us/call")
+
+        for label, async_writes in (("sync", "false"), ("async", "true")):
+            os.environ.update(
+                AUDIT_MODE="file",
+                AUDIT_PATH=str(Path(tmp) / f"{label}.jsonl"),
+                AUDIT_ASYNC=async_writes,
+                AUDIT_FSYNC=args.fsync,
+            )
+            audit = AuditLog()
+            us = _time_calls(args.events, lambda: audit.write("incident.triage_summary", ARGS, ok=True))
+            t0 = time.perf_counter()
+            audit.close()
+            drain_ms = (time.perf_counter() - t0) * 1000
+            print(f"{label:<7} {us:8.2f} us/call  (drain on close: {drain_ms:.1f} ms)")
+
+
+if __name__ == "__main__":
+    main()
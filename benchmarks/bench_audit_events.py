@@ -0,0 +1,89 @@
+"""
+Audit event encoding cost (no I/O): events/second and transient bytes per event
+for each JSON backend x correlation-id scheme, against the original encoder
+(dataclass + datetime.isoformat + uuid4 + json.dumps(evt.__dict__)).
+
+    python benchmarks/bench_audit_events.py --events 200000
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import time
+import tracemalloc
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict
+
+from incident_triage_mcp.audit import AuditLog, orjson
+
+ARGS = {"incident_id": "INC-123", "service": "payments-api", "limit": 5}
+
+
+@dataclass
+class _LegacyEvent:
+    ts: str
+    correlation_id: str
+    tool: str
+    arguments: Dict[str, Any]
+    ok: bool
+    meta: Dict[str, Any]
+
+
+def legacy_encode() -> str:
+    evt = _LegacyEvent(
+        ts=datetime.now(timezone.utc).isoformat(),
+        correlation_id=f"corr_{uuid.uuid4().hex}",
+        tool="runbooks.search",
+        arguments=ARGS,
+        ok=True,
+        meta={},
+    )
+    return json.dumps(evt.__dict__, ensure_ascii=False)
+
+
+def _events_per_second(fn: Callable[[], Any], n: int) -> float:
+    t0 = time.perf_counter()
+    for _ in range(n):
+        fn()
+    return n / (time.perf_counter() - t0)
+
+
+def _bytes_per_event(fn: Callable[[], Any], samples: int = 2000) -> float:
+    # peak transient allocation while building one event (output line included)
+    tracemalloc.start()
+    total = 0
+    for _ in range(samples):
+        base, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+        total += peak - base
+    tracemalloc.stop()
+    return total / samples
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--events", type=int, default=200000)
+    args = ap.parse_args()
+
+    cases = [("legacy", "-", legacy_encode)]
+    backends = ["stdlib"] + (["orjson"] if orjson is not None else [])
+    for backend in backends:
+        for ids in ("uuid4", "counter", "ulid"):
+            os.environ.update(AUDIT_ASYNC="false", AUDIT_JSON=backend, AUDIT_CORRELATION_ID=ids)
+            audit = AuditLog()
+            cases.append((backend, ids, lambda a=audit: a.encode("runbooks.search", ARGS, ok=True)))
+
+    print(f"{'json':<8} {'ids':<8} {'events/s':>12} {'bytes/event':>12}")
+    for backend, ids, fn in cases:
+        eps = _events_per_second(fn, args.events)
+        bpe = _bytes_per_event(fn)
+        print(f"{backend:<8} {ids:<8} {eps:12,.0f} {bpe:12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Mixed workload against tools.cpu_pool.CpuPool: heavy triage summaries of large
+bundles (tools.triage.summarize_raw on the bundle's JSON bytes) run
+back-to-back while light calls (a ping-sized handler every --light-interval-ms)
+share the same event loop. Compares the thread backend (CPU_POOL_WORKERS=0)
+against process pools of each size in --workers.
+
+    python benchmarks/bench_cpu_pool.py --alerts 5000 --signals 2000 --workers 0,1,2,4 --seconds 10
+
+With threads, every summary holds the GIL and light calls queue behind it, so
+their p95 tracks the summary's CPU time. With processes, light-call latency
+should stay near the idle baseline and summary throughput should grow with
+workers up to the number of cores (this process needs one for the loop).
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import statistics
+import time
+from typing import Dict, List
+
+from bench_evidence_summary import make_bundle
+from incident_triage_mcp.tools.cpu_pool import CpuPool
+from incident_triage_mcp.tools.triage import summarize_raw
+
+
+def _light_call(message: str) -> Dict[str, str]:
+    # what ping / alerts-from-the-local-store cost: a little Python, no I/O
+    return {"ok": "true", "message": message, "ts": str(time.time())}
+
+
+async def light_loop(stop: asyncio.Event, interval: float, latencies: List[float]) -> None:
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(0)  # yield like a real handler would, then do the work
+        _light_call("bench")
+        await asyncio.sleep(interval)
+        latencies.append(time.perf_counter() - start - interval)
+
+
+async def heavy_loop(pool: CpuPool, raw: bytes, stop: asyncio.Event, done: List[float]) -> None:
+    while not stop.is_set():
+        start = time.perf_counter()
+        await pool.run(summarize_raw, raw, "s3://bench/evidence")
+        done.append(time.perf_counter() - start)
+
+
+async def run(pool: CpuPool, raw: bytes, heavy: int, seconds: float, interval: float) -> Dict[str, float]:
+    stop = asyncio.Event()
+    light: List[float] = []
+    summaries: List[float] = []
+    tasks = [asyncio.create_task(light_loop(stop, interval, light))]
+    tasks += [asyncio.create_task(heavy_loop(pool, raw, stop, summaries)) for _ in range(heavy)]
+    await asyncio.sleep(seconds)
+    stop.set()
+    await asyncio.gather(*tasks)
+    light.sort()
+    return {
+        "light_p50_ms": statistics.median(light) * 1000,
+        "light_p95_ms": light[int(len(light) * 0.95) - 1] * 1000,
+        "summaries_per_s": len(summaries) / seconds,
+        "summary_ms": statistics.median(summaries) * 1000 if summaries else 0.0,
+    }
+
+
+async def warm(pool: CpuPool, raw: bytes) -> None:
+    # spawn the workers and import the summarizer in each before timing anything
+    await asyncio.gather(*(pool.run(summarize_raw, raw, None) for _ in range(pool.workers)))
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--alerts", type=int, default=5000)
+    ap.add_argument("--signals", type=int, default=2000)
+    ap.add_argument("--workers", default="0,1,2,4")
+    ap.add_argument("--heavy", type=int, default=0, help="concurrent summary callers (default: max(2, workers))")
+    ap.add_argument("--seconds", type=float, default=10)
+    ap.add_argument("--light-interval-ms", type=float, default=10)
+    args = ap.parse_args()
+
+    raw = make_bundle(args.alerts, args.signals)
+    interval = args.light_interval_ms / 1000
+    print(f"cores: {os.cpu_count()}  bundle: {len(raw) / 1e6:.1f} MB")
+
+    idle = asyncio.run(run(CpuPool(0), raw, 0, min(args.seconds, 3), interval))
+    print(f"idle          light p50 {idle['light_p50_ms']:6.2f} ms  p95 {idle['light_p95_ms']:6.2f} ms")
+    for workers in (int(w) for w in args.workers.split(",")):
+        pool = CpuPool(workers)
+        try:
+            if pool.processes:
+                asyncio.run(warm(pool, raw))
+            res = asyncio.run(run(pool, raw, args.heavy or max(2, workers), args.seconds, interval))
+        finally:
+            pool.shutdown()
+        backend = f"processes={workers}" if workers else "threads"
+        print(
+            f"{backend:12s}  light p50 {res['light_p50_ms']:6.2f} ms  p95 {res['light_p95_ms']:6.2f} ms   "
+            f"{res['summaries_per_s']:6.2f} summaries/s  ({res['summary_ms']:6.1f} ms each)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Evidence artifact formats: bytes on the wire and decode + validate time per
+bundle size, v1 (indented JSON) vs. v2 (compact JSON, gzip / zstd).
+
+    python benchmarks/bench_evidence_format.py --sizes 10,1000,10000
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import time
+
+from bench_evidence_summary import make_bundle
+
+from incident_triage_mcp.domain_models import EvidenceBundle
+from incident_triage_mcp.evidence_format import compress, decompress, dumps, zstandard
+
+
+def measure(payload: bytes, encoding: str, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        EvidenceBundle.model_validate_json(decompress(payload, encoding))
+    return (time.perf_counter() - start) * 1000 / iterations
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--sizes", default="10,1000,10000", help="alerts (= signals) per bundle")
+    ap.add_argument("--iterations", type=int, default=10)
+    args = ap.parse_args()
+
+    variants = [("v1", "identity"), ("v2", "identity"), ("v2", "gzip")]
+    if zstandard is not None:
+        variants.append(("v2", "zstd"))
+    else:
+        print("(zstandard not installed: skipping v2+zstd)")
+
+    print(f"{'items':>7} {'format':<12} {'bytes':>12} {'ratio':>7} {'encode ms':>10} {'decode+validate ms':>19}")
+    for n in (int(s) for s in args.sizes.split(",")):
+        bundle = json.loads(make_bundle(n, n))
+        baseline = len(dumps(bundle, "v1"))
+        for fmt, encoding in variants:
+            start = time.perf_counter()
+            payload = compress(dumps(bundle, fmt), encoding)
+            encode_ms = (time.perf_counter() - start) * 1000
+            decode_ms = measure(payload, encoding, args.iterations)
+            label = f"{fmt}+{encoding}" if encoding != "identity" else fmt + (" compact" if fmt == "v2" else "")
+            print(
+                f"{n:>7} {label:<12} {len(payload):>12,} {baseline / len(payload):>6.1f}x "
+                f"{encode_ms:>10.1f} {decode_ms:>19.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Peak memory of loading an evidence bundle as it grows: whole-object
+(read + model_validate_json) vs. the streaming loader that keeps at most
+--max-items alerts/signals. The streamed peak should stay flat.
+
+    python benchmarks/bench_evidence_stream.py --sizes 1000,10000,50000 --max-items 200
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable
+
+from bench_evidence_summary import make_bundle
+
+from incident_triage_mcp.domain_models import EvidenceBundle
+from incident_triage_mcp.tools.evidence_stream import load_bundle_stream
+
+
+def whole(path: str, max_items: int) -> Any:
+    with open(path, "rb") as f:
+        return EvidenceBundle.model_validate_json(f.read())
+
+
+def streamed(path: str, max_items: int) -> Any:
+    with open(path, "rb") as f:
+        return load_bundle_stream(f, max_items=max_items)
+
+
+def measure(fn: Callable[[str, int], Any], path: str, max_items: int) -> tuple[float, float]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = fn(path, max_items)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return elapsed * 1000, peak / 1_048_576
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--sizes", default="1000,10000,50000", help="alerts (= signals) per bundle")
+    ap.add_argument("--max-items", type=int, default=200)
+    args = ap.parse_args()
+
+    print(f"{'items':>8} {'size MiB':>9} {'whole ms':>9} {'whole MiB':>10} {'stream ms':>10} {'stream MiB':>11}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in (int(s) for s in args.sizes.split(",")):
+            path = os.path.join(tmp, f"bundle-{n}.json")
+            with open(path, "wb") as f:
+                f.write(make_bundle(n, n))
+            w_ms, w_mib = measure(whole, path, args.max_items)
+            s_ms, s_mib = measure(streamed, path, args.max_items)
+            size = os.path.getsize(path) / 1_048_576
+            print(f"{n:>8} {size:>9.1f} {w_ms:>9.0f} {w_mib:>10.1f} {s_ms:>10.0f} {s_mib:>11.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Evidence -> summary path on large bundles: CPU time per summary and peak
+transient memory, old path vs. validate-once path.
+
+  legacy:   json.loads -> model_validate -> model_dump -> model_validate
+            -> TriageSummary(...) -> model_dump   (the pre-change tool chain)
+  current:  model_validate_json(raw bytes) -> summarize_bundle -> model_dump
+
+    python benchmarks/bench_evidence_summary.py --alerts 5000 --signals 5000
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import time
+import tracemalloc
+from typing import Any, Callable, Dict
+
+from incident_triage_mcp.domain_models import EvidenceBundle
+from incident_triage_mcp.tools.triage import build_triage_summary, summarize_bundle
+
+
+def make_bundle(n_alerts: int, n_signals: int) -> bytes:
+    alerts = [
+        {
+            "alert_id": f"A-{i}",
+            "provider": "mock",
+            "service": "payments-api",
+            "name": f"High error rate #{i}",
+            "status": "triggered" if i % 3 else "warning",
+            "started_at_iso": "2026-01-01T00:00:00+00:00",
+            "priority": ("P1", "P2", "P3", "P4")[i % 4],
+            "signal": {"metric": "error_rate", "value": i / 1000},
+        }
+        for i in range(n_alerts)
+    ]
+    signals = [{"key": f"metric_{i}", "value": i * 0.5, "unit": "ms"} for i in range(n_signals)]
+    signals[:2] = [{"key": "error_rate", "value": 0.07}, {"key": "latency_p95_ms", "value": 1800, "unit": "ms"}]
+    bundle = {
+        "incident_id": "INC-BENCH",
+        "service": "payments-api",
+        "time_window": {"start_iso": "2026-01-01T00:00:00+00:00", "end_iso": "2026-01-01T00:30:00+00:00"},
+        "alerts": alerts,
+        "signals": signals,
+        "runbook_hits": [
+            {"doc_id": f"RB-{i}", "title": f"Runbook {i}", "score": i / 10, "summary": "steps"} for i in range(10)
+        ],
+        "hypotheses": ["bad deploy", "db saturation"],
+        "recommended_next_steps": ["roll back"],
+        "generated_at_iso": "2026-01-01T00:30:00+00:00",
+    }
+    return json.dumps(bundle).encode("utf-8")
+
+
+def legacy(raw: bytes) -> Dict[str, Any]:
+    # evidence_get_bundle: json.loads + validate + dump; build_triage_summary: validate again + dump
+    bundle_dict = EvidenceBundle.model_validate(json.loads(raw)).model_dump()
+    return build_triage_summary(bundle_dict, evidence_uri="s3://bench/evidence")
+
+
+def current(raw: bytes) -> Dict[str, Any]:
+    bundle = EvidenceBundle.model_validate_json(raw)
+    return summarize_bundle(bundle, evidence_uri="s3://bench/evidence").model_dump()
+
+
+def cached(bundle: EvidenceBundle) -> Dict[str, Any]:
+    # evidence cache hit: no parsing at all
+    return summarize_bundle(bundle, evidence_uri="s3://bench/evidence").model_dump()
+
+
+def measure(name: str, fn: Callable[[Any], Dict[str, Any]], arg: Any, iterations: int) -> None:
+    fn(arg)  # warm up
+    start = time.process_time()
+    for _ in range(iterations):
+        fn(arg)
+    cpu_ms = (time.process_time() - start) * 1000 / iterations
+
+    tracemalloc.start()
+    fn(arg)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{name:<10} {cpu_ms:9.2f} ms/summary   peak {peak / 1_048_576:8.2f} MiB")
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--alerts", type=int, default=5000)
+    ap.add_argument("--signals", type=int, default=5000)
+    ap.add_argument("--iterations", type=int, default=20)
+    args = ap.parse_args()
+
+    raw = make_bundle(args.alerts, args.signals)
+    assert legacy(raw).keys() == current(raw).keys()
+    print(f"bundle: {args.alerts} alerts, {args.signals} signals, {len(raw) / 1024:.0f} KiB JSON")
+
+    measure("legacy", legacy, raw, args.iterations)
+    measure("current", current, raw, args.iterations)
+    measure("cache-hit", cached, EvidenceBundle.model_validate_json(raw), args.iterations)
+
+
+if __name__ == "__main__":
+    main()
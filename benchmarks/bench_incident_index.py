@@ -0,0 +1,84 @@
+"""
+incidents_list latency over the SQLite incident index vs. the scan it replaces
+(glob + parse every local index record), plus incremental sync cost.
+
+    python benchmarks/bench_incident_index.py --incidents 20000
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+from incident_triage_mcp.adapters.incident_index import IncidentIndex, fs_index_source, parse_since
+
+SERVICES = [f"svc-{i}" for i in range(50)]
+
+
+def write_records(root: str, n: int) -> None:
+    now = datetime.now(timezone.utc)
+    for i in range(n):
+        end = now - timedelta(minutes=i * 2)  # ~28 days for 20k incidents
+        rec = {
+            "incident_id": f"INC-{i}",
+            "service": SERVICES[i % len(SERVICES)],
+            "priority": f"P{i % 4 + 1}",
+            "status": ("triggered", "warning", "resolved")[i % 3],
+            "start_iso": (end - timedelta(minutes=30)).isoformat(),
+            "end_iso": end.isoformat(),
+            "generated_at_iso": end.isoformat(),
+            "alerts_count": i % 7,
+            "uri": f"s3://bench/evidence/v1/INC-{i}.json",
+        }
+        day_dir = os.path.join(root, "index", "v1", f"dt={rec['end_iso'][:10]}")
+        os.makedirs(day_dir, exist_ok=True)
+        with open(os.path.join(day_dir, f"{rec['incident_id']}.json"), "w") as f:
+            json.dump(rec, f)
+
+
+def scan(root: str, service: str, since_ts: float) -> list:
+    out = []
+    for dirpath, _, files in os.walk(os.path.join(root, "index")):
+        for name in files:
+            with open(os.path.join(dirpath, name)) as f:
+                rec = json.load(f)
+            end = datetime.fromisoformat(rec["end_iso"]).timestamp()
+            if rec["service"] == service and end >= since_ts:
+                out.append(rec)
+    return sorted(out, key=lambda r: r["end_iso"], reverse=True)[:50]
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--incidents", type=int, default=20000)
+    ap.add_argument("--queries", type=int, default=200)
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as root:
+        write_records(root, args.incidents)
+        index = IncidentIndex(fs_index_source(root), backfill_days=31)
+
+        start = time.perf_counter()
+        first = index.sync(force=True)
+        print(f"initial sync: {first['upserted']} records in {(time.perf_counter() - start) * 1000:.0f} ms")
+        start = time.perf_counter()
+        index.sync(force=True)
+        print(f"no-op incremental sync: {(time.perf_counter() - start) * 1000:.1f} ms")
+
+        since_ts = parse_since("7d")
+        start = time.perf_counter()
+        for q in range(args.queries):
+            index.list(service=SERVICES[q % len(SERVICES)], since_ts=since_ts, priority="P2")
+        per_query = (time.perf_counter() - start) * 1000 / args.queries
+        print(f"indexed incidents_list: {per_query:.3f} ms/query")
+
+        start = time.perf_counter()
+        scan(root, SERVICES[0], since_ts)
+        print(f"full scan of {args.incidents} records: {(time.perf_counter() - start) * 1000:.0f} ms/query")
+
+
+if __name__ == "__main__":
+    main()
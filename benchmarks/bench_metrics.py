@@ -0,0 +1,62 @@
+"""
+Per-call overhead of the metrics wrappers (incident_triage_mcp.metrics) on a
+no-op sync function and a no-op coroutine, enabled vs. disabled vs. bare.
+
+    python benchmarks/bench_metrics.py --calls 200000
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+from incident_triage_mcp import metrics
+
+
+def noop(x: int) -> int:
+    return x
+
+
+async def anoop(x: int) -> int:
+    return x
+
+
+def per_call_ns(fn, calls: int) -> float:
+    start = time.perf_counter_ns()
+    for i in range(calls):
+        fn(i)
+    return (time.perf_counter_ns() - start) / calls
+
+
+async def per_call_ns_async(fn, calls: int) -> float:
+    start = time.perf_counter_ns()
+    for i in range(calls):
+        await fn(i)
+    return (time.perf_counter_ns() - start) / calls
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--calls", type=int, default=200000)
+    args = ap.parse_args()
+
+    timed = metrics.timed("bench.noop")(noop)
+    atimed = metrics.tool(anoop)
+
+    bare = per_call_ns(noop, args.calls)
+    on = per_call_ns(timed, args.calls)
+    abare = asyncio.run(per_call_ns_async(anoop, args.calls))
+    aon = asyncio.run(per_call_ns_async(atimed, args.calls))
+    metrics.REGISTRY.enabled = False
+    off = per_call_ns(timed, args.calls)
+    aoff = asyncio.run(per_call_ns_async(atimed, args.calls))
+
+    print(f"sync:  bare {bare:6.0f} ns   instrumented {on:6.0f} ns (+{(on - bare) / 1000:.2f} us)   disabled {off:6.0f} ns")
+    print(f"async: bare {abare:6.0f} ns   instrumented {aon:6.0f} ns (+{(aon - abare) / 1000:.2f} us)   disabled {aoff:6.0f} ns")
+    render_start = time.perf_counter()
+    text = metrics.REGISTRY.render()
+    print(f"/metrics render: {(time.perf_counter() - render_start) * 1000:.2f} ms, {len(text):,} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Slowdown of a CPU-bound tool call under the opt-in sampling profiler
+(incident_triage_mcp.profiling) at several sampling rates, plus the cost of
+the wrapper when profiling is off.
+
+    python benchmarks/bench_profiler.py --work-ms 200 --hz 50,100,250,1000
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import tempfile
+import time
+
+from incident_triage_mcp.profiling import ToolProfiler, fs_profile_sink
+
+
+def work_units(ms: float) -> int:
+    """Fixed amount of work that takes ~ms unprofiled."""
+    start = time.perf_counter()
+    units = 0
+    while (time.perf_counter() - start) * 1000 < ms:
+        sum(i * i for i in range(2000))
+        units += 1
+    return units
+
+
+def run_units(units: int) -> None:
+    for _ in range(units):
+        sum(i * i for i in range(2000))
+
+
+async def timed_call(fn, units: int, repeats: int) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        await fn(units)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--work-ms", type=float, default=200)
+    ap.add_argument("--hz", default="50,100,250,1000")
+    ap.add_argument("--repeats", type=int, default=5)
+    args = ap.parse_args()
+
+    async def tool(units: int) -> dict:
+        run_units(units)
+        return {"correlation_id": f"bench-{units}"}
+
+    units = work_units(args.work_ms)
+    base = asyncio.run(timed_call(tool, units, args.repeats))
+    off = asyncio.run(timed_call(ToolProfiler().wrap(tool), units, args.repeats))
+    print(f"unprofiled {base * 1000:7.1f} ms   wrapper, profiling off {off * 1000:7.1f} ms")
+
+    with tempfile.TemporaryDirectory() as out:
+        for hz in (float(h) for h in args.hz.split(",")):
+            profiler = ToolProfiler(tools=frozenset({"tool"}), hz=hz, sink=fs_profile_sink(out))
+            wrapped = profiler.wrap(tool)
+            base = asyncio.run(timed_call(tool, units, args.repeats))  # re-measured: CPU clocks drift
+            t = asyncio.run(timed_call(wrapped, units, args.repeats))
+            info = asyncio.run(wrapped(units))["profile"]
+            print(
+                f"{hz:6.0f} Hz  {t * 1000:7.1f} ms  ({(t - base) / base * 100:+5.1f}%)  "
+                f"{info['samples']:5d} samples  {info['stacks']:3d} stacks"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Runbook search cold start: rebuilding the index from Markdown (what every DAG
+run used to do) vs. mapping the prebuilt index file, plus per-query latency.
+
+    python benchmarks/bench_runbook_index.py --runbooks 2000
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from incident_triage_mcp.tools.runbooks import PrebuiltRunbookIndex, RunbookIndex, build_index_file
+
+WORDS = (
+    "db timeout 5xx latency pool connection rollback deploy cache redis kafka lag disk cpu memory oom "
+    "payments checkout replica failover dns tls certificate throttling quota queue backlog retry"
+).split()
+QUERIES = ["db timeout pool", "kafka consumer lag", "5xx latency deploy rollback", "tls certificate expiry"]
+
+
+def write_runbooks(root: Path, n: int, words_per_doc: int) -> None:
+    rng = random.Random(7)
+    for i in range(n):
+        body = " ".join(rng.choice(WORDS) for _ in range(words_per_doc))
+        (root / f"rb-{i}.md").write_text(f"# Runbook {i} {rng.choice(WORDS)}\n\n{body}\n", encoding="utf-8")
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--runbooks", type=int, default=2000)
+    ap.add_argument("--words", type=int, default=400)
+    ap.add_argument("--queries", type=int, default=200)
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp) / "runbooks"
+        root.mkdir()
+        write_runbooks(root, args.runbooks, args.words)
+        index_path = str(Path(tmp) / "runbooks.idx")
+
+        start = time.perf_counter()
+        build_index_file(str(root), index_path)
+        print(f"build index file: {(time.perf_counter() - start) * 1000:.0f} ms ({Path(index_path).stat().st_size:,} bytes)")
+
+        start = time.perf_counter()
+        live = RunbookIndex(str(root))
+        live.refresh(force=True)
+        print(f"cold start, rescan {args.runbooks} files: {(time.perf_counter() - start) * 1000:.1f} ms")
+
+        start = time.perf_counter()
+        prebuilt = PrebuiltRunbookIndex(index_path)
+        print(f"cold start, map prebuilt index: {(time.perf_counter() - start) * 1000:.1f} ms")
+
+        for name, idx in (("in-memory", live), ("prebuilt", prebuilt)):
+            start = time.perf_counter()
+            for q in range(args.queries):
+                idx.search(QUERIES[q % len(QUERIES)], 5)
+            print(f"{name} search: {(time.perf_counter() - start) * 1000 / args.queries:.2f} ms/query")
+
+
+if __name__ == "__main__":
+    main()
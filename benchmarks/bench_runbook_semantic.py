@@ -0,0 +1,82 @@
+"""
+Semantic runbook search latency over a memory-mapped chunk matrix: one
+matrix-vector product + argpartition top-k per query, vs. BM25 on the same corpus.
+
+    python benchmarks/bench_runbook_semantic.py --chunks 10000 --dim 512
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from incident_triage_mcp.tools.runbook_vectors import CHUNK_WORDS, MappedRunbookVectors, RunbookVectors
+from incident_triage_mcp.tools.runbooks import RunbookIndex
+
+WORDS = (
+    "db timeout 5xx latency pool connection rollback deploy cache redis kafka lag disk cpu memory oom "
+    "payments checkout replica failover dns tls certificate throttling quota queue backlog retry "
+    "saturation exhausted eviction partition leader election consumer producer ingress gateway"
+).split()
+QUERIES = ["connection pool exhausted", "kafka consumer lag", "5xx after deploy rollback", "tls certificate expiry"]
+
+
+def make_documents(chunks: int, chunks_per_doc: int = 5):
+    rng = random.Random(7)
+    for d in range(chunks // chunks_per_doc):
+        sections = [
+            f"## Step {s}\n" + " ".join(rng.choice(WORDS) for _ in range(CHUNK_WORDS - 5))
+            for s in range(chunks_per_doc)
+        ]
+        text = "\n\n".join(sections)
+        yield f"rb-{d}", f"Runbook {d} {rng.choice(WORDS)}", text, text[:220]
+
+
+def timed(fn, queries: int) -> list:
+    samples = []
+    for q in range(queries):
+        start = time.perf_counter()
+        fn(QUERIES[q % len(QUERIES)], 5)
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def report(name: str, samples: list) -> None:
+    samples = sorted(samples)
+    p99 = samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+    print(f"{name:<22} p50 {statistics.median(samples):6.2f} ms   p99 {p99:6.2f} ms")
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--chunks", type=int, default=10000)
+    ap.add_argument("--dim", type=int, default=512)
+    ap.add_argument("--queries", type=int, default=500)
+    args = ap.parse_args()
+
+    docs = list(make_documents(args.chunks))
+    start = time.perf_counter()
+    vectors = RunbookVectors.from_documents(docs, dim=args.dim)
+    print(f"embed {vectors.chunks} chunks x {args.dim}: {(time.perf_counter() - start) * 1000:.0f} ms")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = str(Path(tmp) / "runbooks.npy")
+        vectors.save(path)
+        start = time.perf_counter()
+        mapped = MappedRunbookVectors(path)
+        print(f"load (mmap): {(time.perf_counter() - start) * 1000:.1f} ms, matrix {Path(path).stat().st_size / 2**20:.1f} MiB")
+
+        mapped.search(QUERIES[0], 5)  # fault the pages in once
+        report("semantic (mmap)", timed(mapped.search, args.queries))
+
+    bm25 = RunbookIndex()
+    for doc_id, title, text, summary in docs:
+        bm25.add_document(doc_id, title, text, summary)
+    report("bm25", timed(bm25.search, args.queries))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Per-call latency of evidence reads:
+- before: boto3.client("s3", ...) built on every read (old read_evidence_bundle)
+- after:  one pooled S3ArtifactStore client reused for every read
+
+Without --endpoint-url the S3 API is stubbed (botocore Stubber), so the numbers
+isolate client/session construction cost. With --endpoint-url (e.g. the MinIO from
+docker-compose) they also include real connection setup vs keep-alive reuse.
+
+    python benchmarks/bench_s3_client.py --iterations 200
+    python benchmarks/bench_s3_client.py --endpoint-url http://localhost:9000 --incident-id INC-123
+"""
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import statistics
+import time
+
+import boto3
+from botocore.response import StreamingBody
+from botocore.stub import Stubber
+
+from incident_triage_mcp.adapters.artifacts_s3 import S3ArtifactStore
+
+PAYLOAD = json.dumps({"incident_id": "INC-BENCH", "service": "payments-api"}).encode("utf-8")
+
+
+def _queue_get(stubber: Stubber, bucket: str, key: str) -> None:
+    stubber.add_response(
+        "get_object",
+        {"Body": StreamingBody(io.BytesIO(PAYLOAD), len(PAYLOAD))},
+        {"Bucket": bucket, "Key": key},
+    )
+
+
+def read_fresh_client(args: argparse.Namespace, key: str) -> None:
+    s3 = boto3.client(
+        "s3",
+        endpoint_url=args.endpoint_url,
+        region_name="us-east-1",
+        aws_access_key_id=args.access_key,
+        aws_secret_access_key=args.secret_key,
+    )
+    if not args.endpoint_url:
+        stubber = Stubber(s3)
+        _queue_get(stubber, args.bucket, key)
+        stubber.activate()
+    s3.get_object(Bucket=args.bucket, Key=key)["Body"].read()
+
+
+def read_pooled_client(store: S3ArtifactStore, stubber: Stubber | None, args: argparse.Namespace, key: str) -> None:
+    if stubber is not None:
+        _queue_get(stubber, args.bucket, key)
+    store.client.get_object(Bucket=args.bucket, Key=key)["Body"].read()
+
+
+def _report(name: str, samples: list[float]) -> None:
+    samples = sorted(samples)
+    p50 = statistics.median(samples) * 1000
+    p95 = samples[int(len(samples) * 0.95) - 1] * 1000
+    print(f"{name:<14} p50={p50:8.3f} ms  p95={p95:8.3f} ms  mean={statistics.fmean(samples) * 1000:8.3f} ms")
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--iterations", type=int, default=200)
+    ap.add_argument("--endpoint-url", default=None)
+    ap.add_argument("--bucket", default="triage-artifacts")
+    ap.add_argument("--incident-id", default="INC-BENCH")
+    ap.add_argument("--access-key", default="minioadmin")
+    ap.add_argument("--secret-key", default="minioadmin")
+    args = ap.parse_args()
+
+    key = f"evidence/v1/{args.incident_id}.json"
+    store = S3ArtifactStore(
+        bucket=args.bucket,
+        endpoint_url=args.endpoint_url,
+        aws_access_key_id=args.access_key,
+        aws_secret_access_key=args.secret_key,
+    )
+
+    stubber = None
+    if not args.endpoint_url:
+        stubber = Stubber(store.client)
+        stubber.activate()
+
+    before, after = [], []
+    for _ in range(args.iterations):
+        t0 = time.perf_counter()
+        read_fresh_client(args, key)
+        before.append(time.perf_counter() - t0)
+
+        t0 = time.perf_counter()
+        read_pooled_client(store, stubber, args, key)
+        after.append(time.perf_counter() - t0)
+
+    _report("client/call", before)
+    _report("pooled client", after)
+    print(f"speedup (p50): {statistics.median(before) / statistics.median(after):.1f}x")
+
+
+if __name__ == "__main__":
+    main()
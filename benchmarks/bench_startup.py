@@ -0,0 +1,139 @@
+"""
+Cold-start benchmark for the stdio server, usable as a regression check.
+
+Measures, each over --runs fresh processes:
+- import time of incident_triage_mcp.server (python -X importtime), split into
+  the mcp/pydantic/starlette stack the server cannot avoid and what this
+  package adds on top, with the slowest modules it pulls in
+- the same import with no bytecode cache (an image built without compiled
+  .pyc files, or a read-only site-packages): every module is compiled first
+- spawn -> initialize -> first `ping` tool response over stdio, which is what an
+  agent pays per session
+
+Exits 1 if a module that should load on demand (boto3, botocore, requests,
+numpy) is imported at startup, or if a threshold is exceeded:
+
+    python benchmarks/bench_startup.py --runs 5
+    python benchmarks/bench_startup.py --runs 5 --max-app-import-ms 150 --max-first-ping-ms 2500
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Tuple
+
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.stdio import stdio_client
+
+ON_DEMAND = ("boto3", "botocore", "requests", "numpy")
+BASELINE = "import mcp.server.fastmcp, starlette.responses, anyio, pydantic"
+
+
+def _env(artifact_dir: str) -> Dict[str, str]:
+    env = dict(os.environ)
+    env.setdefault("ARTIFACT_STORE", "fs")
+    env.setdefault("AIRFLOW_ARTIFACT_DIR", artifact_dir)
+    env.setdefault("AUDIT_MODE", "file")
+    env.setdefault("AUDIT_PATH", os.path.join(artifact_dir, "audit.jsonl"))  # stdout would corrupt stdio
+    env["PYTHONWARNINGS"] = "ignore"
+    return env
+
+
+def _importtime(code: str, env: Dict[str, str]) -> Tuple[float, List[Tuple[str, float]]]:
+    """(total ms of the last top-level import, [(module, cumulative ms)])."""
+    out = subprocess.run([sys.executable, "-X", "importtime", "-c", code], env=env, capture_output=True, text=True, check=True)
+    rows = []
+    for line in out.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, _, cumulative_us, name = (p.strip() for p in line.replace("import time:", "|").split("|"))
+        rows.append((name, int(cumulative_us) / 1000))
+    return rows[-1][1], rows
+
+
+def import_profile(env: Dict[str, str], runs: int) -> Dict[str, object]:
+    totals, apps = [], []
+    modules: List[Tuple[str, float]] = []
+    for _ in range(runs):
+        total, rows = _importtime("import incident_triage_mcp.server", env)
+        totals.append(total)
+        # with the mcp stack already loaded, the last top-level import is what the server adds
+        apps.append(_importtime(BASELINE + "; import incident_triage_mcp.server", env)[0])
+        modules = rows
+    loaded = {name for name, _ in modules}
+    heavy = sorted(
+        ((n, ms) for n, ms in modules if "." not in n or n.startswith("incident_triage_mcp")),
+        key=lambda r: -r[1],
+    )[:8]
+    return {
+        "total_ms": statistics.median(totals),
+        "app_ms": statistics.median(apps),
+        "heavy": heavy,
+        "on_demand_loaded": [m for m in ON_DEMAND if m in loaded],
+    }
+
+
+def uncached_import_ms(env: Dict[str, str], runs: int) -> float:
+    times = []
+    for _ in range(runs):
+        with tempfile.TemporaryDirectory() as empty:
+            # an empty cache prefix, never written to: every import compiles from source
+            cold = dict(env, PYTHONPYCACHEPREFIX=empty, PYTHONDONTWRITEBYTECODE="1")
+            times.append(_importtime("import incident_triage_mcp.server", cold)[0])
+    return statistics.median(times)
+
+
+async def _first_ping(env: Dict[str, str]) -> Tuple[float, float]:
+    params = StdioServerParameters(command=sys.executable, args=["-m", "incident_triage_mcp.server"], env=env)
+    start = time.perf_counter()
+    with open(os.devnull, "w") as devnull:
+        async with stdio_client(params, errlog=devnull) as (read, write):
+            async with ClientSession(read, write) as session:
+                await session.initialize()
+                initialized = time.perf_counter() - start
+                result = await session.call_tool("ping", {"message": "startup"})
+                if result.isError:
+                    raise RuntimeError(f"ping failed: {result.content}")
+                return initialized, time.perf_counter() - start
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--runs", type=int, default=5)
+    ap.add_argument("--max-app-import-ms", type=float, default=None, help="fail if the server adds more than this on top of mcp")
+    ap.add_argument("--max-first-ping-ms", type=float, default=None, help="fail if spawn -> first ping takes longer")
+    args = ap.parse_args()
+
+    failures = []
+    with tempfile.TemporaryDirectory() as tmp:
+        env = _env(tmp)
+        prof = import_profile(env, args.runs)
+        print(f"import incident_triage_mcp.server: {prof['total_ms']:7.1f} ms total, {prof['app_ms']:6.1f} ms on top of the mcp stack")
+        for name, ms in prof["heavy"]:
+            print(f"    {ms:7.1f} ms  {name}")
+        print(f"without bytecode cache: {uncached_import_ms(env, max(1, args.runs // 2)):7.1f} ms")
+        if prof["on_demand_loaded"]:
+            failures.append(f"imported at startup: {', '.join(prof['on_demand_loaded'])}")
+
+        pings = [asyncio.run(_first_ping(env)) for _ in range(args.runs)]
+        init_ms = statistics.median(p[0] for p in pings) * 1000
+        ping_ms = statistics.median(p[1] for p in pings) * 1000
+        print(f"spawn -> initialized: {init_ms:7.1f} ms   spawn -> first ping: {ping_ms:7.1f} ms (median of {args.runs})")
+
+    if args.max_app_import_ms is not None and prof["app_ms"] > args.max_app_import_ms:
+        failures.append(f"server import adds {prof['app_ms']:.1f} ms > {args.max_app_import_ms} ms")
+    if args.max_first_ping_ms is not None and ping_ms > args.max_first_ping_ms:
+        failures.append(f"first ping {ping_ms:.1f} ms > {args.max_first_ping_ms} ms")
+    for f in failures:
+        print(f"FAIL: {f}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
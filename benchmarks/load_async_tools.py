@@ -0,0 +1,106 @@
+"""
+Concurrent-throughput load test: blocking vs async Airflow calls inside tools.
+
+FastMCP runs sync tools directly on its event loop, so a blocking requests.post
+stalls every other session. This starts a local fake Airflow that answers after
+--latency-ms, then fires --concurrency tool calls at once:
+
+- blocking: sync AirflowAPI.trigger_dag called from coroutines (old tools)
+- async:    AsyncAirflowAPI.trigger_dag on one shared httpx session (new tools)
+
+It also measures how long a trivial ping-style coroutine waits while the batch
+is in flight.
+
+    python benchmarks/load_async_tools.py --concurrency 50 --latency-ms 100
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from incident_triage_mcp.adapters.airflow_api import AirflowAPI, AsyncAirflowAPI
+
+
+def _start_fake_airflow(latency_s: float) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def setup(self) -> None:
+            super().setup()
+            # headers and body go out in separate writes; avoid Nagle/delayed-ACK stalls on keep-alive
+            self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+        def do_POST(self) -> None:
+            self.rfile.read(int(self.headers.get("Content-Length") or 0))
+            time.sleep(latency_s)
+            body = json.dumps({"dag_run_id": "manual__bench", "state": "queued"}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args) -> None:
+            pass
+
+    class Server(ThreadingHTTPServer):
+        request_queue_size = 1024
+
+    srv = Server(("127.0.0.1", 0), Handler)
+    srv.daemon_threads = True
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    return srv
+
+
+async def _ping_latency(stop: asyncio.Event) -> float:
+    worst = 0.0
+    while not stop.is_set():
+        t0 = time.perf_counter()
+        await asyncio.sleep(0.005)
+        worst = max(worst, time.perf_counter() - t0 - 0.005)
+    return worst
+
+
+async def _run(label: str, call, concurrency: int) -> None:
+    stop = asyncio.Event()
+    pinger = asyncio.create_task(_ping_latency(stop))
+    await asyncio.sleep(0)
+    t0 = time.perf_counter()
+    await asyncio.gather(*(call(i) for i in range(concurrency)))
+    elapsed = time.perf_counter() - t0
+    stop.set()
+    worst_ping = await pinger
+    print(f"{label:<9} {concurrency} calls in {elapsed * 1000:8.1f} ms  "
+          f"throughput={concurrency / elapsed:8.1f} calls/s  worst ping stall={worst_ping * 1000:7.1f} ms")
+
+
+async def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--concurrency", type=int, default=50)
+    ap.add_argument("--latency-ms", type=float, default=100.0)
+    args = ap.parse_args()
+
+    srv = _start_fake_airflow(args.latency_ms / 1000)
+    base_url = f"http://127.0.0.1:{srv.server_address[1]}"
+    sync_api = AirflowAPI(base_url)
+    async_api = AsyncAirflowAPI(base_url, pool_size=args.concurrency)
+
+    async def blocking_tool(i: int) -> dict:
+        return sync_api.trigger_dag("incident_evidence_v1", {"incident_id": f"INC-{i}"})
+
+    async def async_tool(i: int) -> dict:
+        return await async_api.trigger_dag("incident_evidence_v1", {"incident_id": f"INC-{i}"})
+
+    await _run("blocking", blocking_tool, args.concurrency)
+    await _run("async", async_tool, args.concurrency)
+    await async_api.aclose()
+    srv.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,173 @@
+"""
+Throughput of the streamable-http server vs. MCP_WORKERS.
+
+For each worker count, starts `python -m incident_triage_mcp.server` with
+MCP_TRANSPORT=streamable-http on a free port, backed by a generated runbook
+directory large enough that `runbooks_search` is CPU-bound (BM25 scoring in
+Python, serialized by the GIL within one process). Then --concurrency clients
+each open an MCP session and issue tool calls until --requests have completed.
+
+    python benchmarks/load_http_workers.py --workers 1,2,4 --concurrency 32 --requests 2000
+
+Throughput should grow with workers up to the number of cores (the client
+itself runs in this process and needs some CPU too).
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import itertools
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+import httpx
+
+WORDS = (
+    "db timeout 5xx latency pool connection rollback deploy cache redis kafka lag disk cpu memory oom "
+    "payments checkout replica failover dns tls certificate throttling quota queue backlog retry"
+).split()
+QUERIES = ["db timeout pool", "kafka consumer lag", "5xx latency deploy rollback", "tls certificate expiry"]
+HEADERS = {"Accept": "application/json, text/event-stream", "Content-Type": "application/json"}
+
+
+def write_runbooks(root: Path, n: int, words_per_doc: int) -> None:
+    rng = random.Random(7)
+    for i in range(n):
+        body = " ".join(rng.choice(WORDS) for _ in range(words_per_doc))
+        (root / f"rb-{i}.md").write_text(f"# Runbook {i} {rng.choice(WORDS)}\n\n{body}\n", encoding="utf-8")
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_server(workers: int, port: int, tmp: str) -> subprocess.Popen:
+    env = dict(
+        os.environ,
+        MCP_TRANSPORT="streamable-http",
+        MCP_HOST="127.0.0.1",
+        MCP_PORT=str(port),
+        MCP_WORKERS=str(workers),
+        ARTIFACT_STORE="fs",
+        AIRFLOW_ARTIFACT_DIR=tmp,
+        RUNBOOKS_DIR=str(Path(tmp) / "runbooks"),
+        AUDIT_MODE="file",
+        AUDIT_PATH=str(Path(tmp) / f"audit-{workers}.jsonl"),
+        ALERTS_STORE_PATH=str(Path(tmp) / f"alerts-{workers}.db"),
+        METRICS_ENABLED="false",
+        PYTHONWARNINGS="ignore",
+    )
+    return subprocess.Popen(
+        [sys.executable, "-m", "incident_triage_mcp.server"],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+async def wait_ready(url: str, timeout: float = 60.0) -> None:
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient() as client:
+        while time.monotonic() < deadline:
+            try:
+                await client.get(url.replace("/mcp", "/metrics"), timeout=1.0)
+                return
+            except httpx.TransportError:
+                await asyncio.sleep(0.2)
+    raise RuntimeError(f"server at {url} did not come up")
+
+
+async def _rpc(client: httpx.AsyncClient, url: str, headers: Dict[str, str], body: dict) -> httpx.Response:
+    r = await client.post(url, json=body, headers=headers)
+    r.raise_for_status()
+    return r
+
+
+async def client_loop(url: str, remaining: itertools.count, total: int, latencies: List[float], errors: List[str]) -> None:
+    async with httpx.AsyncClient(timeout=60.0) as client:
+        init = {
+            "jsonrpc": "2.0", "id": 0, "method": "initialize",
+            "params": {"protocolVersion": "2025-06-18", "capabilities": {}, "clientInfo": {"name": "load", "version": "0"}},
+        }
+        r = await _rpc(client, url, HEADERS, init)
+        headers = dict(HEADERS)
+        if r.headers.get("mcp-session-id"):  # stateful single worker; stateless workers return none
+            headers["mcp-session-id"] = r.headers["mcp-session-id"]
+            headers["mcp-protocol-version"] = r.json()["result"]["protocolVersion"]
+        await _rpc(client, url, headers, {"jsonrpc": "2.0", "method": "notifications/initialized"})
+        while (n := next(remaining)) < total:
+            body = {
+                "jsonrpc": "2.0", "id": n + 1, "method": "tools/call",
+                "params": {"name": "runbooks_search", "arguments": {"query": QUERIES[n % len(QUERIES)], "limit": 5}},
+            }
+            start = time.perf_counter()
+            try:
+                out = (await _rpc(client, url, headers, body)).json()
+                if "error" in out or out["result"].get("isError"):
+                    errors.append(str(out)[:200])
+            except httpx.HTTPError as e:
+                errors.append(repr(e))
+            latencies.append(time.perf_counter() - start)
+
+
+async def run_load(url: str, concurrency: int, requests: int) -> Dict[str, float]:
+    latencies: List[float] = []
+    errors: List[str] = []
+    remaining = itertools.count()
+    start = time.perf_counter()
+    await asyncio.gather(*(client_loop(url, remaining, requests, latencies, errors) for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    return {
+        "rps": len(latencies) / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1] * 1000,
+        "errors": len(errors),
+    }
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--workers", default="1,2,4")
+    ap.add_argument("--concurrency", type=int, default=32)
+    ap.add_argument("--requests", type=int, default=2000)
+    ap.add_argument("--runbooks", type=int, default=3000)
+    ap.add_argument("--words", type=int, default=300)
+    args = ap.parse_args()
+
+    print(f"cores: {os.cpu_count()}")
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp) / "runbooks"
+        root.mkdir()
+        write_runbooks(root, args.runbooks, args.words)
+        base_rps = None
+        for workers in (int(w) for w in args.workers.split(",")):
+            port = _free_port()
+            url = f"http://127.0.0.1:{port}/mcp"
+            proc = start_server(workers, port, tmp)
+            try:
+                asyncio.run(wait_ready(url))
+                asyncio.run(run_load(url, args.concurrency, min(args.requests, 4 * args.concurrency)))  # warm every worker
+                res = asyncio.run(run_load(url, args.concurrency, args.requests))
+            finally:
+                proc.terminate()
+                proc.wait(timeout=60)
+            base_rps = base_rps or res["rps"]
+            print(
+                f"workers={workers:2d}  {res['rps']:8.1f} calls/s  (x{res['rps'] / base_rps:4.2f})  "
+                f"p50 {res['p50_ms']:7.1f} ms  p95 {res['p95_ms']:7.1f} ms  errors {res['errors']}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,34 +1,203 @@
 from __future__ import annotations
-from typing import Any, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+import asyncio
 import os
-import requests
+import random
+import time
+import uuid
+import httpx
 
-class AirflowAPI:
-    def __init__(self, base_url: str) -> None:
+from incident_triage_mcp.metrics import timed
+
+if TYPE_CHECKING:
+    import requests
+
+# Retried with jittered exponential backoff (Retry-After honoured when present)
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+def _check(r, url: str) -> None:
+    # Helpful error visibility
+    if r.status_code == 401:
+        raise RuntimeError(
+            f"Airflow API 401 UNAUTHORIZED. Check AIRFLOW_USERNAME/AIRFLOW_PASSWORD. "
+            f"URL={url}"
+        )
+    r.raise_for_status()
+
+
+class _AirflowBase:
+    def __init__(
+        self,
+        base_url: str,
+        timeout: float = 15.0,
+        pool_size: int = 10,
+        max_retries: int = 3,
+        backoff_seconds: float = 0.5,
+        max_backoff_seconds: float = 8.0,
+    ) -> None:
         self.base_url = base_url.rstrip("/")
         self.username = os.getenv("AIRFLOW_USERNAME", "admin")
         self.password = os.getenv("AIRFLOW_PASSWORD", "admin")
         self.auth = (self.username, self.password)
+        self.timeout = timeout
+        self.pool_size = pool_size
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self.max_backoff_seconds = max_backoff_seconds
 
-    def trigger_dag(self, dag_id: str, conf: Dict[str, Any]) -> Dict[str, Any]:
-        url = f"{self.base_url}/api/v1/dags/{dag_id}/dagRuns"
-        r = requests.post(url, json={"conf": conf}, auth=self.auth, timeout=15)
-        # Helpful error visibility
-        if r.status_code == 401:
-            raise RuntimeError(
-                f"Airflow API 401 UNAUTHORIZED. Check AIRFLOW_USERNAME/AIRFLOW_PASSWORD. "
-                f"URL={url}"
-            )
-        r.raise_for_status()
+    def _runs_url(self, dag_id: str) -> str:
+        return f"{self.base_url}/api/v1/dags/{dag_id}/dagRuns"
+
+    @staticmethod
+    def _trigger_body(conf: Dict[str, Any], dag_run_id: Optional[str]) -> Dict[str, Any]:
+        # A client-chosen dag_run_id makes retried POSTs idempotent: a retry after an
+        # ambiguous failure gets 409 Conflict instead of starting a second run.
+        return {"conf": conf, "dag_run_id": dag_run_id or f"mcp__{uuid.uuid4().hex}"}
+
+    def _delay(self, attempt: int, response=None) -> float:
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        if retry_after and retry_after.isdigit():
+            return min(float(retry_after), self.max_backoff_seconds)
+        # full jitter: spreads retries from many callers during an incident storm
+        return random.uniform(0, min(self.max_backoff_seconds, self.backoff_seconds * (2 ** attempt)))
+
+
+class AirflowAPI(_AirflowBase):
+    """
+    Blocking Airflow REST client.
+    One pooled requests.Session (keep-alive, AIRFLOW_POOL_SIZE connections) per
+    instance; 429/5xx and connection errors are retried with jittered backoff.
+    """
+
+    def __init__(self, base_url: str, **kwargs: Any) -> None:
+        # imported here: the server only uses AsyncAirflowAPI, and requests is ~50 ms of import
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        super().__init__(base_url, **kwargs)
+        self._retry_errors = (requests.ConnectionError, requests.Timeout)
+        self._session = requests.Session()
+        self._session.auth = self.auth
+        adapter = HTTPAdapter(pool_connections=self.pool_size, pool_maxsize=self.pool_size)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+    def _request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        attempt = 0
+        while True:
+            try:
+                r = self._session.request(method, url, timeout=self.timeout, **kwargs)
+            except self._retry_errors:
+                if attempt >= self.max_retries:
+                    raise
+                r = None
+            if r is not None and (r.status_code not in RETRY_STATUSES or attempt >= self.max_retries):
+                return r
+            time.sleep(self._delay(attempt, r))
+            attempt += 1
+
+    @timed("airflow.trigger_dag")
+    def trigger_dag(self, dag_id: str, conf: Dict[str, Any], dag_run_id: Optional[str] = None) -> Dict[str, Any]:
+        url = self._runs_url(dag_id)
+        body = self._trigger_body(conf, dag_run_id)
+        r = self._request("POST", url, json=body)
+        if r.status_code == 409 and dag_run_id is None:
+            # our own earlier attempt went through; return that run
+            return self.get_dag_run(dag_id, body["dag_run_id"])
+        _check(r, url)
         return r.json()
 
+    def trigger_dags(self, dag_id: str, confs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Fan out one run per conf over the pooled session; per-conf errors don't fail the batch."""
+        def _one(conf: Dict[str, Any]) -> Dict[str, Any]:
+            try:
+                return {"ok": True, "conf": conf, "dag_run": self.trigger_dag(dag_id, conf)}
+            except Exception as e:
+                return {"ok": False, "conf": conf, "error": str(e)}
+
+        if not confs:
+            return []
+        with ThreadPoolExecutor(max_workers=min(self.pool_size, len(confs))) as pool:
+            return list(pool.map(_one, confs))
+
+    @timed("airflow.get_dag_run")
     def get_dag_run(self, dag_id: str, dag_run_id: str) -> Dict[str, Any]:
-        url = f"{self.base_url}/api/v1/dags/{dag_id}/dagRuns/{dag_run_id}"
-        r = requests.get(url, auth=self.auth, timeout=15)
-        if r.status_code == 401:
-            raise RuntimeError(
-                f"Airflow API 401 UNAUTHORIZED. Check AIRFLOW_USERNAME/AIRFLOW_PASSWORD. "
-                f"URL={url}"
+        url = f"{self._runs_url(dag_id)}/{dag_run_id}"
+        r = self._request("GET", url)
+        _check(r, url)
+        return r.json()
+
+    def close(self) -> None:
+        self._session.close()
+
+
+class AsyncAirflowAPI(_AirflowBase):
+    """
+    Non-blocking Airflow REST client for async tools.
+    One shared httpx.AsyncClient (keep-alive pool) per instance, created on first use
+    so it binds to the server's event loop rather than the importing thread.
+    Same retry policy as AirflowAPI.
+    """
+
+    def __init__(self, base_url: str, **kwargs: Any) -> None:
+        super().__init__(base_url, **kwargs)
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def _http(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                auth=self.auth,
+                timeout=self.timeout,
+                limits=httpx.Limits(max_connections=self.pool_size, max_keepalive_connections=self.pool_size),
             )
-        r.raise_for_status()
-        return r.json()
\ No newline at end of file
+        return self._client
+
+    async def _request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        attempt = 0
+        while True:
+            try:
+                r = await self._http().request(method, url, **kwargs)
+            except httpx.TransportError:
+                if attempt >= self.max_retries:
+                    raise
+                r = None
+            if r is not None and (r.status_code not in RETRY_STATUSES or attempt >= self.max_retries):
+                return r
+            await asyncio.sleep(self._delay(attempt, r))
+            attempt += 1
+
+    @timed("airflow.trigger_dag")
+    async def trigger_dag(self, dag_id: str, conf: Dict[str, Any], dag_run_id: Optional[str] = None) -> Dict[str, Any]:
+        url = self._runs_url(dag_id)
+        body = self._trigger_body(conf, dag_run_id)
+        r = await self._request("POST", url, json=body)
+        if r.status_code == 409 and dag_run_id is None:
+            return await self.get_dag_run(dag_id, body["dag_run_id"])
+        _check(r, url)
+        return r.json()
+
+    async def trigger_dags(self, dag_id: str, confs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        sem = asyncio.Semaphore(self.pool_size)
+
+        async def _one(conf: Dict[str, Any]) -> Dict[str, Any]:
+            async with sem:
+                try:
+                    return {"ok": True, "conf": conf, "dag_run": await self.trigger_dag(dag_id, conf)}
+                except Exception as e:
+                    return {"ok": False, "conf": conf, "error": str(e)}
+
+        return list(await asyncio.gather(*(_one(c) for c in confs)))
+
+    @timed("airflow.get_dag_run")
+    async def get_dag_run(self, dag_id: str, dag_run_id: str) -> Dict[str, Any]:
+        url = f"{self._runs_url(dag_id)}/{dag_run_id}"
+        r = await self._request("GET", url)
+        _check(r, url)
+        return r.json()
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
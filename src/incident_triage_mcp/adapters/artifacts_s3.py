@@ -1,25 +1,205 @@
 from __future__ import annotations
-import os
 import json
-import boto3
-from typing import Any, Dict
+import os
+import threading
+from typing import Any, Dict, Optional
+
+from incident_triage_mcp.config import AppConfig
+from incident_triage_mcp.metrics import observe_bytes, timed
+from incident_triage_mcp.evidence_format import (
+    FORMATS,
+    META_ENCODING,
+    META_LENGTH,
+    META_SHA256,
+    decompress,
+    open_decoded,
+    s3_key,
+)
+
+
+class S3ArtifactStore:
+    """
+    Long-lived S3/MinIO artifact client.
+    - one boto3 client per process (clients are thread-safe once built)
+    - pooled keep-alive connections sized by S3_MAX_POOL_CONNECTIONS
+    - botocore retries with backoff (S3_MAX_ATTEMPTS / S3_RETRY_MODE)
+    The client is built lazily on first use, then reused for every read.
+    Evidence is looked up under evidence_format's key first (evidence/v1 or the
+    compressed evidence/v2), then the other one.
+    """
+
+    def __init__(
+        self,
+        bucket: str,
+        endpoint_url: Optional[str] = None,
+        region: str = "us-east-1",
+        aws_access_key_id: Optional[str] = None,
+        aws_secret_access_key: Optional[str] = None,
+        max_pool_connections: int = 20,
+        max_attempts: int = 3,
+        retry_mode: str = "standard",
+        connect_timeout: float = 5.0,
+        read_timeout: float = 30.0,
+        evidence_format: str = "v1",
+    ) -> None:
+        self.bucket = bucket
+        self.endpoint_url = endpoint_url
+        self.region = region
+        self._aws_access_key_id = aws_access_key_id
+        self._aws_secret_access_key = aws_secret_access_key
+        self._botocore_config = dict(
+            max_pool_connections=max_pool_connections,
+            retries={"max_attempts": max_attempts, "mode": retry_mode},
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            tcp_keepalive=True,
+        )
+        self.evidence_formats = (evidence_format,) + tuple(f for f in FORMATS if f != evidence_format)
+        self._client = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, cfg: AppConfig) -> "S3ArtifactStore":
+        return cls(
+            bucket=cfg.s3_bucket or "triage-artifacts",
+            endpoint_url=cfg.s3_endpoint_url,
+            region=cfg.s3_region,
+            aws_access_key_id=cfg.aws_access_key_id,
+            aws_secret_access_key=cfg.aws_secret_access_key,
+            max_pool_connections=cfg.s3_max_pool_connections,
+            max_attempts=cfg.s3_max_attempts,
+            retry_mode=cfg.s3_retry_mode,
+            connect_timeout=cfg.s3_connect_timeout,
+            read_timeout=cfg.s3_read_timeout,
+            evidence_format=cfg.evidence_format,
+        )
+
+    @classmethod
+    def from_env(cls) -> "S3ArtifactStore":
+        return cls(
+            bucket=os.getenv("S3_BUCKET", "triage-artifacts"),
+            endpoint_url=os.getenv("S3_ENDPOINT_URL"),
+            region=os.getenv("S3_REGION", "us-east-1"),
+            aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
+            aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY"),
+            max_pool_connections=int(os.getenv("S3_MAX_POOL_CONNECTIONS", "20")),
+            max_attempts=int(os.getenv("S3_MAX_ATTEMPTS", "3")),
+            retry_mode=os.getenv("S3_RETRY_MODE", "standard"),
+            evidence_format=os.getenv("EVIDENCE_FORMAT", "v1").lower(),
+        )
+
+    @property
+    def client(self):
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    # imported here: boto3 + botocore are ~100 ms of import, paid only once S3 is used
+                    import boto3
+                    from botocore.config import Config
+
+                    # Own session: boto3's default session is not safe to share across threads.
+                    self._client = boto3.session.Session().client(
+                        "s3",
+                        endpoint_url=self.endpoint_url,
+                        region_name=self.region,
+                        aws_access_key_id=self._aws_access_key_id,
+                        aws_secret_access_key=self._aws_secret_access_key,
+                        config=Config(**self._botocore_config),
+                    )
+        return self._client
+
+    def evidence_key(self, incident_id: str) -> str:
+        return s3_key(incident_id, self.evidence_formats[0])
+
+    @timed("s3.read_evidence_bundle")
+    def read_evidence_bundle(
+        self,
+        incident_id: str,
+        if_none_match: Optional[str] = None,
+        stream_over: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        GET the bundle. With if_none_match (a previously seen ETag) this is a
+        conditional GET: an unchanged object returns {"not_modified": True}
+        without transferring the body. v2 objects are decompressed per their
+        metadata. Bundles larger than stream_over bytes (uncompressed) are
+        returned unread as a {"stream"} (caller closes it).
+        """
+        s3 = self.client
+        for fmt in self.evidence_formats:
+            key = s3_key(incident_id, fmt)
+            uri = f"s3://{self.bucket}/{key}"
+            params: Dict[str, Any] = {"Bucket": self.bucket, "Key": key}
+            if if_none_match:
+                params["IfNoneMatch"] = if_none_match
+            try:
+                obj = s3.get_object(**params)
+                break
+            except s3.exceptions.NoSuchKey:
+                continue
+            except s3.exceptions.ClientError as e:
+                if e.response.get("ResponseMetadata", {}).get("HTTPStatusCode") == 304:
+                    return {"found": True, "uri": uri, "not_modified": True, "etag": if_none_match}
+                raise
+        else:
+            return {"found": False, "uri": f"s3://{self.bucket}/{self.evidence_key(incident_id)}"}
+
+        meta = obj.get("Metadata") or {}
+        encoding = meta.get(META_ENCODING) or obj.get("ContentEncoding") or "identity"
+        size = int(meta.get(META_LENGTH) or obj.get("ContentLength", 0))
+        if stream_over is not None and size > stream_over:
+            return {"found": True, "uri": uri, "etag": obj.get("ETag"), "stream": open_decoded(obj["Body"], encoding)}
+        # raw bytes: callers validate straight from JSON (EvidenceBundle.model_validate_json)
+        body = obj["Body"].read()
+        observe_bytes("s3.read_evidence_bundle", len(body))
+        raw = decompress(body, encoding)
+        return {"found": True, "uri": uri, "etag": obj.get("ETag"), "raw": raw}
+
+    @timed("s3.head_evidence_bundle")
+    def head_evidence_bundle(self, incident_id: str) -> Dict[str, Any]:
+        """Existence/ETag (and bundle-sha256 metadata) check without transferring the body."""
+        for fmt in self.evidence_formats:
+            key = s3_key(incident_id, fmt)
+            uri = f"s3://{self.bucket}/{key}"
+            try:
+                obj = self.client.head_object(Bucket=self.bucket, Key=key)
+            except self.client.exceptions.ClientError as e:
+                if e.response.get("ResponseMetadata", {}).get("HTTPStatusCode") == 404:
+                    continue
+                raise
+            sha256 = (obj.get("Metadata") or {}).get(META_SHA256)
+            return {"found": True, "uri": uri, "etag": obj.get("ETag"), "sha256": sha256}
+        return {"found": False, "uri": f"s3://{self.bucket}/{self.evidence_key(incident_id)}"}
+
+    @timed("s3.read_summary")
+    def read_summary(self, incident_id: str) -> Optional[Dict[str, Any]]:
+        """Triage summary materialized by the DAG (summaries/v1/<id>.json), None if absent."""
+        try:
+            obj = self.client.get_object(Bucket=self.bucket, Key=f"summaries/v1/{incident_id}.json")
+        except self.client.exceptions.NoSuchKey:
+            return None
+        return json.loads(obj["Body"].read())
+
+    @timed("s3.write_profile")
+    def write_profile(self, correlation_id: str, folded: str) -> str:
+        """Collapsed-stack profile of one tool call (profiles/<correlation_id>.folded); returns its URI."""
+        key = f"profiles/{correlation_id}.folded"
+        self.client.put_object(Bucket=self.bucket, Key=key, Body=folded.encode("utf-8"), ContentType="text/plain")
+        return f"s3://{self.bucket}/{key}"
+
+
+_default_store: Optional[S3ArtifactStore] = None
+_default_lock = threading.Lock()
+
+
+def get_default_store() -> S3ArtifactStore:
+    global _default_store
+    if _default_store is None:
+        with _default_lock:
+            if _default_store is None:
+                _default_store = S3ArtifactStore.from_env()
+    return _default_store
+
 
 def read_evidence_bundle(incident_id: str) -> Dict[str, Any]:
-    bucket = os.getenv("S3_BUCKET", "triage-artifacts")
-    key = f"evidence/v1/{incident_id}.json"
-
-    s3 = boto3.client(
-        "s3",
-        endpoint_url=os.getenv("S3_ENDPOINT_URL"),
-        region_name=os.getenv("S3_REGION", "us-east-1"),
-        aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
-        aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY"),
-    )
-
-    try:
-        obj = s3.get_object(Bucket=bucket, Key=key)
-    except s3.exceptions.NoSuchKey:
-        return {"found": False, "uri": f"s3://{bucket}/{key}"}
-
-    raw = obj["Body"].read().decode("utf-8")
-    return {"found": True, "uri": f"s3://{bucket}/{key}", "raw": json.loads(raw)}
\ No newline at end of file
+    return get_default_store().read_evidence_bundle(incident_id)
@@ -4,6 +4,11 @@ from typing import Protocol, Any
 class AlertsProvider(Protocol):
     def fetch_active_alerts(self, services: list[str], since_minutes: int, max_alerts: int) -> list[dict[str, Any]]: ...
 
+class IncrementalAlertsProvider(AlertsProvider, Protocol):
+    # alerts created/updated/resolved after `cursor` (None = everything still retained), oldest
+    # change first, at most `limit`: {"alerts": [...], "cursor": str, "has_more": bool}
+    def fetch_alerts_since(self, cursor: str | None, limit: int) -> dict[str, Any]: ...
+
 class TicketingProvider(Protocol):
     def create_ticket(self, title: str, body: str, severity: str) -> dict[str, Any]: ...
 
@@ -1,7 +1,10 @@
 from __future__ import annotations
 from datetime import datetime, timedelta, timezone
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+import bisect
 import random
+import threading
+import time
 
 
 class DatadogMock:
@@ -33,3 +36,146 @@ class DatadogMock:
             },
             "top_endpoints": [{"route": "POST /checkout", "error_rate": 0.22, "latency_p95_ms": 1200}],
         }
+
+
+class DatadogFeedMock(DatadogMock):
+    """
+    High-volume, stateful stand-in for a Datadog-style alert feed (offline load tests).
+
+    Alerts are generated at rate_per_minute against wall-clock time (or explicitly
+    with advance()): most events open a new alert, the rest re-fire (new value) or
+    resolve an open one. Every change gets a feed sequence number, so
+    fetch_alerts_since() is a bisect into the change log: O(delta) like a real
+    cursor API. fetch_active_alerts() scans the whole window, as the old API did.
+    health_snapshot() is DatadogMock's.
+    """
+
+    NAMES = (
+        ("5xx rate high", "http.server.errors", 0.05),
+        ("p95 latency high", "http.server.latency.p95", 800.0),
+        ("db connections saturated", "db.pool.in_use", 0.9),
+        ("consumer lag", "kafka.consumer.lag", 10000.0),
+    )
+
+    def __init__(
+        self,
+        rate_per_minute: float = 600.0,
+        services: Optional[List[str]] = None,
+        retention_minutes: int = 120,
+        max_open: int = 5000,
+        seed: int = 0,
+    ) -> None:
+        self.rate_per_minute = rate_per_minute
+        self.max_open = max_open
+        self.services = services or [f"svc-{i}" for i in range(20)] + ["payments-api"]
+        self.retention = timedelta(minutes=retention_minutes)
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._alerts: Dict[str, Dict[str, Any]] = {}
+        self._open: List[str] = []
+        self._log_seq: List[int] = []
+        self._log_ids: List[str] = []
+        self._seq = 0
+        self._next_id = 0
+        self._clock = time.monotonic()
+        self.upstream_alerts_served = 0
+
+    def advance(self, events: int, now: Optional[datetime] = None) -> None:
+        now = now or datetime.now(timezone.utc)
+        with self._lock:
+            for _ in range(events):
+                roll = self._rng.random()
+                # past max_open the feed only re-fires/resolves, so the open set reaches a steady state
+                if not self._open or (roll < 0.6 and len(self._open) < self.max_open):
+                    self._open_alert(now)
+                elif roll < 0.9:
+                    self._change(self._open[self._rng.randrange(len(self._open))], now, resolve=False)
+                else:
+                    i = self._rng.randrange(len(self._open))
+                    self._open[i], self._open[-1] = self._open[-1], self._open[i]
+                    self._change(self._open.pop(), now, resolve=True)
+            self._expire(now)
+
+    def _open_alert(self, now: datetime) -> None:
+        name, metric, threshold = self.NAMES[self._rng.randrange(len(self.NAMES))]
+        alert_id = f"dd_{self._next_id}"
+        self._next_id += 1
+        self._alerts[alert_id] = {
+            "alert_id": alert_id,
+            "provider": "datadog",
+            "service": self.services[self._rng.randrange(len(self.services))],
+            "name": name,
+            "status": "triggered",
+            "started_at": now.isoformat(),
+            "updated_at": now.isoformat(),
+            "priority": self._rng.choice(("P1", "P2", "P2", "P3")),
+            "signal": {"metric": metric, "value": round(threshold * (1 + self._rng.random()), 3), "threshold": threshold},
+        }
+        self._open.append(alert_id)
+        self._log(alert_id)
+
+    def _change(self, alert_id: str, now: datetime, resolve: bool) -> None:
+        alert = dict(self._alerts[alert_id])
+        signal = dict(alert["signal"])
+        signal["value"] = round(signal["threshold"] * (0.5 if resolve else 1 + self._rng.random()), 3)
+        alert.update(signal=signal, updated_at=now.isoformat(), status="resolved" if resolve else alert["status"])
+        self._alerts[alert_id] = alert
+        self._log(alert_id)
+
+    def _log(self, alert_id: str) -> None:
+        self._seq += 1
+        self._log_seq.append(self._seq)
+        self._log_ids.append(alert_id)
+
+    def _expire(self, now: datetime) -> None:
+        # drop change-log entries (and alerts) past retention from the front; both lists are in time order
+        cutoff = (now - self.retention).isoformat()
+        drop = 0
+        while drop < len(self._log_ids):
+            alert = self._alerts.get(self._log_ids[drop])
+            if alert is not None and alert["updated_at"] >= cutoff:
+                break
+            drop += 1
+        if drop:
+            for alert_id in self._log_ids[:drop]:
+                alert = self._alerts.get(alert_id)
+                if alert is not None and alert["updated_at"] < cutoff and alert["status"] == "resolved":
+                    del self._alerts[alert_id]
+            del self._log_seq[:drop]
+            del self._log_ids[:drop]
+
+    def _tick(self) -> None:
+        now = time.monotonic()
+        events = int((now - self._clock) / 60.0 * self.rate_per_minute)
+        if events:
+            self._clock = now
+            self.advance(events)
+
+    def fetch_active_alerts(self, services: List[str], since_minutes: int, max_alerts: int) -> List[Dict[str, Any]]:
+        self._tick()
+        since = (datetime.now(timezone.utc) - timedelta(minutes=since_minutes)).isoformat()
+        wanted = set(services or [])
+        with self._lock:
+            out = [
+                dict(a) for a in self._alerts.values()
+                if a["status"] != "resolved" and a["started_at"] >= since and (not wanted or a["service"] in wanted)
+            ]
+        out.sort(key=lambda a: a["started_at"], reverse=True)
+        self.upstream_alerts_served += len(out)
+        return out[:max_alerts]
+
+    def fetch_alerts_since(self, cursor: Optional[str], limit: int = 1000) -> Dict[str, Any]:
+        self._tick()
+        after = int(cursor) if cursor else 0
+        with self._lock:
+            start = bisect.bisect_right(self._log_seq, after)
+            end = min(len(self._log_seq), start + limit)
+            seen: Dict[str, Dict[str, Any]] = {}
+            for alert_id in self._log_ids[start:end]:
+                alert = self._alerts.get(alert_id)
+                if alert is not None:
+                    seen[alert_id] = dict(alert)  # several changes in one page: latest state once
+            next_cursor = str(self._log_seq[end - 1] if end > start else max(after, self._seq))
+            has_more = end < len(self._log_seq)
+        self.upstream_alerts_served += len(seen)
+        return {"alerts": list(seen.values()), "cursor": next_cursor, "has_more": has_more}
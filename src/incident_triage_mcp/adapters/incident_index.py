@@ -0,0 +1,348 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sqlite3
+import threading
+import time
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from incident_triage_mcp.evidence_format import incident_id_from_name
+
+# changes(day, modified_after) -> [(modified_ts, record)] for index/v1/dt=<day>/ entries
+IndexSource = Callable[[date, float], Iterable[Tuple[float, Dict[str, Any]]]]
+
+PRIORITIES = ("P1", "P2", "P3", "P4")
+# S3 LastModified has 1s resolution: re-read entries this close to the watermark (upserts are idempotent)
+_WATERMARK_SLACK = 5.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS incidents (
+    incident_id TEXT PRIMARY KEY,
+    service TEXT NOT NULL,
+    priority TEXT NOT NULL,
+    status TEXT NOT NULL,
+    start_ts REAL NOT NULL,
+    end_ts REAL NOT NULL,
+    generated_at_iso TEXT NOT NULL,
+    alerts_count INTEGER NOT NULL DEFAULT 0,
+    uri TEXT
+);
+CREATE INDEX IF NOT EXISTS incidents_service_end ON incidents (service, end_ts);
+CREATE INDEX IF NOT EXISTS incidents_end ON incidents (end_ts);
+CREATE TABLE IF NOT EXISTS sync_state (id INTEGER PRIMARY KEY CHECK (id = 1), watermark REAL NOT NULL);
+"""
+
+
+def index_record(bundle: Dict[str, Any], uri: str) -> Dict[str, Any]:
+    """Small per-incident row for the incident index (written by the DAG next to each final bundle)."""
+    alerts = bundle.get("alerts") or []
+    order = {p: i for i, p in enumerate(PRIORITIES)}
+    priority = min((a.get("priority", "P2") for a in alerts), key=lambda p: order.get(p, 99), default="P3")
+    statuses = {a.get("status", "triggered") for a in alerts}
+    status = next((s for s in ("triggered", "warning", "resolved") if s in statuses), "unknown")
+    return {
+        "incident_id": bundle["incident_id"],
+        "service": bundle["service"],
+        "priority": priority,
+        "status": status,
+        "start_iso": bundle["time_window"]["start_iso"],
+        "end_iso": bundle["time_window"]["end_iso"],
+        "generated_at_iso": bundle["generated_at_iso"],
+        "alerts_count": len(alerts),
+        "uri": uri,
+    }
+
+
+def index_key(record: Dict[str, Any]) -> str:
+    # one prefix per UTC day the record was generated (~written), so a run for an old
+    # incident window still lands in a prefix sync() lists; see IncidentIndex.sync
+    return f"index/v1/dt={record['generated_at_iso'][:10]}/{record['incident_id']}.json"
+
+
+def _ts(iso: str) -> float:
+    return datetime.fromisoformat(iso.replace("Z", "+00:00")).timestamp()
+
+
+def _iso(ts: float) -> str:
+    return datetime.fromtimestamp(ts, timezone.utc).isoformat()
+
+
+def parse_since(since: Optional[str], default_hours: float = 24.0) -> float:
+    """ISO-8601 timestamp or a relative window like "30m", "6h", "7d" -> epoch seconds."""
+    now = time.time()
+    if not since:
+        return now - default_hours * 3600
+    units = {"m": 60, "h": 3600, "d": 86400}
+    if since[-1:] in units and since[:-1].replace(".", "", 1).isdigit():
+        return now - float(since[:-1]) * units[since[-1]]
+    return _ts(since)
+
+
+def s3_index_source(store) -> IndexSource:
+    """Lists one index/v1/dt=<day>/ prefix per call; only entries newer than the watermark are fetched."""
+    def changes(day: date, modified_after: float) -> Iterable[Tuple[float, Dict[str, Any]]]:
+        s3 = store.client
+        paginator = s3.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=store.bucket, Prefix=f"index/v1/dt={day.isoformat()}/"):
+            for obj in page.get("Contents", []):
+                modified = obj["LastModified"].timestamp()
+                if modified <= modified_after:
+                    continue
+                body = s3.get_object(Bucket=store.bucket, Key=obj["Key"])["Body"].read()
+                yield modified, json.loads(body)
+    return changes
+
+
+def fs_index_source(artifact_dir: str) -> IndexSource:
+    """Scans one <dir>/index/v1/dt=<day>/ directory per call (a stat per entry, reads only new ones)."""
+    def changes(day: date, modified_after: float) -> Iterable[Tuple[float, Dict[str, Any]]]:
+        day_dir = Path(artifact_dir) / "index" / "v1" / f"dt={day.isoformat()}"
+        try:
+            entries = list(os.scandir(day_dir))
+        except FileNotFoundError:
+            return
+        for entry in entries:
+            if not entry.name.endswith(".json"):
+                continue
+            modified = entry.stat().st_mtime
+            if modified <= modified_after:
+                continue
+            try:
+                with open(entry.path, "rb") as f:
+                    yield modified, json.loads(f.read())
+            except (FileNotFoundError, ValueError):
+                continue  # replaced or half-written; picked up on the next sync
+    return changes
+
+
+class IncidentIndex:
+    """
+    Secondary index of incidents (service, priority, status, time window) in SQLite.
+    - fed by the DAG's per-incident index records (index/v1/dt=<day>/<id>.json)
+    - sync() is incremental: it lists only the day prefixes since the last
+      watermark and upserts entries modified after it
+    - webhook pings carry the record itself, so upsert() makes it visible at once
+    Queries never touch the artifact store.
+    """
+
+    def __init__(
+        self,
+        source: IndexSource,
+        db_path: str = ":memory:",
+        backfill_days: int = 30,
+        sync_seconds: float = 30.0,
+    ) -> None:
+        self._source = source
+        self.db_path = db_path
+        self.backfill_days = backfill_days
+        self.sync_seconds = sync_seconds
+        if db_path != ":memory:":
+            Path(db_path).expanduser().parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(db_path, check_same_thread=False)
+        self._db.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+        self._last_sync = 0.0
+
+    # -- writes ----------------------------------------------------------------
+
+    def upsert(self, record: Dict[str, Any]) -> None:
+        row = (
+            record["incident_id"],
+            record["service"],
+            record.get("priority", "P3"),
+            record.get("status", "unknown"),
+            _ts(record["start_iso"]),
+            _ts(record["end_iso"]),
+            record["generated_at_iso"],
+            int(record.get("alerts_count", 0)),
+            record.get("uri"),
+        )
+        with self._lock, self._db:
+            # re-runs of the same incident: keep the newest bundle's row
+            self._db.execute(
+                """
+                INSERT INTO incidents VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(incident_id) DO UPDATE SET
+                    service=excluded.service, priority=excluded.priority, status=excluded.status,
+                    start_ts=excluded.start_ts, end_ts=excluded.end_ts,
+                    generated_at_iso=excluded.generated_at_iso,
+                    alerts_count=excluded.alerts_count, uri=excluded.uri
+                WHERE excluded.generated_at_iso >= incidents.generated_at_iso
+                """,
+                row,
+            )
+
+    def sync(self, force: bool = False) -> Dict[str, Any]:
+        """Pull index records written since the last sync (at most every sync_seconds)."""
+        now = time.time()
+        if not force and now - self._last_sync < self.sync_seconds:
+            return {"synced": False}
+        if not self._sync_lock.acquire(blocking=False):
+            return {"synced": False}  # another caller is already syncing
+        try:
+            with self._lock:
+                row = self._db.execute("SELECT watermark FROM sync_state WHERE id = 1").fetchone()
+            watermark = row[0] if row else 0.0
+            today = datetime.now(timezone.utc).date()
+            # a record generated just before midnight can be written after another one moved
+            # the watermark past it: re-list the day before the watermark day as well
+            first = (
+                datetime.fromtimestamp(watermark, timezone.utc).date() - timedelta(days=1)
+                if watermark
+                else today - timedelta(days=self.backfill_days)
+            )
+            upserted = 0
+            newest = watermark
+            day = first
+            while day <= today:
+                for modified, record in self._source(day, max(0.0, watermark - _WATERMARK_SLACK)):
+                    self.upsert(record)
+                    upserted += 1
+                    newest = max(newest, modified)
+                day += timedelta(days=1)
+            with self._lock, self._db:
+                self._db.execute(
+                    "INSERT INTO sync_state (id, watermark) VALUES (1, ?) "
+                    "ON CONFLICT(id) DO UPDATE SET watermark = excluded.watermark",
+                    (newest,),
+                )
+            self._last_sync = now
+            return {"synced": True, "upserted": upserted, "watermark": newest}
+        finally:
+            self._sync_lock.release()
+
+    def mark_stale(self) -> None:
+        """Make the next sync() run regardless of sync_seconds (e.g. on an S3 event for index/)."""
+        self._last_sync = 0.0
+
+    # -- reads -----------------------------------------------------------------
+
+    def list(
+        self,
+        service: Optional[str] = None,
+        since_ts: Optional[float] = None,
+        priority: Optional[str] = None,
+        status: Optional[str] = None,
+        limit: int = 50,
+    ) -> List[Dict[str, Any]]:
+        where, args = [], []
+        if service:
+            where.append("service = ?")
+            args.append(service)
+        if since_ts is not None:
+            where.append("end_ts >= ?")
+            args.append(since_ts)
+        if priority:
+            # "P2" means P2 or more urgent
+            allowed = PRIORITIES[: PRIORITIES.index(priority) + 1] if priority in PRIORITIES else (priority,)
+            where.append(f"priority IN ({','.join('?' * len(allowed))})")
+            args.extend(allowed)
+        if status:
+            where.append("status = ?")
+            args.append(status)
+        sql = "SELECT * FROM incidents"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY end_ts DESC LIMIT ?"
+        args.append(limit)
+        with self._lock:
+            cur = self._db.execute(sql, args)
+            cols = [c[0] for c in cur.description]
+            rows = cur.fetchall()
+        out = []
+        for r in rows:
+            rec = dict(zip(cols, r))
+            rec["start_iso"] = _iso(rec.pop("start_ts"))
+            rec["end_iso"] = _iso(rec.pop("end_ts"))
+            out.append(rec)
+        return out
+
+    def count(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM incidents").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
+# -- one-off backfill ------------------------------------------------------------
+# Bundles written before the DAG produced index records have none, so incidents_list
+# cannot see them. incident-triage-index-backfill writes the missing records into the
+# artifact store once; every server then picks them up on its next sync().
+
+
+def _backfill_fs(artifact_dir: str, force: bool) -> Tuple[int, int]:
+    from incident_triage_mcp.tools.evidence import read_bundle
+
+    indexed = {p.stem for p in (Path(artifact_dir) / "index" / "v1").glob("dt=*/*.json")}
+    bundles = {incident_id_from_name(e.name) for e in os.scandir(artifact_dir) if e.is_file()} - {None}
+    written = skipped = 0
+    for incident_id in sorted(bundles):
+        if incident_id in indexed and not force:
+            skipped += 1
+            continue
+        out = read_bundle(artifact_dir, incident_id)  # the same lookup order the server reads with
+        record = index_record(json.loads(out["raw"]), out["path"])
+        target = Path(artifact_dir) / index_key(record)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_name(f".{target.name}.tmp")
+        tmp.write_text(json.dumps(record), encoding="utf-8")
+        os.replace(tmp, target)
+        written += 1
+    return written, skipped
+
+
+def _backfill_s3(store, force: bool) -> Tuple[int, int]:
+    s3 = store.client
+    paginator = s3.get_paginator("list_objects_v2")
+
+    def keys(prefix: str) -> Iterator[str]:
+        for page in paginator.paginate(Bucket=store.bucket, Prefix=prefix):
+            for obj in page.get("Contents", []):
+                yield obj["Key"]
+
+    indexed = {Path(k).name[: -len(".json")] for k in keys("index/v1/") if k.endswith(".json")}
+    bundles = {incident_id_from_name(Path(k).name) for k in keys("evidence/")} - {None}
+    written = skipped = 0
+    for incident_id in sorted(bundles):
+        if incident_id in indexed and not force:
+            skipped += 1
+            continue
+        out = store.read_evidence_bundle(incident_id)
+        if not out.get("found"):
+            continue
+        record = index_record(json.loads(out["raw"]), out["uri"])
+        s3.put_object(
+            Bucket=store.bucket,
+            Key=index_key(record),
+            Body=json.dumps(record).encode("utf-8"),
+            ContentType="application/json",
+        )
+        written += 1
+    return written, skipped
+
+
+def main() -> None:
+    from incident_triage_mcp.config import load_config
+
+    ap = argparse.ArgumentParser(description="Write incident index records for bundles that have none.")
+    ap.add_argument("--force", action="store_true", help="rewrite records that already exist")
+    args = ap.parse_args()
+    cfg = load_config()
+    if cfg.artifact_store == "s3":
+        from incident_triage_mcp.adapters.artifacts_s3 import S3ArtifactStore
+
+        written, skipped = _backfill_s3(S3ArtifactStore.from_config(cfg), args.force)
+    else:
+        written, skipped = _backfill_fs(cfg.artifact_dir, args.force)
+    print(f"index records: {written} written, {skipped} already present")
+
+
+if __name__ == "__main__":
+    main()
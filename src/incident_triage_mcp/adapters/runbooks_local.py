@@ -1,29 +1,108 @@
 from __future__ import annotations
-from typing import List, Dict, Any
-import math
+from typing import List, Dict, Any, Optional, Tuple
+
+from pathlib import Path
+import inspect
+import threading
+
+from incident_triage_mcp.metrics import timed
+from incident_triage_mcp.tools.runbooks import RunbookIndex, get_index, get_prebuilt
+
 
 class RunbooksLocal:
-    def __init__(self) -> None:
-        self._docs = [
+    """
+    RunbooksProvider backed by the in-process BM25 index.
+    - index_path set: maps the prebuilt index (RUNBOOKS_INDEX_PATH), kept in step
+      with RUNBOOKS_DIR when that exists
+    - runbooks_dir set: indexes RUNBOOKS_DIR/*.md (refreshed incrementally by mtime)
+    - runbooks_dir unset: small built-in demo corpus
+
+    search_mode "semantic" ranks by hashed n-gram vectors instead (vectors_path
+    mapped if set, else embedded in memory; both rebuilt when RUNBOOKS_DIR changes,
+    like the lexical index); "hybrid" blends both,
+    semantic_weight * semantic + (1 - semantic_weight) * BM25.
+    """
+    # picklable constructor arguments, set by get_runbooks(); CPU pool workers rebuild the instance from it
+    spec: Optional[Tuple[Tuple[str, Any], ...]] = None
+
+    def __init__(
+        self,
+        runbooks_dir: Optional[str] = None,
+        refresh_seconds: float = 5.0,
+        index_path: Optional[str] = None,
+        search_mode: str = "lexical",
+        vectors_path: Optional[str] = None,
+        semantic_weight: float = 0.5,
+    ) -> None:
+        self.search_mode = search_mode
+        self.semantic_weight = semantic_weight
+        self._vectors = None
+        docs = [
             {"doc_id": "rb_42", "title": "Payments DB timeout mitigation",
              "text": "If DB timeouts spike after deploy: rollback, scale read replicas, check connection pool."},
             {"doc_id": "rb_07", "title": "5xx spike checklist",
              "text": "Check recent deploys, dependency health, and top failing endpoints; confirm feature flags."},
         ]
 
+        source = runbooks_dir if runbooks_dir and Path(runbooks_dir).is_dir() else None
+        if index_path and (source or Path(index_path).exists()):
+            self._index = get_prebuilt(index_path, refresh_seconds=refresh_seconds, runbooks_dir=source)
+        elif runbooks_dir:
+            self._index = get_index(runbooks_dir, refresh_seconds=refresh_seconds)
+        else:
+            self._index = RunbookIndex()
+            for d in docs:
+                self._index.add_document(d["doc_id"], d["title"], d["text"], self._summary(d["text"]))
+
+        if search_mode == "lexical":
+            return
+        from incident_triage_mcp.tools.runbook_vectors import LiveRunbookVectors, MappedRunbookVectors, RunbookVectors
+
+        # same freshness rule as the lexical index, so hybrid never blends fresh BM25 with stale vectors
+        if vectors_path and (source or Path(vectors_path).exists()):
+            self._vectors = MappedRunbookVectors(vectors_path, refresh_seconds=refresh_seconds, runbooks_dir=source)
+        elif source:
+            self._vectors = LiveRunbookVectors(source, refresh_seconds=refresh_seconds)
+        else:
+            self._vectors = RunbookVectors.from_documents(
+                (d["doc_id"], d["title"], d["text"], self._summary(d["text"])) for d in docs
+            )
+
+    @staticmethod
+    def _summary(text: str) -> str:
+        return text[:180] + ("..." if len(text) > 180 else "")
+
+    @timed("runbooks.search")
     def search(self, query: str, limit: int = 5) -> List[Dict[str, Any]]:
-        q = [t for t in query.lower().split() if t.strip()]
-        scored = []
-        for d in self._docs:
-            hay = (d["title"] + " " + d["text"]).lower()
-            hits = sum(1 for t in q if t in hay)
-            score = 1.0 - math.exp(-hits / 3.0)
-            if hits:
-                scored.append((score, d))
-        scored.sort(key=lambda x: x[0], reverse=True)
-        return [{
-            "doc_id": d["doc_id"],
-            "title": d["title"],
-            "score": round(s, 3),
-            "summary": d["text"][:180] + ("..." if len(d["text"]) > 180 else "")
-        } for s, d in scored[:limit]]
\ No newline at end of file
+        if self._vectors is None:
+            return self._index.search(query, limit)
+        if self.search_mode == "semantic":
+            return self._vectors.search(query, limit)
+        from incident_triage_mcp.tools.runbook_vectors import blend
+
+        # over-fetch so a runbook ranked just outside one list can still win on the blend
+        fetch = limit * 4
+        return blend(self._index.search(query, fetch), self._vectors.search(query, fetch), self.semantic_weight, limit)
+
+
+_SHARED: Dict[Tuple[Tuple[str, Any], ...], RunbooksLocal] = {}
+_SHARED_LOCK = threading.Lock()
+_SIGNATURE = inspect.signature(RunbooksLocal)
+
+
+def get_runbooks(*args: Any, **kwargs: Any) -> RunbooksLocal:
+    """Process-wide RunbooksLocal per configuration (like tools.runbooks.get_index per directory)."""
+    bound = _SIGNATURE.bind(*args, **kwargs)
+    bound.apply_defaults()
+    spec = tuple(bound.arguments.items())
+    with _SHARED_LOCK:
+        rb = _SHARED.get(spec)
+        if rb is None:
+            rb = _SHARED[spec] = RunbooksLocal(**bound.arguments)
+            rb.spec = spec
+    return rb
+
+
+def search_shared(spec: Tuple[Tuple[str, Any], ...], query: str, limit: int = 5) -> List[Dict[str, Any]]:
+    """Runbook scoring as a pure function of (spec, query) for CpuPool; each process builds its index once."""
+    return get_runbooks(**dict(spec)).search(query, limit)
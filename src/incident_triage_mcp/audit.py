@@ -1,14 +1,25 @@
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
-from datetime import datetime, timezone
+from typing import Any, Deque, Dict, List, Optional, TextIO
+from collections import deque
 from pathlib import Path
+import atexit
+import itertools
 import json
+import random
+import threading
+import time
 import uuid
 import os
 import sys
 
-@dataclass
+try:
+    import orjson
+except ImportError:  # optional fast JSON backend
+    orjson = None
+
+
+@dataclass(slots=True)
 class AuditEvents:
     ts: str
     correlation_id: str
@@ -17,6 +28,55 @@ class AuditEvents:
     ok: bool
     meta: Dict[str,Any]
 
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "ts": self.ts,
+            "correlation_id": self.correlation_id,
+            "tool": self.tool,
+            "arguments": self.arguments,
+            "ok": self.ok,
+            "meta": self.meta,
+        }
+
+
+_ts_cache: tuple = (0, "")
+
+
+def _utc_now_iso() -> str:
+    # strftime once per second; only the microseconds are formatted per event
+    global _ts_cache
+    now = time.time()
+    sec = int(now)
+    cached_sec, prefix = _ts_cache
+    if sec != cached_sec:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+        _ts_cache = (sec, prefix)
+    return f"{prefix}.{int((now - sec) * 1_000_000):06d}+00:00"
+
+
+_stdlib_encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+
+def _stdlib_dumps(obj: Dict[str, Any]) -> str:
+    # reuse one encoder: json.dumps(..., ensure_ascii=False) builds a new JSONEncoder per call
+    return _stdlib_encoder.encode(obj)
+
+
+def _orjson_dumps(obj: Dict[str, Any]) -> str:
+    return orjson.dumps(obj).decode("utf-8")
+
+
+_CROCKFORD = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+# 10-bit chunk -> two Crockford base32 chars
+_CROCKFORD_PAIRS = [a + b for a in _CROCKFORD for b in _CROCKFORD]
+
+
+def _ulid() -> str:
+    # 48-bit ms timestamp + 80 random bits, Crockford base32 (26 chars, time-sortable)
+    # random (not os.urandom): ids need uniqueness, not secrecy; it is reseeded after fork
+    value = (int(time.time() * 1000) << 80) | random.getrandbits(80)
+    pairs = _CROCKFORD_PAIRS
+    return "".join([pairs[(value >> shift) & 0x3FF] for shift in range(120, -1, -10)])
 
 
 class AuditLog:
@@ -25,10 +85,44 @@ class AuditLog:
     k8s-friendly audit logger.
     - AUDIT_MODE=stdout (default): writes JSONL events to stdout
     - AUDIT_MODE=file: writes JSONL to AUDIT_PATH
+
+    Events are serialized on the caller and handed to a background writer
+    thread through a bounded buffer (AUDIT_QUEUE_SIZE; callers block when it is
+    full, events are never dropped). The writer group-commits up to
+    AUDIT_BATCH_SIZE lines or AUDIT_FLUSH_INTERVAL_MS worth of events per write.
+    - AUDIT_FSYNC=none|interval|always (file mode; interval = AUDIT_FSYNC_INTERVAL_MS)
+    - AUDIT_MAX_BYTES / AUDIT_BACKUP_COUNT: size-based rotation (file mode)
+    - AUDIT_ASYNC=false: write inline on the caller (previous behaviour)
+    - AUDIT_JSON=auto|orjson|stdlib: compact JSON encoder (auto = orjson if installed)
+    - AUDIT_CORRELATION_ID=uuid4|counter|ulid: counter = per-process random
+      prefix + monotonic counter, the cheapest unique id
+    Pending events are flushed on close() and at interpreter exit.
     """
     def __init__(self) -> None:
         self.mode = os.getenv("AUDIT_MODE", "stdout").lower()
         self.path = os.getenv("AUDIT_PATH", "audit.jsonl")
+        self.async_writes = os.getenv("AUDIT_ASYNC", "true").lower() not in {"0", "false", "no"}
+        self.batch_size = max(1, int(os.getenv("AUDIT_BATCH_SIZE", "256")))
+        self.flush_interval = int(os.getenv("AUDIT_FLUSH_INTERVAL_MS", "200")) / 1000.0
+        self.fsync = os.getenv("AUDIT_FSYNC", "none").lower()
+        self.fsync_interval = int(os.getenv("AUDIT_FSYNC_INTERVAL_MS", "1000")) / 1000.0
+        self.max_bytes = int(os.getenv("AUDIT_MAX_BYTES", "0"))
+        self.backup_count = int(os.getenv("AUDIT_BACKUP_COUNT", "5"))
+        if self.fsync not in {"none", "interval", "always"}:
+            raise ValueError("AUDIT_FSYNC must be 'none', 'interval' or 'always'")
+
+        json_backend = os.getenv("AUDIT_JSON", "auto").lower()
+        if json_backend == "orjson" and orjson is None:
+            raise ValueError("AUDIT_JSON=orjson but orjson is not installed")
+        use_orjson = orjson is not None and json_backend in {"auto", "orjson"}
+        self.json_backend = "orjson" if use_orjson else "stdlib"
+        self._dumps = _orjson_dumps if use_orjson else _stdlib_dumps
+
+        self.correlation_ids = os.getenv("AUDIT_CORRELATION_ID", "uuid4").lower()
+        if self.correlation_ids not in {"uuid4", "counter", "ulid"}:
+            raise ValueError("AUDIT_CORRELATION_ID must be 'uuid4', 'counter' or 'ulid'")
+        self._corr_prefix = f"corr_{os.urandom(4).hex()}_"
+        self._corr_seq = itertools.count(1)
 
         if self.mode == "file":
             p = Path(self.path).expanduser()
@@ -37,34 +131,170 @@ class AuditLog:
         else:
             self._file_path = None
 
-    def write(
+        self._fh: Optional[TextIO] = None
+        self._last_fsync = time.monotonic()
+        self._io_lock = threading.Lock()
+        self._closed = False
+
+        # deque.append is atomic, so the hot path is append + (rarely) an Event.set
+        self._pending: Deque[str] = deque()
+        self._max_pending = max(1, int(os.getenv("AUDIT_QUEUE_SIZE", "10000")))
+        self._enqueued = itertools.count(1)
+        self._last_enqueued = 0
+        self._committed = 0
+        self._wakeup = threading.Event()
+        self._batch_full = threading.Event()
+        self._progress = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        if self.async_writes:
+            self._thread = threading.Thread(target=self._run, name="audit-writer", daemon=True)
+            self._thread.start()
+            atexit.register(self.close)
+
+    def new_correlation_id(self) -> str:
+        if self.correlation_ids == "counter":
+            return f"{self._corr_prefix}{next(self._corr_seq):x}"
+        if self.correlation_ids == "ulid":
+            return f"corr_{_ulid()}"
+        return f"corr_{uuid.uuid4().hex}"
+
+    def encode(
             self,
             tool: str,
             arguments: Dict[str, Any],
             ok: bool,
             meta: Optional[Dict[str,Any]] = None,
             correlation_id: Optional[str] = None
-    ) ->str:
-        corr = correlation_id or f"corr_{uuid.uuid4().hex}"
+    ) -> tuple[str, str]:
+        """Build one event; returns (correlation_id, JSON line)."""
+        corr = correlation_id or self.new_correlation_id()
         evt = AuditEvents(
-            ts = datetime.now(timezone.utc).isoformat(),
+            ts=_utc_now_iso(),
             correlation_id=corr,
             tool=tool,
             arguments=arguments,
             ok=ok,
             meta=meta or {},
-
         )
+        return corr, self._dumps(evt.as_dict())
 
+    def write(
+            self,
+            tool: str,
+            arguments: Dict[str, Any],
+            ok: bool,
+            meta: Optional[Dict[str,Any]] = None,
+            correlation_id: Optional[str] = None
+    ) ->str:
+        corr, line = self.encode(tool, arguments, ok, meta, correlation_id)
 
-        line = json.dumps(evt.__dict__, ensure_ascii=False)
-
+        if self._thread is None or self._closed:
+            self._commit([line])
+            return corr
 
-        if self.mode == "file" and self._file_path is not None:
-            with self._file_path.open("a", encoding="utf-8") as f:
-                f.write(line + "\n")
-        else:
-            # stdout for k8s log collectors
-            print(line, file=sys.stdout, flush=True)
+        pending = self._pending
+        if len(pending) >= self._max_pending:
+            self._wait_for_space()
+        pending.append(line)
+        self._last_enqueued = next(self._enqueued)
+        if not self._wakeup.is_set():
+            self._wakeup.set()
+        if len(pending) >= self.batch_size and not self._batch_full.is_set():
+            self._batch_full.set()
 
         return corr
+
+    def flush(self) -> None:
+        """Block until every event handed to write() so far has been committed."""
+        if self._thread is None or not self._thread.is_alive():
+            return
+        target = self._last_enqueued
+        self._batch_full.set()
+        with self._progress:
+            self._progress.wait_for(lambda: self._committed >= target or not self._thread.is_alive())
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        if self._thread is not None and self._thread.is_alive():
+            self._wakeup.set()
+            self._batch_full.set()
+            self._thread.join()
+        with self._io_lock:
+            if self._fh is not None:
+                self._sync(force=self.fsync != "none")
+                self._fh.close()
+                self._fh = None
+
+    def _wait_for_space(self) -> None:
+        # backpressure: block the caller rather than drop audit events
+        self._batch_full.set()
+        with self._progress:
+            self._progress.wait_for(lambda: len(self._pending) < self._max_pending or not self._thread.is_alive())
+
+    # -- writer thread -------------------------------------------------------
+
+    def _run(self) -> None:
+        pending = self._pending
+        while True:
+            self._wakeup.wait()
+            # group commit: wait for a full batch or the flush interval, whichever comes first
+            if not self._closed:
+                self._batch_full.wait(self.flush_interval)
+            self._wakeup.clear()
+            self._batch_full.clear()
+
+            while pending:
+                batch: List[str] = []
+                while pending and len(batch) < self.batch_size:
+                    batch.append(pending.popleft())
+                try:
+                    self._commit(batch)
+                except Exception as e:  # never let a bad disk kill the writer thread
+                    print(f"[audit] write failed: {e}", file=sys.stderr)
+                with self._progress:
+                    self._committed += len(batch)
+                    self._progress.notify_all()
+
+            if self._closed:
+                return
+
+    def _commit(self, lines: List[str]) -> None:
+        data = "\n".join(lines) + "\n"
+        with self._io_lock:
+            if self.mode == "file" and self._file_path is not None:
+                if self._fh is None:
+                    self._fh = self._file_path.open("a", encoding="utf-8")
+                self._fh.write(data)
+                self._fh.flush()
+                self._sync(force=self.fsync == "always")
+                if self.max_bytes and self._fh.tell() >= self.max_bytes:
+                    self._rotate()
+            else:
+                # stdout for k8s log collectors
+                sys.stdout.write(data)
+                sys.stdout.flush()
+
+    def _sync(self, force: bool) -> None:
+        if self._fh is None or self.fsync == "none":
+            return
+        now = time.monotonic()
+        if force or (self.fsync == "interval" and now - self._last_fsync >= self.fsync_interval):
+            os.fsync(self._fh.fileno())
+            self._last_fsync = now
+
+    def _rotate(self) -> None:
+        # audit.jsonl -> audit.jsonl.1 -> ... -> audit.jsonl.<AUDIT_BACKUP_COUNT>
+        self._sync(force=self.fsync != "none")
+        self._fh.close()
+        self._fh = None
+        p = self._file_path
+        if self.backup_count <= 0:
+            p.unlink(missing_ok=True)
+            return
+        for i in range(self.backup_count - 1, 0, -1):
+            src = p.with_name(f"{p.name}.{i}")
+            if src.exists():
+                src.replace(p.with_name(f"{p.name}.{i + 1}"))
+        p.replace(p.with_name(f"{p.name}.1"))
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass
-from typing import Optional
+from typing import FrozenSet, Optional
 
 
 class ConfigError(RuntimeError):
@@ -26,26 +26,91 @@ class AppConfig:
     mcp_transport: str
     mcp_host: str
     mcp_port: int
+    mcp_workers: int
+    mcp_graceful_shutdown_seconds: int
 
     # Audit
     audit_mode: str
     audit_path: str
+    audit_fsync: str
+    audit_json: str
+    audit_correlation_id: str
 
     # Artifact store
     artifact_store: str
+    artifact_dir: str
+    evidence_format: str
     s3_endpoint_url: Optional[str]
     s3_bucket: Optional[str]
     s3_region: str
     aws_access_key_id: Optional[str]
     aws_secret_access_key: Optional[str]
+    s3_max_pool_connections: int
+    s3_max_attempts: int
+    s3_retry_mode: str
+    s3_connect_timeout: float
+    s3_read_timeout: float
+
+    # Evidence cache
+    evidence_cache_max_entries: int
+    evidence_cache_ttl_seconds: float
+    evidence_stream_threshold_bytes: int
+    evidence_max_items: int
+
+    # Evidence waits (HEAD/stat probes with exponential backoff + webhook wakeups)
+    evidence_wait_initial_backoff: float
+    evidence_wait_max_backoff: float
+    evidence_webhook_token: Optional[str]
+
+    # Batch triage
+    triage_batch_max_concurrency: int
+    triage_batch_max_incidents: int
+    triage_run_wait_seconds: float
+    triage_run_reuse_seconds: float
+
+    # CPU-bound work (summaries, runbook scoring): worker thread or process pool
+    cpu_pool_workers: int
+    cpu_pool_min_bytes: int
+
+    # Alerts (alerts_fetch_active): grouping + local delta-synced store
+    alert_group_window_seconds: float
+    alert_group_max_groups: int
+    alerts_mock_rate_per_minute: float
+    alerts_retention_minutes: int
+    alerts_sync_seconds: float
+    alerts_store_path: str
 
     # Airflow (optional)
     airflow_base_url: Optional[str]
     airflow_username: Optional[str]
     airflow_password: Optional[str]
+    airflow_pool_size: int
+    airflow_max_retries: int
+    airflow_backoff_seconds: float
+    airflow_timeout_seconds: float
+
+    # Incident index (incidents_list)
+    incident_index_path: str
+    incident_index_backfill_days: int
+    incident_index_sync_seconds: float
+
+    # Metrics (/metrics)
+    metrics_enabled: bool
+
+    # Profiling (opt-in, per tool call)
+    profile_tools: FrozenSet[str]
+    profile_call_rate: float
+    profile_allow_request: bool
+    profile_sample_hz: float
+    profile_max_seconds: float
 
     # Runbooks
     runbooks_dir: str
+    runbooks_refresh_seconds: float
+    runbooks_index_path: Optional[str]
+    runbooks_search_mode: str
+    runbooks_vectors_path: Optional[str]
+    runbooks_semantic_weight: float
 
 
 def load_config() -> AppConfig:
@@ -55,29 +120,115 @@ def load_config() -> AppConfig:
         mcp_transport=_env("MCP_TRANSPORT", "stdio") or "stdio",
         mcp_host=_env("MCP_HOST", "0.0.0.0") or "0.0.0.0",
         mcp_port=int(_env("MCP_PORT", "3333") or "3333"),
+        # 0 = one worker per CPU
+        mcp_workers=int(_env("MCP_WORKERS", "1") or "1") or (os.cpu_count() or 1),
+        mcp_graceful_shutdown_seconds=int(_env("MCP_GRACEFUL_SHUTDOWN_SECONDS", "30") or "30"),
 
         audit_mode=(_env("AUDIT_MODE", "stdout") or "stdout").lower(),
         audit_path=_env("AUDIT_PATH", "audit.jsonl") or "audit.jsonl",
+        audit_fsync=(_env("AUDIT_FSYNC", "none") or "none").lower(),
+        audit_json=(_env("AUDIT_JSON", "auto") or "auto").lower(),
+        audit_correlation_id=(_env("AUDIT_CORRELATION_ID", "uuid4") or "uuid4").lower(),
 
         artifact_store=artifact_store,
+        artifact_dir=_env("AIRFLOW_ARTIFACT_DIR", "./airflow/artifacts") or "./airflow/artifacts",
         s3_endpoint_url=_env("S3_ENDPOINT_URL"),
         s3_bucket=_env("S3_BUCKET"),
         s3_region=_env("S3_REGION", "us-east-1") or "us-east-1",
         aws_access_key_id=_env("AWS_ACCESS_KEY_ID"),
         aws_secret_access_key=_env("AWS_SECRET_ACCESS_KEY"),
+        s3_max_pool_connections=int(_env("S3_MAX_POOL_CONNECTIONS", "20") or "20"),
+        s3_max_attempts=int(_env("S3_MAX_ATTEMPTS", "3") or "3"),
+        evidence_format=(_env("EVIDENCE_FORMAT", "v1") or "v1").lower(),
+        s3_retry_mode=(_env("S3_RETRY_MODE", "standard") or "standard").lower(),
+        s3_connect_timeout=float(_env("S3_CONNECT_TIMEOUT", "5") or "5"),
+        s3_read_timeout=float(_env("S3_READ_TIMEOUT", "30") or "30"),
+
+        evidence_cache_max_entries=int(_env("EVIDENCE_CACHE_MAX_ENTRIES", "128") or "128"),
+        evidence_cache_ttl_seconds=float(_env("EVIDENCE_CACHE_TTL_SECONDS", "30") or "30"),
+        evidence_stream_threshold_bytes=int(_env("EVIDENCE_STREAM_THRESHOLD_BYTES", "8388608") or "8388608"),
+        evidence_max_items=int(_env("EVIDENCE_MAX_ITEMS", "200") or "200"),
+
+        evidence_wait_initial_backoff=float(_env("EVIDENCE_WAIT_INITIAL_BACKOFF", "0.25") or "0.25"),
+        evidence_wait_max_backoff=float(_env("EVIDENCE_WAIT_MAX_BACKOFF", "5") or "5"),
+        evidence_webhook_token=_env("EVIDENCE_WEBHOOK_TOKEN"),
+
+        triage_batch_max_concurrency=int(_env("TRIAGE_BATCH_MAX_CONCURRENCY", "16") or "16"),
+        triage_batch_max_incidents=int(_env("TRIAGE_BATCH_MAX_INCIDENTS", "200") or "200"),
+        triage_run_wait_seconds=float(_env("TRIAGE_RUN_WAIT_SECONDS", "60") or "60"),
+        triage_run_reuse_seconds=float(_env("TRIAGE_RUN_REUSE_SECONDS", "60") or "60"),
+        cpu_pool_workers=int(_env("CPU_POOL_WORKERS", "0") or "0"),
+        cpu_pool_min_bytes=int(_env("CPU_POOL_MIN_BYTES", "65536") or "65536"),
+        alert_group_window_seconds=float(_env("ALERT_GROUP_WINDOW_SECONDS", "300") or "300"),
+        alert_group_max_groups=int(_env("ALERT_GROUP_MAX_GROUPS", "50") or "50"),
+        alerts_mock_rate_per_minute=float(_env("ALERTS_MOCK_RATE_PER_MINUTE", "0") or "0"),
+        alerts_retention_minutes=int(_env("ALERTS_RETENTION_MINUTES", "120") or "120"),
+        alerts_sync_seconds=float(_env("ALERTS_SYNC_SECONDS", "2") or "2"),
+        alerts_store_path=_env("ALERTS_STORE_PATH", ":memory:") or ":memory:",
 
         airflow_base_url=_env("AIRFLOW_BASE_URL"),
         airflow_username=_env("AIRFLOW_USERNAME"),
         airflow_password=_env("AIRFLOW_PASSWORD"),
+        airflow_pool_size=int(_env("AIRFLOW_POOL_SIZE", "10") or "10"),
+        airflow_max_retries=int(_env("AIRFLOW_MAX_RETRIES", "3") or "3"),
+        airflow_backoff_seconds=float(_env("AIRFLOW_BACKOFF_SECONDS", "0.5") or "0.5"),
+        airflow_timeout_seconds=float(_env("AIRFLOW_TIMEOUT_SECONDS", "15") or "15"),
 
+        incident_index_path=_env("INCIDENT_INDEX_PATH", ":memory:") or ":memory:",
+        incident_index_backfill_days=int(_env("INCIDENT_INDEX_BACKFILL_DAYS", "30") or "30"),
+        incident_index_sync_seconds=float(_env("INCIDENT_INDEX_SYNC_SECONDS", "30") or "30"),
+        metrics_enabled=(_env("METRICS_ENABLED", "true") or "true").lower() not in {"0", "false", "no"},
+        profile_tools=frozenset(t.strip() for t in (_env("PROFILE_TOOLS") or "").split(",") if t.strip()),
+        profile_call_rate=float(_env("PROFILE_CALL_RATE", "1") or "1"),
+        profile_allow_request=(_env("PROFILE_ALLOW_REQUEST", "false") or "false").lower() not in {"0", "false", "no"},
+        profile_sample_hz=float(_env("PROFILE_SAMPLE_HZ", "100") or "100"),
+        profile_max_seconds=float(_env("PROFILE_MAX_SECONDS", "30") or "30"),
         runbooks_dir=_env("RUNBOOKS_DIR", "./runbooks") or "./runbooks",
+        runbooks_refresh_seconds=float(_env("RUNBOOKS_REFRESH_SECONDS", "5") or "5"),
+        runbooks_index_path=_env("RUNBOOKS_INDEX_PATH") or None,
+        runbooks_search_mode=(_env("RUNBOOKS_SEARCH_MODE", "lexical") or "lexical").lower(),
+        runbooks_vectors_path=_env("RUNBOOKS_VECTORS_PATH") or None,
+        runbooks_semantic_weight=float(_env("RUNBOOKS_SEMANTIC_WEIGHT", "0.5") or "0.5"),
     )
 
+    # Validate serving
+    if cfg.mcp_workers < 1:
+        raise ConfigError("MCP_WORKERS must be >= 1 (or 0 for one per CPU)")
+    if cfg.mcp_graceful_shutdown_seconds < 0:
+        raise ConfigError("MCP_GRACEFUL_SHUTDOWN_SECONDS must be >= 0")
+    if cfg.mcp_transport == "streamable-http" and cfg.mcp_workers > 1 and cfg.alerts_store_path == ":memory:":
+        # each worker would hand out cursors only it can continue from
+        raise ConfigError("MCP_WORKERS > 1 needs ALERTS_STORE_PATH (a SQLite file the workers share) for since_cursor")
+    if cfg.cpu_pool_workers < 0:
+        raise ConfigError("CPU_POOL_WORKERS must be >= 0 (0 = worker thread, no processes)")
+
     # Validate audit
     if cfg.audit_mode not in {"stdout", "file"}:
         raise ConfigError("AUDIT_MODE must be 'stdout' or 'file'")
+    if cfg.audit_fsync not in {"none", "interval", "always"}:
+        raise ConfigError("AUDIT_FSYNC must be 'none', 'interval' or 'always'")
+    if cfg.audit_json not in {"auto", "orjson", "stdlib"}:
+        raise ConfigError("AUDIT_JSON must be 'auto', 'orjson' or 'stdlib'")
+    if cfg.audit_correlation_id not in {"uuid4", "counter", "ulid"}:
+        raise ConfigError("AUDIT_CORRELATION_ID must be 'uuid4', 'counter' or 'ulid'")
+
+    # Validate profiling
+    if not 0.0 <= cfg.profile_call_rate <= 1.0:
+        raise ConfigError("PROFILE_CALL_RATE must be between 0 and 1")
+    if not 1.0 <= cfg.profile_sample_hz <= 1000.0:
+        raise ConfigError("PROFILE_SAMPLE_HZ must be between 1 and 1000")
+    if cfg.profile_max_seconds <= 0:
+        raise ConfigError("PROFILE_MAX_SECONDS must be > 0")
+
+    # Validate runbooks
+    if cfg.runbooks_search_mode not in {"lexical", "semantic", "hybrid"}:
+        raise ConfigError("RUNBOOKS_SEARCH_MODE must be 'lexical', 'semantic' or 'hybrid'")
+    if not 0.0 <= cfg.runbooks_semantic_weight <= 1.0:
+        raise ConfigError("RUNBOOKS_SEMANTIC_WEIGHT must be between 0 and 1")
 
     # Validate artifacts
+    if cfg.evidence_format not in {"v1", "v2"}:
+        raise ConfigError("EVIDENCE_FORMAT must be 'v1' or 'v2'")
     if cfg.artifact_store == "s3":
         missing = []
         if not cfg.s3_endpoint_url:
@@ -90,6 +241,10 @@ def load_config() -> AppConfig:
             missing.append("AWS_SECRET_ACCESS_KEY")
         if missing:
             raise ConfigError("Missing required env vars for ARTIFACT_STORE=s3: " + ", ".join(missing))
+        if cfg.s3_retry_mode not in {"legacy", "standard", "adaptive"}:
+            raise ConfigError("S3_RETRY_MODE must be 'legacy', 'standard' or 'adaptive'")
+        if cfg.s3_max_pool_connections < 1:
+            raise ConfigError("S3_MAX_POOL_CONNECTIONS must be >= 1")
     elif cfg.artifact_store != "fs":
         raise ConfigError("ARTIFACT_STORE must be 's3' or 'fs'")
 
@@ -73,4 +73,6 @@ class EvidenceBundle(BaseModel):
         default_factory=list,
         description='List of {"type": "...", "url": "..."} links'
     )
+    partial: bool = Field(False, description="Written before every collector finished (or some failed/timed out).")
+    missing_evidence: list[str] = Field(default_factory=list, description="Collectors not (yet) reflected in this bundle.")
     generated_at_iso: str
\ No newline at end of file
@@ -0,0 +1,119 @@
+"""
+Evidence artifact formats.
+
+v1: evidence/v1/<id>.json        indented JSON (fs: <id>.json)
+v2: evidence/v2/<id>.json        compact JSON, gzip or zstd compressed; the
+                                 encoding is in the object metadata
+                                 (fs: <id>.json.gz / <id>.json.zst)
+"""
+from __future__ import annotations
+
+import gzip
+import json
+from typing import Any, BinaryIO, Dict, Optional
+
+try:
+    import zstandard
+except ImportError:  # optional: pip install zstandard
+    zstandard = None
+
+FORMATS = ("v1", "v2")
+ENCODINGS = ("identity", "gzip", "zstd")
+# fs lookup order: plain v1 first, so v1-only deployments pay a single stat()
+FS_SUFFIXES = {"identity": ".json", "gzip": ".json.gz", "zstd": ".json.zst"}
+
+# S3 user metadata (x-amz-meta-*)
+META_ENCODING = "evidence-encoding"
+META_LENGTH = "evidence-length"
+META_SHA256 = "bundle-sha256"  # sha256 of the stored object bytes
+
+
+def s3_key(incident_id: str, fmt: str = "v1") -> str:
+    return f"evidence/{fmt}/{incident_id}.json"
+
+
+def dumps(bundle: Dict[str, Any], fmt: str = "v1") -> bytes:
+    if fmt == "v1":
+        return json.dumps(bundle, ensure_ascii=False, indent=2).encode("utf-8")
+    return json.dumps(bundle, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def compress(data: bytes, encoding: str) -> bytes:
+    if encoding == "gzip":
+        # level 6: ~all of level 9's ratio on JSON at a fraction of the CPU
+        return gzip.compress(data, compresslevel=6, mtime=0)
+    if encoding == "zstd":
+        return _zstd().ZstdCompressor(level=3).compress(data)
+    return data
+
+
+def decompress(data: bytes, encoding: str) -> bytes:
+    if encoding == "gzip":
+        return gzip.decompress(data)
+    if encoding == "zstd":
+        return _zstd().ZstdDecompressor().decompress(data)
+    return data
+
+
+def encoding_from_suffix(name: str) -> str:
+    for encoding, suffix in FS_SUFFIXES.items():
+        if name.endswith(suffix):
+            return encoding
+    return "identity"
+
+
+def incident_id_from_name(name: str) -> Optional[str]:
+    """<id>.json / <id>.json.gz / <id>.json.zst -> <id>"""
+    for suffix in FS_SUFFIXES.values():
+        if name.endswith(suffix):
+            return name[: -len(suffix)]
+    return None
+
+
+class _DecodedStream:
+    """Decompressing reader that also closes the underlying stream."""
+
+    def __init__(self, reader: BinaryIO, raw: BinaryIO) -> None:
+        self._reader = reader
+        self._raw = raw
+
+    def read(self, size: int = -1) -> bytes:
+        return self._reader.read(size)
+
+    def close(self) -> None:
+        try:
+            self._reader.close()
+        finally:
+            self._raw.close()
+
+
+def open_decoded(stream: BinaryIO, encoding: str) -> BinaryIO:
+    if encoding == "gzip":
+        return _DecodedStream(gzip.GzipFile(fileobj=stream, mode="rb"), stream)
+    if encoding == "zstd":
+        return _DecodedStream(_zstd().ZstdDecompressor().stream_reader(stream), stream)
+    return stream
+
+
+def decoded_size(header: bytes, trailer: bytes, size: int, encoding: str) -> int:
+    """
+    Uncompressed size of a local artifact without decompressing it: gzip keeps
+    it in the last 4 bytes (mod 2**32), zstd in the frame header.
+    """
+    if encoding == "gzip" and len(trailer) == 4:
+        isize = int.from_bytes(trailer, "little")
+        # ISIZE wraps at 4 GiB; never report less than the compressed size
+        return isize if isize >= size else size
+    if encoding == "zstd" and zstandard is not None:
+        try:
+            n = zstandard.frame_content_size(header)
+        except zstandard.ZstdError:
+            n = -1
+        return n if n >= 0 else size
+    return size
+
+
+def _zstd():
+    if zstandard is None:
+        raise RuntimeError("zstd-encoded evidence requires the optional 'zstandard' package")
+    return zstandard
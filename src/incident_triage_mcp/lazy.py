@@ -0,0 +1,49 @@
+"""
+Deferred construction for process-wide adapters.
+
+Every agent session spawns a fresh stdio server, and most sessions call a
+handful of tools. Lazy(factory) stands in for an adapter at module level and
+builds it on first attribute access (once, thread-safe), so the runbook
+index, the incident index database, the audit writer thread and the alert feed
+are only set up by the first tool that needs them.
+"""
+from __future__ import annotations
+
+import threading
+from typing import Any, Callable, Generic, TypeVar
+
+T = TypeVar("T")
+
+_UNSET: Any = object()
+
+
+class Lazy(Generic[T]):
+    __slots__ = ("_factory", "_value", "_lock")
+
+    def __init__(self, factory: Callable[[], T]) -> None:
+        object.__setattr__(self, "_factory", factory)
+        object.__setattr__(self, "_value", _UNSET)
+        object.__setattr__(self, "_lock", threading.Lock())
+
+    def get(self) -> T:
+        value = self._value
+        if value is _UNSET:
+            with self._lock:
+                value = self._value
+                if value is _UNSET:
+                    value = self._factory()
+                    object.__setattr__(self, "_value", value)
+        return value
+
+    @property
+    def built(self) -> bool:
+        return self._value is not _UNSET
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.get(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self.get(), name, value)
+
+    def __repr__(self) -> str:
+        return f"Lazy({self._value!r})" if self.built else f"Lazy(<unbuilt {self._factory!r}>)"
@@ -0,0 +1,198 @@
+"""
+In-process metrics with a Prometheus text exposition (/metrics).
+
+Families:
+    incident_triage_tool_duration_seconds{tool}      histogram, every MCP tool
+    incident_triage_tool_in_flight{tool}             gauge
+    incident_triage_tool_errors_total{tool}          counter (raised exceptions)
+    incident_triage_adapter_duration_seconds{op}     histogram, Airflow / S3 / runbook calls
+    incident_triage_adapter_in_flight{op}            gauge
+    incident_triage_adapter_errors_total{op}         counter
+    incident_triage_payload_bytes{op}                histogram, bytes read per call
+
+Hot path per call: two perf_counter_ns() reads, a bisect over ~16 bucket
+bounds and a few adds under an uncontended lock, taken once on entry and once
+on exit (~2 us in CPython; benchmarks/bench_metrics.py). METRICS_ENABLED=false turns the wrappers into a
+single attribute check.
+"""
+from __future__ import annotations
+
+import bisect
+import functools
+import inspect
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+# seconds: 0.5 ms .. 60 s
+LATENCY_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0,
+)
+# bytes: 1 KiB .. 256 MiB
+SIZE_BUCKETS = tuple(float(1024 * 4**i) for i in range(10))
+
+
+class _Series:
+    """One labelled series: histogram buckets + sum/count, in-flight gauge, error counter."""
+
+    __slots__ = ("_bounds", "buckets", "sum", "count", "errors", "started", "_lock")
+
+    def __init__(self, bounds: Sequence[float]) -> None:
+        self._bounds = bounds
+        self.buckets = [0] * (len(bounds) + 1)  # last = +Inf
+        self.sum = 0.0
+        self.count = 0
+        self.errors = 0
+        self.started = 0  # in flight = started - count (every finished call is observed)
+        self._lock = threading.Lock()
+
+    def enter(self) -> None:
+        with self._lock:
+            self.started += 1
+
+    def observe(self, value: float) -> None:
+        i = bisect.bisect_left(self._bounds, value)
+        with self._lock:
+            self.buckets[i] += 1
+            self.sum += value
+            self.count += 1
+
+    def exit(self, value: float, failed: bool) -> None:
+        i = bisect.bisect_left(self._bounds, value)
+        with self._lock:
+            self.errors += failed
+            self.buckets[i] += 1
+            self.sum += value
+            self.count += 1
+
+    def snapshot(self) -> Tuple[List[int], float, int, int, int]:
+        with self._lock:
+            return list(self.buckets), self.sum, self.count, self.started - self.count, self.errors
+
+
+class _Family:
+    def __init__(self, name: str, label: str, help_text: str, bounds: Sequence[float]) -> None:
+        self.name = name
+        self.label = label
+        self.help = help_text
+        self.bounds = bounds
+        self._series: Dict[str, _Series] = {}
+        self._lock = threading.Lock()
+
+    def series(self, value: str) -> _Series:
+        s = self._series.get(value)
+        if s is None:
+            with self._lock:
+                s = self._series.setdefault(value, _Series(self.bounds))
+        return s
+
+    def items(self) -> List[Tuple[str, _Series]]:
+        with self._lock:
+            return sorted(self._series.items())
+
+
+class Registry:
+    def __init__(self) -> None:
+        self.enabled = True
+        self.tools = _Family("incident_triage_tool", "tool", "MCP tool calls", LATENCY_BUCKETS)
+        self.adapters = _Family("incident_triage_adapter", "op", "Adapter calls (Airflow, S3, runbooks)", LATENCY_BUCKETS)
+        self.payloads = _Family("incident_triage_payload", "op", "Payload bytes read", SIZE_BUCKETS)
+
+    def observe_bytes(self, op: str, n: int) -> None:
+        if self.enabled:
+            self.payloads.series(op).observe(float(n))
+
+    def render(self) -> str:
+        """Prometheus text exposition format 0.0.4."""
+        out: List[str] = []
+        for fam in (self.tools, self.adapters):
+            items = fam.items()
+            snaps = [(v, s.snapshot()) for v, s in items]
+            _histogram(out, f"{fam.name}_duration_seconds", f"{fam.help}: latency", fam.label, fam.bounds, snaps)
+            out.append(f"# HELP {fam.name}_in_flight {fam.help}: currently executing")
+            out.append(f"# TYPE {fam.name}_in_flight gauge")
+            for v, snap in snaps:
+                out.append(f'{fam.name}_in_flight{{{fam.label}="{_esc(v)}"}} {snap[3]}')
+            out.append(f"# HELP {fam.name}_errors_total {fam.help}: raised exceptions")
+            out.append(f"# TYPE {fam.name}_errors_total counter")
+            for v, snap in snaps:
+                out.append(f'{fam.name}_errors_total{{{fam.label}="{_esc(v)}"}} {snap[4]}')
+        fam = self.payloads
+        snaps = [(v, s.snapshot()) for v, s in fam.items()]
+        _histogram(out, f"{fam.name}_bytes", fam.help, fam.label, fam.bounds, snaps)
+        return "\n".join(out) + "\n"
+
+
+def _esc(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _histogram(out: List[str], name: str, help_text: str, label: str, bounds, snaps) -> None:
+    out.append(f"# HELP {name} {help_text}")
+    out.append(f"# TYPE {name} histogram")
+    for v, (buckets, total, count, _, _) in snaps:
+        lv = _esc(v)
+        cumulative = 0
+        for bound, n in zip(bounds, buckets):
+            cumulative += n
+            out.append(f'{name}_bucket{{{label}="{lv}",le="{bound!r}"}} {cumulative}')
+        out.append(f'{name}_bucket{{{label}="{lv}",le="+Inf"}} {count}')
+        out.append(f'{name}_sum{{{label}="{lv}"}} {total!r}')
+        out.append(f'{name}_count{{{label}="{lv}"}} {count}')
+
+
+REGISTRY = Registry()
+
+
+def _wrap(family: _Family, name: str, fn: Callable) -> Callable:
+    series = family.series(name)
+    registry = REGISTRY
+    clock = time.perf_counter_ns
+
+    if inspect.iscoroutinefunction(fn):
+        @functools.wraps(fn)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not registry.enabled:
+                return await fn(*args, **kwargs)
+            series.enter()
+            start = clock()
+            failed = True
+            try:
+                result = await fn(*args, **kwargs)
+                failed = False
+                return result
+            finally:
+                series.exit((clock() - start) / 1e9, failed)
+
+        return async_wrapper
+
+    @functools.wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        if not registry.enabled:
+            return fn(*args, **kwargs)
+        series.enter()
+        start = clock()
+        failed = True
+        try:
+            result = fn(*args, **kwargs)
+            failed = False
+            return result
+        finally:
+            series.exit((clock() - start) / 1e9, failed)
+
+    return wrapper
+
+
+def tool(fn: Callable) -> Callable:
+    """Time an MCP tool (labelled by function name). Keeps the signature for FastMCP's schema."""
+    return _wrap(REGISTRY.tools, fn.__name__, fn)
+
+
+def timed(op: str) -> Callable[[Callable], Callable]:
+    """Time an adapter call (sync or async) as `op`, e.g. @timed("airflow.trigger_dag")."""
+    return lambda fn: _wrap(REGISTRY.adapters, op, fn)
+
+
+def observe_bytes(op: str, n: Optional[int]) -> None:
+    if n is not None:
+        REGISTRY.observe_bytes(op, n)
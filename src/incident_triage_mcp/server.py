@@ -1,20 +1,35 @@
 from __future__ import annotations
 from incident_triage_mcp.audit import AuditLog
 import os
-from pathlib import Path
+import asyncio
+import time
+from contextlib import closing
+from functools import partial
+from urllib.parse import unquote_plus
 import json
+import anyio
 from mcp.server.fastmcp import FastMCP
-from incident_triage_mcp.adapters.datadog_mock import DatadogMock
-from incident_triage_mcp.adapters.runbooks_local import RunbooksLocal
-from incident_triage_mcp.adapters.airflow_api import AirflowAPI
-from incident_triage_mcp.tools.incidents import triage_incident_run
-from incident_triage_mcp.tools.evidence import load_bundle
-from incident_triage_mcp.tools.runbooks import search_runbooks as search_local_runbooks
-from incident_triage_mcp.tools.waiter import wait_for
-from incident_triage_mcp.adapters.artifacts_s3 import read_evidence_bundle
-from incident_triage_mcp.domain_models import EvidenceBundle
+from starlette.requests import Request
+from starlette.responses import JSONResponse, PlainTextResponse
+from incident_triage_mcp import metrics
+from incident_triage_mcp.lazy import Lazy
+from incident_triage_mcp.profiling import ToolProfiler, fs_profile_sink, s3_profile_sink
+from incident_triage_mcp.adapters.datadog_mock import DatadogFeedMock, DatadogMock
+from incident_triage_mcp.adapters.runbooks_local import get_runbooks, search_shared
+from incident_triage_mcp.adapters.airflow_api import AsyncAirflowAPI
+from incident_triage_mcp.tools.alert_groups import group_alerts
+from incident_triage_mcp.tools.alert_store import AlertStore, newest
+from incident_triage_mcp.tools.incidents import DagRunTracker, triage_incident_run
+from incident_triage_mcp.tools.evidence_cache import EvidenceCache, fs_source, s3_source
+from incident_triage_mcp.tools.summary_cache import SummaryCache, fs_summary_source, s3_summary_source
+from incident_triage_mcp.tools.waiter import EvidenceWaiter
+from incident_triage_mcp.tools.evidence import bundle_exists, read_bundle
+from incident_triage_mcp.tools.evidence_stream import page_bundle_stream
+from incident_triage_mcp.adapters.artifacts_s3 import S3ArtifactStore
+from incident_triage_mcp.adapters.incident_index import IncidentIndex, fs_index_source, parse_since, s3_index_source
 from incident_triage_mcp.config import ConfigError,load_config
-from incident_triage_mcp.tools.triage import build_triage_summary
+from incident_triage_mcp.tools.cpu_pool import CpuPool
+from incident_triage_mcp.tools.triage import summarize_bundle, summarize_raw
 
 
 
@@ -23,28 +38,140 @@ try:
 except ConfigError as e:
     raise SystemExit(f"[config] {e}") from e
 
+EVIDENCE_DAG_ID = "incident_evidence_v1"
+
 _mcp_host = os.getenv("MCP_HOST", "127.0.0.1")
 _mcp_port = int(os.getenv("MCP_PORT", "8000"))
-mcp = FastMCP("Incident Triage MCP", json_response=True, host=_mcp_host, port=_mcp_port)
-audit = AuditLog()
-datadog = DatadogMock()
-runbooks = RunbooksLocal()
-airflow = AirflowAPI(base_url=os.getenv("AIRFLOW_BASE_URL", "http://localhost:8080"))
-
-
-@mcp.tool()
-def incident_triage_run(incident_id: str, service: str) -> dict:
+# several workers share one port, so consecutive requests of a session can land on
+# different processes: no server-side session state when MCP_WORKERS > 1
+_multi_worker = CFG.mcp_transport == "streamable-http" and CFG.mcp_workers > 1
+mcp = FastMCP(
+    "Incident Triage MCP",
+    json_response=True,
+    stateless_http=_multi_worker,
+    host=_mcp_host,
+    port=_mcp_port,
+)
+metrics.REGISTRY.enabled = CFG.metrics_enabled
+# opt-in; the artifact sink and audit hook are wired below, once those exist
+profiler = ToolProfiler(
+    tools=CFG.profile_tools,
+    call_rate=CFG.profile_call_rate,
+    allow_request=CFG.profile_allow_request,
+    hz=CFG.profile_sample_hz,
+    max_seconds=CFG.profile_max_seconds,
+)
+
+
+def tool(*args, **kwargs):
+    """@mcp.tool() plus latency / in-flight / error metrics (served on /metrics) and opt-in profiling."""
+    register = mcp.tool(*args, **kwargs)
+    return lambda fn: register(metrics.tool(profiler.wrap(fn)))
+
+# adapters are built on first use: a stdio session that only calls a couple of tools
+# never builds the runbook index, opens the incident database or starts the alert feed
+audit = Lazy(AuditLog)
+
+
+def _datadog():
+    if CFG.alerts_mock_rate_per_minute > 0:
+        return DatadogFeedMock(CFG.alerts_mock_rate_per_minute, retention_minutes=CFG.alerts_retention_minutes)
+    return DatadogMock()
+
+
+datadog = Lazy(_datadog)
+# merged copy of the alert feed: calls pay upstream only for changes since the last sync
+alert_store = Lazy(lambda: AlertStore(
+    datadog.get(),
+    retention_minutes=CFG.alerts_retention_minutes,
+    sync_seconds=CFG.alerts_sync_seconds if hasattr(datadog.get(), "fetch_alerts_since") else 0.0,
+    db_path=CFG.alerts_store_path,
+))
+runbooks = Lazy(lambda: get_runbooks(
+    CFG.runbooks_dir,
+    refresh_seconds=CFG.runbooks_refresh_seconds,
+    index_path=CFG.runbooks_index_path,
+    search_mode=CFG.runbooks_search_mode,
+    vectors_path=CFG.runbooks_vectors_path,
+    semantic_weight=CFG.runbooks_semantic_weight,
+))
+# shared async HTTP session; tools never block the event loop on Airflow
+airflow = Lazy(lambda: AsyncAirflowAPI(
+    base_url=os.getenv("AIRFLOW_BASE_URL", "http://localhost:8080"),
+    timeout=CFG.airflow_timeout_seconds,
+    pool_size=CFG.airflow_pool_size,
+    max_retries=CFG.airflow_max_retries,
+    backoff_seconds=CFG.airflow_backoff_seconds,
+))
+# summaries and runbook scoring: off the event loop, and with CPU_POOL_WORKERS > 0 off this process's GIL
+cpu_pool = CpuPool(CFG.cpu_pool_workers, min_bytes=CFG.cpu_pool_min_bytes)
+# one pooled S3 client for the process; built lazily on first read
+artifacts = S3ArtifactStore.from_config(CFG)
+evidence_cache = EvidenceCache(
+    s3_source(artifacts, stream_over=CFG.evidence_stream_threshold_bytes)
+    if CFG.artifact_store == "s3"
+    else fs_source(CFG.artifact_dir, stream_over=CFG.evidence_stream_threshold_bytes),
+    max_entries=CFG.evidence_cache_max_entries,
+    ttl_seconds=CFG.evidence_cache_ttl_seconds,
+    max_items=CFG.evidence_max_items,
+)
+# triage summaries keyed by bundle content hash (precomputed by the DAG when available)
+summaries = SummaryCache(
+    *(s3_summary_source(artifacts) if CFG.artifact_store == "s3" else fs_summary_source(CFG.artifact_dir)),
+    max_entries=CFG.evidence_cache_max_entries,
+)
+incident_index = Lazy(lambda: IncidentIndex(
+    s3_index_source(artifacts) if CFG.artifact_store == "s3" else fs_index_source(CFG.artifact_dir),
+    db_path=CFG.incident_index_path,
+    backfill_days=CFG.incident_index_backfill_days,
+    sync_seconds=CFG.incident_index_sync_seconds,
+))
+dag_runs = DagRunTracker(reuse_seconds=CFG.triage_run_reuse_seconds)
+evidence_waiter = EvidenceWaiter(
+    (lambda iid: artifacts.head_evidence_bundle(iid)["found"])
+    if CFG.artifact_store == "s3"
+    else partial(bundle_exists, CFG.artifact_dir),
+    initial_backoff=CFG.evidence_wait_initial_backoff,
+    max_backoff=CFG.evidence_wait_max_backoff,
+    watch_dir=CFG.artifact_dir if CFG.artifact_store == "fs" else None,
+)
+profiler.sink = s3_profile_sink(artifacts) if CFG.artifact_store == "s3" else fs_profile_sink(CFG.artifact_dir)
+profiler.on_capture = lambda corr, info: audit.write("profile.captured", info, ok="error" not in info, correlation_id=corr)
+
+
+@tool()
+async def incident_triage_run(incident_id: str, service: str) -> dict:
     """
     One-call demo: alerts -> airflow evidence -> artifact -> summary.
+    Follows the DAG run to completion (up to TRIAGE_RUN_WAIT_SECONDS); repeated
+    calls for the same incident attach to the run already in flight.
     """
     corr = audit.write("incident.triage_run", {"incident_id": incident_id, "service": service}, ok=True)
 
-    result = triage_incident_run(
+    async def _get_dag_run(dag_run_id: str) -> dict:
+        return await airflow.get_dag_run(EVIDENCE_DAG_ID, dag_run_id)
+
+    async def _get_artifact(incident_id: str) -> dict:
+        # read through the configured artifact store (S3 or fs), not just the local dir.
+        # Only called once the run succeeded: drop whatever was cached within the TTL
+        # (e.g. the early partial bundle) so the final one is read.
+        evidence_cache.invalidate(incident_id)
+        out = await _load_evidence(incident_id)
+        if out.get("found"):
+            out["artifact"] = out.pop("bundle").model_dump()
+            if "stats" in out:
+                out["stats"] = out["stats"].as_dict()
+        return out
+
+    result = await triage_incident_run(
         incident_id=incident_id,
         service=service,
         alerts_fetch_active=alerts_fetch_active,
         airflow_trigger_incident_dag=airflow_trigger_incident_dag,
-        airflow_get_incident_artifact=airflow_get_incident_artifact,
+        airflow_get_incident_artifact=_get_artifact,
+        airflow_get_dag_run=_get_dag_run,
+        tracker=dag_runs,
+        wait_seconds=CFG.triage_run_wait_seconds,
         # tickets_create=tickets_create,  # uncomment when you wire Jira mock tool
     )
 
@@ -52,144 +179,431 @@ def incident_triage_run(incident_id: str, service: str) -> dict:
     return result
 
 
-@mcp.tool()
-def alerts_fetch_active(services: list[str] = None, since_minutes: int = 30, max_alerts: int = 50) -> dict:
+@tool()
+async def alerts_fetch_active(
+    services: list[str] = None,
+    since_minutes: int = 30,
+    max_alerts: int = 50,
+    max_groups: int | None = None,
+    include_alerts: bool = False,
+    since_cursor: str | None = None,
+) -> dict:
+    """
+    Active alerts collapsed into groups (service + name + signal metric per
+    ALERT_GROUP_WINDOW_SECONDS bucket) with counts, first/last seen and peak value.
+    Groups cover every alert in the window; at most max_groups groups are returned,
+    most urgent first, and raw alerts (the max_alerts newest) only with include_alerts=True.
+    Pass the returned cursor back as since_cursor to get only alerts created,
+    updated or resolved since that call.
+    """
     services = services or []
-    args = {"services":services, "since_minutes": since_minutes, "max_alerts": max_alerts}
+    max_groups = CFG.alert_group_max_groups if max_groups is None else max_groups
+    args = {
+        "services": services,
+        "since_minutes": since_minutes,
+        "max_alerts": max_alerts,
+        "max_groups": max_groups,
+        "since_cursor": since_cursor,
+    }
     corr = audit.write("alerts.fetch_active", args, ok=True)
 
-    alerts = datadog.fetch_active_alerts(services, since_minutes, max_alerts)
-    by_service = {}
-    for a in alerts:
-        by_service.setdefault(a["service"], []).append(a["alert_id"])
-
-    return {"correlation_id": corr, "alerts": alerts, "grouping": {"by_service": by_service}}
+    # max_alerts caps what is returned, not what is synced or grouped
+    await anyio.to_thread.run_sync(alert_store.sync, services, since_minutes)
+    delta = alert_store.changes_since(since_cursor, services, max_alerts) if since_cursor else None
+    if delta is not None and not delta["reset"]:
+        alerts, cursor = delta["alerts"], delta["cursor"]
+        extra = {"reset": False, "has_more": delta["has_more"]}
+        grouping = group_alerts(alerts, window_seconds=CFG.alert_group_window_seconds, max_groups=max_groups)
+    else:
+        # no cursor, or one this store can't continue from: answer with the full window
+        cursor = alert_store.cursor
+        extra = {"reset": True, "has_more": False} if delta is not None else {}
+
+        def _window() -> tuple[dict, list[dict]]:
+            # one snapshot of the whole window: every alert is grouped, only the newest are kept raw
+            window = list(alert_store.iter_active(services, since_minutes))
+            grouped = group_alerts(window, window_seconds=CFG.alert_group_window_seconds, max_groups=max_groups)
+            return grouped, newest(window, max_alerts)
+
+        grouping, alerts = await anyio.to_thread.run_sync(_window)
+
+    out = {"correlation_id": corr, "cursor": cursor, **extra, "grouping": grouping}
+    if include_alerts:
+        out["alerts"] = alerts
+    return out
 
 
-@mcp.tool()
-def service_health_snapshot(service: str, start_iso: str, end_iso: str) -> dict:
+@tool()
+async def service_health_snapshot(service: str, start_iso: str, end_iso: str) -> dict:
     args = {"service": service, "start_iso": start_iso, "end_iso": end_iso}
     corr = audit.write("service.health_snapshot", args, ok=True)
 
     snap = datadog.health_snapshot(service, start_iso, end_iso)
     return {"correlation_id": corr, "snapshot": snap}
 
-@mcp.tool()
-def runbooks_search(query: str, limit: int = 5) -> dict:
-    args = {"query": query, "limit": limit}
+@tool()
+async def runbooks_search(query: str, limit: int = 5) -> dict:
+    args = {"query": query, "limit": limit, "runbooks_dir": CFG.runbooks_dir}
     corr = audit.write("runbooks.search", args, ok=True)
 
-    results = runbooks.search(query, limit)
-    return {"correlation_id": corr, "results": results}
+    # BM25 index built on first use, refreshed by mtime; RUNBOOKS_SEARCH_MODE=semantic|hybrid
+    # adds one matrix-vector product over the chunk vectors. Pool processes keep their own index.
+    results = await cpu_pool.run(search_shared, runbooks.spec, query, limit)
+    return {"correlation_id": corr, "mode": runbooks.search_mode, "results": results}
 
-@mcp.tool()
-def ping(message: str = "hello") -> dict:
+@tool()
+async def ping(message: str = "hello") -> dict:
     return {"ok": True, "message": message}
 
-@mcp.tool()
-def airflow_trigger_incident_dag(incident_id: str, service: str) -> dict:
-    dag_id = "incident_evidence_v1"
+@tool()
+async def airflow_trigger_incident_dag(incident_id: str, service: str) -> dict:
+    dag_id = EVIDENCE_DAG_ID
     conf = {"incident_id": incident_id, "service": service}
     corr = audit.write("airflow.trigger_incident_dag", {"dag_id": dag_id, "conf": conf}, ok=True)
 
-    run = airflow.trigger_dag(dag_id, conf)
+    run = await airflow.trigger_dag(dag_id, conf)
     return {"correlation_id": corr, "dag_id": dag_id, "dag_run": run}
 
-@mcp.tool()
-def airflow_get_incident_artifact(incident_id: str) -> dict:
+@tool()
+async def airflow_trigger_incident_dags(incidents: list[dict]) -> dict:
+    """
+    Fan out evidence DAG runs for many incidents at once.
+    incidents: [{"incident_id": "...", "service": "..."}, ...]
+    """
+    dag_id = EVIDENCE_DAG_ID
+    confs = [{"incident_id": i["incident_id"], "service": i["service"]} for i in incidents]
+    corr = audit.write("airflow.trigger_incident_dags", {"dag_id": dag_id, "confs": confs}, ok=True)
+
+    runs = await airflow.trigger_dags(dag_id, confs)
+    return {
+        "correlation_id": corr,
+        "dag_id": dag_id,
+        "triggered": sum(1 for r in runs if r["ok"]),
+        "failed": sum(1 for r in runs if not r["ok"]),
+        "runs": runs,
+    }
+
+@tool()
+async def airflow_get_incident_artifact(incident_id: str) -> dict:
     corr = audit.write("airflow.get_incident_artifact", {"incident_id": incident_id}, ok=True)
 
-    artifact_dir = Path(os.getenv("AIRFLOW_ARTIFACT_DIR", "/airflow_artifacts"))
-    path = artifact_dir / f"{incident_id}.json"
-    if not path.exists():
-        return {"correlation_id": corr, "found": False, "path": str(path)}
+    def _read() -> dict:
+        # v1 .json or v2 .json.gz / .json.zst, decoded like every other evidence read
+        out = read_bundle(CFG.artifact_dir, incident_id)
+        if out["found"]:
+            out["artifact"] = json.loads(out.pop("raw"))
+        return out
+
+    out = await anyio.to_thread.run_sync(_read)
+    if not out["found"]:
+        return {"correlation_id": corr, "found": False, "path": out["path"]}
+    return {"correlation_id": corr, "found": True, "path": out["path"], "artifact": out["artifact"]}
+
+def http_app():
+    """ASGI app for one HTTP worker (uvicorn --factory); each worker process imports this module itself."""
+    return mcp.streamable_http_app()
+
+
+def _serve_http() -> None:
+    import uvicorn
+
+    # MCP_WORKERS > 1: uvicorn's supervisor spawns that many processes on one listening
+    # socket (each imports this module and builds its own caches) and restarts any that die.
+    # On SIGTERM workers stop accepting, then in-flight calls get up to
+    # MCP_GRACEFUL_SHUTDOWN_SECONDS to finish.
+    uvicorn.run(
+        "incident_triage_mcp.server:http_app" if _multi_worker else http_app(),
+        factory=_multi_worker,
+        host=_mcp_host,
+        port=_mcp_port,
+        workers=CFG.mcp_workers if _multi_worker else None,
+        timeout_graceful_shutdown=CFG.mcp_graceful_shutdown_seconds,
+        log_level=mcp.settings.log_level.lower(),
+    )
 
-    data = json.loads(path.read_text(encoding="utf-8"))
-    return {"correlation_id": corr, "found": True, "path": str(path), "artifact": data}
 
 def main() -> None:
     # stdio by default; for HTTP:
     # MCP_TRANSPORT=streamable-http python -m incident_triage_mcp.server
+    # MCP_WORKERS=4 (or 0 = one per CPU) serves HTTP from several processes
     transport = os.getenv("MCP_TRANSPORT", "stdio")
+    if transport == "streamable-http":
+        _serve_http()
+        return
     mcp.run(transport=transport)
 
 
-@mcp.tool()
-def evidence_get_bundle(incident_id: str) -> dict:
-    artifact_dir = os.getenv("AIRFLOW_ARTIFACT_DIR", "/airflow_artifacts")
-    corr = audit.write("evidence.get_bundle", {"incident_id": incident_id, "artifact_dir": artifact_dir}, ok=True)
-    out = load_bundle(artifact_dir, incident_id)
-    out["correlation_id"] = corr
-    return out
 
-@mcp.tool()
-def runbooks_search(query: str, limit: int = 5) -> dict:
-    runbooks_dir = os.getenv("RUNBOOKS_DIR", "/runbooks")
-    corr = audit.write("runbooks.search", {"query": query, "limit": limit, "runbooks_dir": runbooks_dir}, ok=True)
-    hits = search_local_runbooks(runbooks_dir, query, limit)
-    return {"correlation_id": corr, "results": hits}
-
-
-@mcp.tool()
-def evidence_wait_for_bundle(incident_id: str, timeout_seconds: int = 30, poll_seconds: int = 2) -> dict:
+@tool()
+async def evidence_wait_for_bundle(incident_id: str, timeout_seconds: int = 30, poll_seconds: int = 2) -> dict:
+    """
+    Wait until the bundle exists, then return it.
+    Waiters on the same incident share one HEAD/stat probe that backs off up to
+    poll_seconds and wakes early on /hooks/evidence pings or fs changes.
+    """
     corr = audit.write(
         "evidence.wait_for_bundle",
         {"incident_id": incident_id, "timeout_seconds": timeout_seconds, "poll_seconds": poll_seconds},
         ok=True,
     )
 
-    # reuse your existing evidence_get_bundle implementation
-    def _getter(iid: str) -> dict:
-        return evidence_get_bundle(iid)
+    waited = await evidence_waiter.wait(incident_id, timeout_seconds, max_backoff=poll_seconds)
+    if not waited["found"]:
+        return {
+            "correlation_id": corr,
+            "found": False,
+            "incident_id": incident_id,
+            "attempts": waited["attempts"],
+            "timeout_seconds": timeout_seconds,
+            "poll_seconds": poll_seconds,
+        }
+
+    out = await _load_evidence(incident_id)
+    if out.get("found"):
+        out["bundle"] = out["bundle"].model_dump()
+    out.update(attempts=waited["attempts"], waited_seconds=waited["waited_seconds"], correlation_id=corr)
+    return out
+
+
+@mcp.custom_route("/metrics", methods=["GET"])
+async def metrics_endpoint(request: Request) -> PlainTextResponse:
+    """Prometheus scrape target (streamable-http / sse transports)."""
+    return PlainTextResponse(metrics.REGISTRY.render(), media_type="text/plain; version=0.0.4")
+
+
+@mcp.custom_route("/hooks/evidence", methods=["POST"])
+async def evidence_webhook(request: Request) -> JSONResponse:
+    """
+    Bundle-written notifications. Accepts {"incident_id": "...", "index": {...}} (DAG ping)
+    or an S3/MinIO event payload ({"Records": [{"s3": {"object": {"key": "evidence/v1/<id>.json"}}}]}).
+    """
+    if CFG.evidence_webhook_token and request.headers.get("authorization") != f"Bearer {CFG.evidence_webhook_token}":
+        return JSONResponse({"ok": False, "error": "unauthorized"}, status_code=401)
+    try:
+        payload = await request.json()
+    except ValueError:
+        return JSONResponse({"ok": False, "error": "invalid json"}, status_code=400)
+
+    ids = [payload["incident_id"]] if payload.get("incident_id") else []
+    if isinstance(payload.get("index"), dict):
+        try:
+            await anyio.to_thread.run_sync(incident_index.upsert, payload["index"])
+        except (KeyError, ValueError) as e:
+            return JSONResponse({"ok": False, "error": f"invalid index record: {e}"}, status_code=400)
+    for rec in payload.get("Records") or []:
+        key = unquote_plus(((rec.get("s3") or {}).get("object") or {}).get("key", ""))
+        if key.startswith("evidence/") and key.endswith(".json"):
+            ids.append(key.rsplit("/", 1)[-1][: -len(".json")])
+        elif key.startswith("index/"):
+            incident_index.mark_stale()
+
+    woken = 0
+    for iid in ids:
+        evidence_cache.invalidate(iid)
+        woken += evidence_waiter.notify(iid)
+    return JSONResponse({"ok": True, "incident_ids": ids, "woken": woken})
+
+
+
+async def _load_evidence(incident_id: str, sha256: str | None = None) -> dict:
+    # cache hits return without I/O; S3 GETs / file reads run on a worker thread
+    return await anyio.to_thread.run_sync(evidence_cache.get, incident_id, sha256)
+
+
+@tool()
+async def evidence_get_bundle(incident_id: str) -> dict:
+    store = CFG.artifact_store
+    corr = audit.write("evidence.get_bundle", {"incident_id": incident_id, "store": store}, ok=True)
 
-    out = wait_for(_getter, incident_id, timeout_seconds=timeout_seconds, poll_seconds=poll_seconds)
+    # S3: ETag-revalidated; fs: mtime-revalidated (AIRFLOW_ARTIFACT_DIR)
+    out = await _load_evidence(incident_id)
+    if not out.get("found"):
+        out["correlation_id"] = corr
+        return out
+    out["bundle"] = out["bundle"].model_dump()
+    if "stats" in out:
+        # bundle over EVIDENCE_STREAM_THRESHOLD_BYTES: alerts/signals capped, rest via evidence_get_bundle_page
+        out["stats"] = out["stats"].as_dict()
     out["correlation_id"] = corr
     return out
 
 
+def _page_evidence(incident_id: str, section: str, offset: int, limit: int) -> dict:
+    # always streamed (stream_over=-1): only the requested page is materialized
+    if CFG.artifact_store == "s3":
+        out = artifacts.read_evidence_bundle(incident_id, stream_over=-1)
+    else:
+        out = read_bundle(CFG.artifact_dir, incident_id, stream_over=-1)
+    if not out.get("found"):
+        return out
+    location = {k: out[k] for k in ("uri", "path") if k in out}
+    with closing(out["stream"]) as stream:
+        return {"found": True, **location, **page_bundle_stream(stream, section, offset, limit)}
 
-@mcp.tool()
-def evidence_get_bundle(incident_id: str) -> dict:
-    store = os.getenv("ARTIFACT_STORE", "s3").lower()
-    corr = audit.write("evidence.get_bundle", {"incident_id": incident_id, "store": store}, ok=True)
 
-    if store == "s3":
-        out = read_evidence_bundle(incident_id)
-        if not out.get("found"):
-            out["correlation_id"] = corr
-            return out
-        bundle = EvidenceBundle.model_validate(out["raw"])
-        return {"correlation_id": corr, "found": True, "uri": out["uri"], "bundle": bundle.model_dump()}
-
-    # optional fs fallback if you still want it
-    artifact_dir = os.getenv("AIRFLOW_ARTIFACT_DIR", "./airflow/artifacts")
-    out = load_bundle(artifact_dir, incident_id)
+@tool()
+async def evidence_get_bundle_page(incident_id: str, section: str = "alerts", offset: int = 0, limit: int = 100) -> dict:
+    """
+    Paginated alerts or signals of an evidence bundle (section="alerts"|"signals").
+    Use for bundles whose evidence_get_bundle result reports stats.truncated.
+    """
+    limit = max(1, min(limit, CFG.evidence_max_items))
+    corr = audit.write(
+        "evidence.get_bundle_page",
+        {"incident_id": incident_id, "section": section, "offset": offset, "limit": limit},
+        ok=True,
+    )
+    if section not in {"alerts", "signals"}:
+        return {"ok": False, "error": "section must be 'alerts' or 'signals'", "correlation_id": corr}
+    out = await anyio.to_thread.run_sync(_page_evidence, incident_id, section, max(0, offset), limit)
     out["correlation_id"] = corr
     return out
 
 
+@tool()
+async def evidence_cache_stats() -> dict:
+    """Evidence bundle cache metrics (hits, misses, revalidations, evictions, size), summary sources and CPU pool counters."""
+    return {"ok": True, "cache": evidence_cache.stats(), "summaries": summaries.stats(), "cpu_pool": cpu_pool.stats()}
+
 
-@mcp.tool()
-def incident_triage_summary(incident_id: str) -> dict:
+
+@tool()
+async def incident_triage_summary(incident_id: str) -> dict:
     """
     Deterministic (non-LLM) summary of an incident from the Evidence Bundle.
     Great for recruiter demos and for agent planning.
     """
     corr = audit.write("incident.triage_summary", {"incident_id": incident_id}, ok=True)
 
-    # Reuse your existing evidence getter (S3/MinIO)
-    evidence = evidence_get_bundle(incident_id)
-
-    if not evidence.get("found"):
-        evidence["correlation_id"] = corr
-        return evidence
-
-    bundle = evidence.get("bundle") or {}
-    uri = evidence.get("uri")
-    out = build_triage_summary(bundle, evidence_uri=uri)
+    out = await _triage_summary(incident_id)
     out["correlation_id"] = corr
     return out
 
 
+@tool()
+async def incidents_list(
+    service: str | None = None,
+    since: str | None = None,
+    priority: str | None = None,
+    status: str | None = None,
+    limit: int = 50,
+) -> dict:
+    """
+    Recent incidents from the incident index, newest first, without scanning the artifact store.
+    since: ISO-8601 timestamp or relative window ("30m", "6h", "7d"; default 24h).
+    priority: "P2" returns P1 and P2. status: triggered | warning | resolved | unknown.
+    """
+    limit = max(1, min(limit, 500))
+    corr = audit.write(
+        "incidents.list",
+        {"service": service, "since": since, "priority": priority, "status": status, "limit": limit},
+        ok=True,
+    )
+    try:
+        since_ts = parse_since(since)
+    except ValueError:
+        return {"ok": False, "error": "since must be ISO-8601 or like '30m', '6h', '7d'", "correlation_id": corr}
+
+    # throttled incremental sync (INCIDENT_INDEX_SYNC_SECONDS); webhook pings upsert in between
+    await anyio.to_thread.run_sync(incident_index.sync)
+    rows = await anyio.to_thread.run_sync(partial(incident_index.list, service, since_ts, priority, status, limit))
+    return {"ok": True, "count": len(rows), "incidents": rows, "correlation_id": corr}
+
+
+def _read_raw(incident_id: str) -> dict:
+    if CFG.artifact_store == "s3":
+        return artifacts.read_evidence_bundle(incident_id, stream_over=CFG.evidence_stream_threshold_bytes)
+    return read_bundle(CFG.artifact_dir, incident_id, stream_over=CFG.evidence_stream_threshold_bytes)
+
+
+async def _summarize_raw(incident_id: str) -> dict | None:
+    """
+    Summary straight from the bundle's JSON bytes: on a CPU pool process when the
+    bundle is at least CPU_POOL_MIN_BYTES (only the bytes go over, only the summary
+    comes back), else on a worker thread. None for bundles that have to go through
+    the evidence cache: missing, or over the streaming threshold.
+    """
+    out = await anyio.to_thread.run_sync(_read_raw, incident_id)
+    if "stream" in out:
+        out["stream"].close()
+    if "raw" not in out:
+        return None
+    if cpu_pool.processes and len(out["raw"]) >= cpu_pool.min_bytes:
+        return await cpu_pool.run(summarize_raw, out["raw"], out.get("uri"))
+    return await anyio.to_thread.run_sync(summarize_raw, out["raw"], out.get("uri"))
+
+
+async def _triage_summary(incident_id: str) -> dict:
+    """
+    Summary for the bundle's current content hash: served from memory or the
+    DAG-materialized summaries/v1/<id>.json when the hash matches, else computed
+    once from the validated bundle and remembered for that hash.
+    """
+    cached = await anyio.to_thread.run_sync(summaries.get, incident_id)
+    if cached.get("summary") is not None:
+        return {**cached["summary"], "summary_source": cached["source"]}
+
+    # a cached copy not known to match this hash is revalidated (ETag / mtime), not summarized blindly
+    sha = cached.get("bundle_sha256")
+    summary = None
+    if cpu_pool.processes and evidence_cache.peek(incident_id, sha) is None:
+        # no matching validated copy here: validate + summarize the bundle bytes on the pool
+        summary = await _summarize_raw(incident_id)
+    if summary is None:
+        evidence = await _load_evidence(incident_id, sha)
+        if not evidence.get("found"):
+            return evidence
+        summary = await anyio.to_thread.run_sync(
+            lambda: summarize_bundle(evidence["bundle"], evidence_uri=evidence.get("uri"), stats=evidence.get("stats")).model_dump()
+        )
+    if sha is not None:
+        summaries.put(incident_id, sha, summary)
+    return {**summary, "summary_source": "computed"}
+
+
+@tool()
+async def incident_triage_summary_batch(incident_ids: list[str], max_concurrency: int = 8) -> dict:
+    """
+    incident_triage_summary for many incidents in one call.
+    Bundles are fetched concurrently (bounded by max_concurrency, capped by
+    TRIAGE_BATCH_MAX_CONCURRENCY); one failing incident does not fail the batch.
+    """
+    ids = list(dict.fromkeys(incident_ids))[: CFG.triage_batch_max_incidents]
+    concurrency = max(1, min(max_concurrency, CFG.triage_batch_max_concurrency))
+    corr = audit.write(
+        "incident.triage_summary_batch",
+        {"incident_ids": ids, "max_concurrency": concurrency},
+        ok=True,
+    )
+
+    started = time.perf_counter()
+    sem = asyncio.Semaphore(concurrency)
+    results: dict[str, dict] = {}
+    errors: dict[str, dict] = {}
+
+    async def _one(iid: str) -> None:
+        try:
+            async with sem:
+                out = await _triage_summary(iid)
+            if out.get("found") is False:
+                errors[iid] = {"error": "not_found", **{k: out[k] for k in ("uri", "path") if k in out}}
+                return
+            results[iid] = out
+        except Exception as e:  # partial failure: report per incident, keep the rest
+            errors[iid] = {"error": type(e).__name__, "message": str(e)}
+
+    await asyncio.gather(*(_one(iid) for iid in ids))
+
+    return {
+        "correlation_id": corr,
+        "requested": len(ids),
+        "succeeded": len(results),
+        "failed": len(errors),
+        "results": results,
+        "errors": errors,
+        "latency_ms": round((time.perf_counter() - started) * 1000, 2),
+    }
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import heapq
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# most urgent first; unknown values sort last
+_PRIORITY_RANK = {"P1": 0, "P2": 1, "P3": 2, "P4": 3}
+_STATUS_RANK = {"triggered": 0, "warning": 1, "resolved": 2}
+SAMPLE_IDS = 3
+
+
+def _ts(alert: Dict[str, Any]) -> float:
+    raw = alert.get("started_at") or alert.get("started_at_iso")
+    if not raw:
+        return 0.0
+    try:
+        dt = datetime.fromisoformat(str(raw).replace("Z", "+00:00"))
+    except ValueError:
+        return 0.0
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
+def _iso(ts: float) -> Optional[str]:
+    return datetime.fromtimestamp(ts, timezone.utc).isoformat() if ts else None
+
+
+def fingerprint(alert: Dict[str, Any]) -> Tuple[str, str, str]:
+    """Alerts that differ only in id, timestamp or value are the same problem: service + name + signal metric."""
+    signal = alert.get("signal") or {}
+    return (str(alert.get("service", "")), str(alert.get("name", "")), str(signal.get("metric", "")))
+
+
+@dataclass
+class _Group:
+    service: str
+    name: str
+    metric: str
+    window_start: float
+    count: int = 0
+    first_seen: float = 0.0
+    last_seen: float = 0.0
+    priority: str = "P4"
+    status: str = "resolved"
+    peak_value: Optional[float] = None
+    sample_alert_ids: List[str] = field(default_factory=list)
+
+    def add(self, alert: Dict[str, Any], ts: float) -> None:
+        self.count += 1
+        if ts and (not self.first_seen or ts < self.first_seen):
+            self.first_seen = ts
+        self.last_seen = max(self.last_seen, ts)
+        priority = alert.get("priority", "P4")
+        if _PRIORITY_RANK.get(priority, 9) < _PRIORITY_RANK.get(self.priority, 9):
+            self.priority = priority
+        status = alert.get("status", "resolved")
+        if _STATUS_RANK.get(status, 9) < _STATUS_RANK.get(self.status, 9):
+            self.status = status
+        value = (alert.get("signal") or {}).get("value")
+        if isinstance(value, (int, float)) and (self.peak_value is None or value > self.peak_value):
+            self.peak_value = value
+        if len(self.sample_alert_ids) < SAMPLE_IDS and alert.get("alert_id"):
+            self.sample_alert_ids.append(alert["alert_id"])
+
+    def as_dict(self, window_seconds: float) -> Dict[str, Any]:
+        return {
+            "fingerprint": f"{self.service}/{self.name}/{self.metric}",
+            "service": self.service,
+            "name": self.name,
+            "metric": self.metric or None,
+            "window": {"start": _iso(self.window_start), "seconds": window_seconds},
+            "count": self.count,
+            "first_seen": _iso(self.first_seen),
+            "last_seen": _iso(self.last_seen),
+            "priority": self.priority,
+            "status": self.status,
+            "peak_value": self.peak_value,
+            "sample_alert_ids": self.sample_alert_ids,
+        }
+
+
+class AlertGrouper:
+    """
+    Streaming dedup/grouping of alerts from any AlertsProvider.
+    - key: fingerprint (service + name + signal metric) x fixed time bucket of
+      window_seconds, so a flapping alert that returns hours later is a new group
+    - add()/extend() are O(1) per alert; memory is O(distinct groups), never O(alerts)
+    - result() ranks groups by priority, status, then volume and caps the output
+    """
+
+    def __init__(self, window_seconds: float = 300.0) -> None:
+        self.window_seconds = window_seconds
+        self.total = 0
+        self._groups: Dict[Tuple[str, str, str, int], _Group] = {}
+
+    def add(self, alert: Dict[str, Any]) -> None:
+        ts = _ts(alert)
+        bucket = int(ts // self.window_seconds) if self.window_seconds > 0 else 0
+        key = (*fingerprint(alert), bucket)
+        group = self._groups.get(key)
+        if group is None:
+            group = self._groups[key] = _Group(*key[:3], window_start=bucket * self.window_seconds)
+        group.add(alert, ts)
+        self.total += 1
+
+    def extend(self, alerts: Iterable[Dict[str, Any]]) -> "AlertGrouper":
+        for a in alerts:
+            self.add(a)
+        return self
+
+    def result(self, max_groups: int = 50) -> Dict[str, Any]:
+        kept = heapq.nsmallest(
+            max(0, max_groups),
+            self._groups.values(),
+            key=lambda g: (
+                _PRIORITY_RANK.get(g.priority, 9),
+                _STATUS_RANK.get(g.status, 9),
+                -g.count,
+                -g.last_seen,
+            ),
+        )
+        by_service: Dict[str, Dict[str, int]] = {}
+        for g in self._groups.values():
+            svc = by_service.setdefault(g.service, {"alerts": 0, "groups": 0})
+            svc["alerts"] += g.count
+            svc["groups"] += 1
+        return {
+            "groups": [g.as_dict(self.window_seconds) for g in kept],
+            "total_alerts": self.total,
+            "total_groups": len(self._groups),
+            "truncated": len(self._groups) > len(kept),
+            "by_service": by_service,
+        }
+
+
+def group_alerts(alerts: Iterable[Dict[str, Any]], window_seconds: float = 300.0, max_groups: int = 50) -> Dict[str, Any]:
+    return AlertGrouper(window_seconds).extend(alerts).result(max_groups)
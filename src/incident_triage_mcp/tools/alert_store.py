@@ -0,0 +1,308 @@
+from __future__ import annotations
+
+import heapq
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+try:
+    import orjson
+except ImportError:  # optional fast JSON backend
+    orjson = None
+
+PAGE_SIZE = 1000
+DECODED_MAX = 200_000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS alerts (
+    alert_id TEXT PRIMARY KEY,
+    seq INTEGER NOT NULL,
+    service TEXT NOT NULL,
+    status TEXT NOT NULL,
+    started_at TEXT NOT NULL,
+    touched_at TEXT NOT NULL,
+    body TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS alerts_seq ON alerts (seq);
+CREATE INDEX IF NOT EXISTS alerts_started ON alerts (started_at);
+CREATE INDEX IF NOT EXISTS alerts_touched ON alerts (touched_at);
+CREATE TABLE IF NOT EXISTS store_state (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    epoch TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    upstream_cursor TEXT,
+    last_sync REAL NOT NULL
+);
+"""
+
+# unchanged re-deliveries keep their row (and sequence number); seq values they were offered are simply skipped
+_UPSERT = """
+INSERT INTO alerts VALUES (?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (alert_id) DO UPDATE SET
+    seq = excluded.seq, service = excluded.service, status = excluded.status,
+    started_at = excluded.started_at, touched_at = excluded.touched_at, body = excluded.body
+WHERE alerts.body != excluded.body
+"""
+
+
+def _dumps(alert: Dict[str, Any]) -> str:
+    # canonical form: the upsert compares bodies to skip unchanged re-deliveries
+    if orjson is not None:
+        return orjson.dumps(alert, option=orjson.OPT_SORT_KEYS).decode("utf-8")
+    return json.dumps(alert, sort_keys=True, separators=(",", ":"))
+
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+
+def newest(alerts: Iterable[Dict[str, Any]], n: int) -> List[Dict[str, Any]]:
+    """The n most recently started alerts, newest first."""
+    return heapq.nlargest(n, alerts, key=lambda a: a.get("started_at") or "")
+
+
+class AlertStore:
+    """
+    Local copy of the alert feed in SQLite, kept current by merging deltas.
+
+    - sync() pulls only changes since the upstream cursor (fetch_alerts_since);
+      providers without it fall back to a full-window fetch, diffed locally
+    - every alert whose content changed gets the next store sequence number
+      (indexed), so changes_since(cursor) reads only rows after the cursor: O(delta)
+    - resolved / stale alerts past retention_minutes are deleted on sync
+
+    Client cursors are "<store epoch>:<seq>". With db_path a file, every process
+    that opens it (the MCP_WORKERS workers) shares the rows, sequence, epoch and
+    upstream cursor, so a cursor handed out by one worker is valid on all of them
+    and only one worker per sync_seconds pays the upstream call. With ":memory:"
+    the store is per process; a cursor from another store (or a restarted
+    in-memory one) is answered with reset=True.
+    """
+
+    def __init__(
+        self,
+        provider,
+        retention_minutes: int = 120,
+        sync_seconds: float = 0.0,
+        db_path: str = ":memory:",
+    ) -> None:
+        self.provider = provider
+        self.incremental = hasattr(provider, "fetch_alerts_since")
+        self.retention = timedelta(minutes=retention_minutes)
+        self.sync_seconds = sync_seconds
+        self.db_path = db_path
+        if db_path != ":memory:":
+            Path(db_path).expanduser().parent.mkdir(parents=True, exist_ok=True)
+        # autocommit connection; writes take BEGIN IMMEDIATE so workers queue up instead of failing on upgrade
+        self._db = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None, timeout=30.0)
+        self._lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+        # seq -> decoded body, see _remember
+        self._decoded: Dict[int, Dict[str, Any]] = {}
+        self._counters = {"syncs": 0, "upstream_alerts": 0, "changed": 0, "expired": 0}
+        with self._lock:
+            if db_path != ":memory:":
+                self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.executescript(_SCHEMA)
+        with self._write() as db:
+            db.execute(
+                "INSERT OR IGNORE INTO store_state VALUES (1, ?, 0, NULL, 0)",
+                (uuid.uuid4().hex[:8],),
+            )
+        self.epoch = self._state()[0]
+
+    @contextmanager
+    def _write(self) -> Iterator[sqlite3.Connection]:
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._db
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+            self._db.execute("COMMIT")
+
+    def _state(self) -> tuple:
+        with self._lock:
+            return self._db.execute("SELECT epoch, seq, upstream_cursor, last_sync FROM store_state").fetchone()
+
+    # -- feed ------------------------------------------------------------------
+
+    def sync(self, services: Optional[List[str]] = None, since_minutes: int = 30, max_alerts: int = PAGE_SIZE) -> int:
+        """Merge upstream changes; returns how many alerts changed locally."""
+        with self._sync_lock:
+            # claim this sync interval for every process sharing the database
+            with self._write() as db:
+                last_sync, upstream_cursor = db.execute("SELECT last_sync, upstream_cursor FROM store_state").fetchone()
+                if self.sync_seconds and time.time() - last_sync < self.sync_seconds:
+                    return 0
+                db.execute("UPDATE store_state SET last_sync = ?", (time.time(),))
+
+            changed = 0
+            if self.incremental:
+                while True:
+                    page = self.provider.fetch_alerts_since(upstream_cursor, PAGE_SIZE)
+                    upstream_cursor = page["cursor"]
+                    changed += self._merge(page["alerts"], upstream_cursor=upstream_cursor)
+                    if not page.get("has_more"):
+                        break
+            else:
+                alerts = self.provider.fetch_active_alerts(services or [], since_minutes, max_alerts)
+                changed = self._merge(alerts)
+                if len(alerts) < max_alerts:
+                    # a complete snapshot of this scope: open alerts it no longer lists are resolved
+                    changed += self._resolve_missing(alerts, services, since_minutes)
+            self._expire()
+            with self._lock:
+                self._counters["syncs"] += 1
+            return changed
+
+    def _merge(self, alerts: List[Dict[str, Any]], upstream_cursor: Optional[str] = None) -> int:
+        with self._write() as db:
+            (seq,) = db.execute("SELECT seq FROM store_state").fetchone()
+            rows = []
+            for alert in alerts:
+                seq += 1
+                rows.append((
+                    alert["alert_id"],
+                    seq,
+                    alert.get("service") or "",
+                    alert.get("status") or "",
+                    alert.get("started_at") or "",
+                    alert.get("updated_at") or alert.get("started_at") or "",
+                    _dumps(alert),
+                ))
+            before = db.total_changes
+            db.executemany(_UPSERT, rows)
+            changed = db.total_changes - before
+            if upstream_cursor is None:
+                db.execute("UPDATE store_state SET seq = ?", (seq,))
+            else:
+                db.execute("UPDATE store_state SET seq = ?, upstream_cursor = ?", (seq, upstream_cursor))
+            self._counters["upstream_alerts"] += len(alerts)
+            self._counters["changed"] += changed
+        return changed
+
+    def _resolve_missing(self, alerts: List[Dict[str, Any]], services: Optional[List[str]], since_minutes: int) -> int:
+        present = {a["alert_id"] for a in alerts}
+        gone = [
+            dict(a, status="resolved")
+            for a in self.iter_active(services, since_minutes)
+            if a["alert_id"] not in present
+        ]
+        return self._merge(gone) if gone else 0
+
+    def _expire(self) -> None:
+        cutoff = (datetime.now(timezone.utc) - self.retention).isoformat()
+        with self._write() as db:
+            expired = db.execute("DELETE FROM alerts WHERE touched_at < ?", (cutoff,)).rowcount
+            self._counters["expired"] += expired
+
+    # -- reads -----------------------------------------------------------------
+
+    @property
+    def cursor(self) -> str:
+        return f"{self.epoch}:{self._state()[1]}"
+
+    def _parse_cursor(self, cursor: str) -> Optional[int]:
+        epoch, _, seq = cursor.partition(":")
+        if epoch != self.epoch or not seq.isdigit():
+            return None
+        return int(seq)
+
+    @staticmethod
+    def _scope(services: Optional[List[str]]) -> tuple[str, list]:
+        wanted = sorted(set(services or []))
+        if not wanted:
+            return "", []
+        return f" AND service IN ({','.join('?' * len(wanted))})", wanted
+
+    def iter_active(self, services: Optional[List[str]], since_minutes: int) -> Iterator[Dict[str, Any]]:
+        """Every open alert in the window, uncapped and unordered (a snapshot taken at call time)."""
+        since = (datetime.now(timezone.utc) - timedelta(minutes=since_minutes)).isoformat()
+        scope, params = self._scope(services)
+        cache = self._decoded
+        with self._lock:
+            # one read transaction, so bodies fetched for the misses match the seqs listed
+            self._db.execute("BEGIN")
+            try:
+                seqs = [seq for (seq,) in self._db.execute(
+                    f"SELECT seq FROM alerts WHERE started_at >= ? AND status != 'resolved'{scope}",
+                    (since, *params),
+                )]
+                missing = [seq for seq in seqs if seq not in cache]
+                bodies = dict(self._bodies(missing))
+            finally:
+                self._db.execute("COMMIT")
+        fresh = {seq: cache.get(seq) or _loads(bodies[seq]) for seq in seqs}
+        self._remember(fresh, complete=not scope)
+        return iter(fresh.values())
+
+    def _bodies(self, seqs: List[int]) -> Iterator[tuple]:
+        for i in range(0, len(seqs), 500):
+            chunk = seqs[i:i + 500]
+            yield from self._db.execute(
+                f"SELECT seq, body FROM alerts WHERE seq IN ({','.join('?' * len(chunk))})", chunk
+            )
+
+    def _remember(self, fresh: Dict[int, Dict[str, Any]], complete: bool = False) -> None:
+        """
+        Keep decoded bodies keyed by seq: a seq names one version of one alert,
+        so a hit is never stale. A complete scan (every service) replaces the
+        cache, which drops versions superseded or expired since, including by
+        other workers.
+        """
+        if complete or len(self._decoded) + len(fresh) > DECODED_MAX:
+            self._decoded = fresh
+        else:
+            self._decoded.update(fresh)
+
+    def active(self, services: Optional[List[str]], since_minutes: int, max_alerts: int) -> List[Dict[str, Any]]:
+        return newest(self.iter_active(services, since_minutes), max_alerts)
+
+    def changes_since(self, cursor: str, services: Optional[List[str]], max_alerts: int) -> Dict[str, Any]:
+        """
+        Alerts created, updated or resolved after `cursor`, newest first (resolved
+        ones included so the caller can drop them). Over max_alerts, the cursor
+        returned is that of the newest change included, and the oldest changes
+        come first, so nothing is skipped.
+        """
+        after = self._parse_cursor(cursor)
+        if after is None:
+            return {"alerts": self.active(services, 24 * 60, max_alerts), "cursor": self.cursor, "reset": True, "has_more": False}
+        scope, params = self._scope(services)
+        with self._lock:
+            (head,) = self._db.execute("SELECT seq FROM store_state").fetchone()
+            rows = self._db.execute(
+                f"SELECT seq, body FROM alerts WHERE seq > ?{scope} ORDER BY seq LIMIT ?",
+                (after, *params, max_alerts + 1),
+            ).fetchall()
+        more = len(rows) > max_alerts
+        if more:
+            # hand back the oldest max_alerts changes first; the next call continues from there
+            rows = rows[:max_alerts]
+            head = rows[-1][0]
+        return {
+            "alerts": [self._decoded.get(seq) or _loads(body) for seq, body in reversed(rows)],
+            "cursor": f"{self.epoch}:{head}",
+            "reset": False,
+            "has_more": more,
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        epoch, seq, upstream_cursor, _ = self._state()
+        with self._lock:
+            (size,) = self._db.execute("SELECT COUNT(*) FROM alerts").fetchone()
+            return {
+                **self._counters,
+                "size": size,
+                "incremental": self.incremental,
+                "cursor": f"{epoch}:{seq}",
+                "upstream_cursor": upstream_cursor,
+                "db_path": self.db_path,
+            }
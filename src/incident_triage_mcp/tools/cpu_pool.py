@@ -0,0 +1,96 @@
+"""
+Execution backend for pure CPU-bound work: bundle validation + summary
+building (tools.triage.summarize_raw) and runbook scoring
+(adapters.runbooks_local.search_shared).
+
+    CPU_POOL_WORKERS=0   worker thread: keeps the event loop free, but the work
+                         still shares the GIL with every other tool call
+    CPU_POOL_WORKERS=N   ProcessPoolExecutor with N processes: heavy summaries
+                         run in parallel and no longer slow ping / alerts calls
+
+Arguments and results cross a process boundary, so callers pass compact
+inputs (the bundle's JSON bytes, a runbook config tuple) and get small dicts
+back, never model objects. Workers are spawned, not forked: the server runs
+threads (audit writer, anyio workers) that fork would copy mid-flight. Each
+worker imports the server module once when the pool starts (~1 s), then
+keeps its own runbook index for the life of the process.
+"""
+from __future__ import annotations
+
+import asyncio
+import functools
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+import anyio
+
+T = TypeVar("T")
+
+
+class CpuPool:
+    def __init__(self, workers: int = 0, min_bytes: int = 64 * 1024) -> None:
+        self.workers = workers
+        # below this, a bundle validates faster than it can be shipped to another process
+        self.min_bytes = min_bytes
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._counters = {"submitted": 0, "completed": 0, "failed": 0, "restarts": 0}
+
+    @property
+    def processes(self) -> bool:
+        return self.workers > 0
+
+    def _pool(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ProcessPoolExecutor(self.workers, mp_context=multiprocessing.get_context("spawn"))
+        return self._executor
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """fn(*args) on a pool process (or a worker thread when workers=0); fn must be module-level."""
+        if not self.processes:
+            return await anyio.to_thread.run_sync(functools.partial(fn, *args))
+        self._counters["submitted"] += 1
+        for attempt in (0, 1):
+            pool = self._pool()
+            try:
+                result = await asyncio.wrap_future(pool.submit(fn, *args))
+            except BrokenProcessPool:
+                # a worker died (OOM kill, segfault): start a fresh pool and retry once
+                self._reset(pool)
+                if attempt:
+                    self._counters["failed"] += 1
+                    raise
+                continue
+            except Exception:
+                self._counters["failed"] += 1
+                raise
+            self._counters["completed"] += 1
+            return result
+        raise AssertionError("unreachable")
+
+    def _reset(self, broken: ProcessPoolExecutor) -> None:
+        with self._lock:
+            if self._executor is broken:
+                self._executor = None
+                self._counters["restarts"] += 1
+        broken.shutdown(wait=False, cancel_futures=True)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self._counters,
+            "backend": "process" if self.processes else "thread",
+            "workers": self.workers,
+            "started": self._executor is not None,
+            "min_bytes": self.min_bytes,
+        }
@@ -1,19 +1,87 @@
 from __future__ import annotations
 
-import json
+import os
+from contextlib import closing
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple
 
 from incident_triage_mcp.domain_models import EvidenceBundle
+from incident_triage_mcp.evidence_format import FS_SUFFIXES, decoded_size, decompress, open_decoded
+from incident_triage_mcp.metrics import observe_bytes, timed
+from incident_triage_mcp.tools.evidence_stream import load_bundle_stream
 
 
-def load_bundle(artifact_dir: str, incident_id: str) -> Dict[str, Any]:
-    base = Path(artifact_dir)
-    path = base / f"{incident_id}.json"
+def locate_bundle(artifact_dir: str, incident_id: str) -> Optional[Tuple[Path, os.stat_result, str]]:
+    # v1 <id>.json, then v2 <id>.json.gz / <id>.json.zst
+    for encoding, suffix in FS_SUFFIXES.items():
+        path = Path(artifact_dir) / f"{incident_id}{suffix}"
+        try:
+            return path, path.stat(), encoding
+        except FileNotFoundError:
+            continue
+    return None
 
-    if not path.exists():
-        return {"found": False, "path": str(path)}
 
-    raw = json.loads(path.read_text(encoding="utf-8"))
-    bundle = EvidenceBundle.model_validate(raw)
-    return {"found": True, "path": str(path), "bundle": bundle.model_dump()}
\ No newline at end of file
+def _decoded_size(path: Path, st: os.stat_result, encoding: str) -> int:
+    if encoding == "identity":
+        return st.st_size
+    with path.open("rb") as f:
+        header = f.read(18)
+        f.seek(max(0, st.st_size - 4))
+        trailer = f.read(4)
+    return decoded_size(header, trailer, st.st_size, encoding)
+
+
+@timed("fs.read_bundle")
+def read_bundle(
+    artifact_dir: str,
+    incident_id: str,
+    if_mtime_ns: Optional[int] = None,
+    stream_over: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Read the raw bundle JSON bytes (validated later, straight from JSON);
+    v2 compressed files are decoded transparently.
+    With if_mtime_ns (a previously seen mtime) an unchanged file returns
+    {"not_modified": True} after a single stat(). Bundles larger than stream_over
+    bytes (uncompressed) are returned as an open binary {"stream"} (caller closes it).
+    """
+    located = locate_bundle(artifact_dir, incident_id)
+    if located is None:
+        return {"found": False, "path": str(Path(artifact_dir) / f"{incident_id}.json")}
+    path, st, encoding = located
+    mtime_ns = st.st_mtime_ns
+
+    if if_mtime_ns is not None and mtime_ns == if_mtime_ns:
+        return {"found": True, "path": str(path), "not_modified": True, "mtime_ns": mtime_ns}
+
+    if stream_over is not None and _decoded_size(path, st, encoding) > stream_over:
+        return {"found": True, "path": str(path), "mtime_ns": mtime_ns, "stream": open_decoded(path.open("rb"), encoding)}
+
+    body = path.read_bytes()
+    observe_bytes("fs.read_bundle", len(body))
+    raw = decompress(body, encoding)
+    return {"found": True, "path": str(path), "mtime_ns": mtime_ns, "raw": raw}
+
+
+def bundle_exists(artifact_dir: str, incident_id: str) -> bool:
+    return any((Path(artifact_dir) / f"{incident_id}{suffix}").is_file() for suffix in FS_SUFFIXES.values())
+
+
+def load_bundle(
+    artifact_dir: str,
+    incident_id: str,
+    stream_over: Optional[int] = 8 * 1024 * 1024,
+    max_items: int = 200,
+) -> Dict[str, Any]:
+    out = read_bundle(artifact_dir, incident_id, stream_over=stream_over)
+    if not out["found"]:
+        return out
+
+    if "stream" in out:
+        with closing(out["stream"]) as stream:
+            bundle, stats = load_bundle_stream(stream, max_items=max_items)
+        return {"found": True, "path": out["path"], "bundle": bundle.model_dump(), "stats": stats.as_dict()}
+
+    bundle = EvidenceBundle.model_validate_json(out["raw"])
+    return {"found": True, "path": out["path"], "bundle": bundle.model_dump()}
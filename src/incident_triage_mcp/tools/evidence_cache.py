@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from contextlib import closing
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+from incident_triage_mcp.domain_models import EvidenceBundle
+from incident_triage_mcp.tools.evidence import read_bundle
+from incident_triage_mcp.tools.evidence_stream import BundleStats, load_bundle_stream
+
+# fetch(incident_id, validator) -> {"found", "uri"|"path", "validator", "not_modified"?, "raw"|"stream"?}
+Fetch = Callable[[str, Optional[Any]], Dict[str, Any]]
+
+
+def s3_source(store, stream_over: Optional[int] = None) -> Fetch:
+    """Conditional GETs (IfNoneMatch=ETag) against an S3ArtifactStore."""
+    def fetch(incident_id: str, validator: Optional[Any]) -> Dict[str, Any]:
+        out = store.read_evidence_bundle(incident_id, if_none_match=validator, stream_over=stream_over)
+        out["validator"] = out.get("etag")
+        return out
+    return fetch
+
+
+def fs_source(artifact_dir: str, stream_over: Optional[int] = None) -> Fetch:
+    """mtime checks against AIRFLOW_ARTIFACT_DIR/<incident_id>.json."""
+    def fetch(incident_id: str, validator: Optional[Any]) -> Dict[str, Any]:
+        out = read_bundle(artifact_dir, incident_id, if_mtime_ns=validator, stream_over=stream_over)
+        out["validator"] = out.get("mtime_ns")
+        return out
+    return fetch
+
+
+@dataclass
+class _Entry:
+    bundle: EvidenceBundle
+    location: Dict[str, str]
+    validator: Any
+    checked_at: float
+    stats: Optional[BundleStats] = None
+    # bundle fingerprint (SummaryCache scheme) this copy is known to match, when a caller supplied one
+    sha256: Optional[str] = None
+
+
+class EvidenceCache:
+    """
+    Bounded LRU of validated EvidenceBundle objects keyed by incident_id.
+    - within ttl_seconds: served from memory, no I/O
+    - after ttl_seconds: revalidated (ETag conditional GET / mtime stat);
+      unchanged bundles are not re-downloaded or re-validated
+    Misses (not found) are never cached so newly written bundles show up immediately.
+    Sources that hand back a "stream" (bundles over the size threshold) are parsed
+    incrementally with at most max_items alerts/signals kept; the result carries
+    "stats" with the full counts.
+    Callers that already know the stored bundle's fingerprint pass it as sha256:
+    an entry tagged with a different (or no) fingerprint is revalidated instead of
+    served from memory, and is tagged once the fetch confirms or replaces it.
+    """
+
+    def __init__(self, fetch: Fetch, max_entries: int = 128, ttl_seconds: float = 30.0, max_items: int = 200) -> None:
+        self._fetch = fetch
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.max_items = max_items
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._counters = {"hits": 0, "misses": 0, "revalidations": 0, "not_modified": 0, "evictions": 0}
+
+    def _bump(self, name: str) -> None:
+        with self._lock:
+            self._counters[name] += 1
+
+    def get(self, incident_id: str, sha256: Optional[str] = None) -> Dict[str, Any]:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(incident_id)
+            if entry is not None and now - entry.checked_at < self.ttl_seconds and sha256 in (None, entry.sha256):
+                self._entries.move_to_end(incident_id)
+                self._counters["hits"] += 1
+                return self._result(entry, "hit")
+
+        validator = entry.validator if entry is not None else None
+        if entry is not None:
+            self._bump("revalidations")
+
+        out = self._fetch(incident_id, validator)
+        if not out.get("found"):
+            self.invalidate(incident_id)
+            self._bump("misses")
+            out.pop("validator", None)
+            return out
+
+        if out.get("not_modified") and entry is not None:
+            with self._lock:
+                entry.checked_at = time.monotonic()
+                if sha256 is not None:
+                    entry.sha256 = sha256
+                if incident_id in self._entries:
+                    self._entries.move_to_end(incident_id)
+                self._counters["not_modified"] += 1
+                self._counters["hits"] += 1
+            return self._result(entry, "revalidated")
+
+        stats = None
+        if "stream" in out:
+            with closing(out["stream"]) as stream:
+                bundle, stats = load_bundle_stream(stream, max_items=self.max_items)
+        else:
+            # the one validation on this path: pydantic parses the bytes directly, no json.loads dict
+            bundle = EvidenceBundle.model_validate_json(out["raw"])
+        location = {k: out[k] for k in ("uri", "path") if k in out}
+        entry = _Entry(bundle, location, out.get("validator"), time.monotonic(), stats, sha256)
+        self._store(incident_id, entry)
+        self._bump("misses")
+        return self._result(entry, "miss")
+
+    def peek(self, incident_id: str, sha256: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        The cached bundle if get() would serve it from memory (within ttl_seconds and,
+        with sha256, tagged with that fingerprint); never does I/O and never counts as a lookup.
+        """
+        with self._lock:
+            entry = self._entries.get(incident_id)
+            if entry is None or time.monotonic() - entry.checked_at >= self.ttl_seconds or sha256 not in (None, entry.sha256):
+                return None
+            return self._result(entry, "hit")
+
+    @staticmethod
+    def _result(entry: _Entry, cache: str) -> Dict[str, Any]:
+        out = {"found": True, **entry.location, "bundle": entry.bundle, "cache": cache}
+        if entry.stats is not None:
+            out["stats"] = entry.stats
+        return out
+
+    def _store(self, incident_id: str, entry: _Entry) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[incident_id] = entry
+            self._entries.move_to_end(incident_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._counters["evictions"] += 1
+
+    def invalidate(self, incident_id: str) -> None:
+        with self._lock:
+            self._entries.pop(incident_id, None)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._counters["hits"] + self._counters["misses"]
+            return {
+                **self._counters,
+                "hit_ratio": round(self._counters["hits"] / lookups, 3) if lookups else 0.0,
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+            }
@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import codecs
+import json
+from dataclasses import asdict, dataclass, field
+from typing import Any, BinaryIO, Dict, Iterator, List, Tuple
+
+from incident_triage_mcp.domain_models import Alert, EvidenceBundle, Signal
+from incident_triage_mcp.tools.triage import PREFERRED_SIGNAL_KEYS
+
+CHUNK_SIZE = 64 * 1024
+_WS = " \t\r\n"
+
+
+class _Reader:
+    """
+    Minimal pull parser over a binary stream: the top-level object is walked
+    member by member and arrays element by element, so only one element is
+    decoded (with json.JSONDecoder.raw_decode) at a time.
+    """
+
+    def __init__(self, stream: BinaryIO, chunk_size: int = CHUNK_SIZE) -> None:
+        self._stream = stream
+        self._chunk_size = chunk_size
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._decoder = json.JSONDecoder()
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        if self._eof:
+            return False
+        chunk = self._stream.read(self._chunk_size)
+        if self._pos:
+            self._buf = self._buf[self._pos:]
+            self._pos = 0
+        if not chunk:
+            self._eof = True
+            self._buf += self._utf8.decode(b"", final=True)
+            return False
+        self._buf += self._utf8.decode(chunk)
+        return True
+
+    def peek(self) -> str:
+        while True:
+            buf, pos = self._buf, self._pos
+            while pos < len(buf) and buf[pos] in _WS:
+                pos += 1
+            self._pos = pos
+            if pos < len(buf):
+                return buf[pos]
+            if not self._fill():
+                raise ValueError("unexpected end of evidence bundle JSON")
+
+    def expect(self, ch: str) -> None:
+        got = self.peek()
+        if got != ch:
+            raise ValueError(f"expected {ch!r} in evidence bundle JSON, got {got!r}")
+        self._pos += 1
+
+    def value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                obj, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # a number ending exactly at the buffer edge may continue in the next chunk
+            if end == len(self._buf) and self._fill():
+                continue
+            self._pos = end
+            return obj
+
+    def items(self) -> Iterator[Any]:
+        self.expect("[")
+        if self.peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield self.value()
+            sep = self.peek()
+            self._pos += 1
+            if sep == "]":
+                return
+            if sep != ",":
+                raise ValueError(f"expected ',' or ']' in evidence bundle JSON, got {sep!r}")
+
+    def members(self) -> Iterator[str]:
+        """Yields each key; the caller must consume its value (value/items/skip) before continuing."""
+        self.expect("{")
+        if self.peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            key = self.value()
+            self.expect(":")
+            yield key
+            sep = self.peek()
+            self._pos += 1
+            if sep == "}":
+                return
+            if sep != ",":
+                raise ValueError(f"expected ',' or '}}' in evidence bundle JSON, got {sep!r}")
+
+    def skip(self) -> None:
+        if self.peek() == "[":
+            for _ in self.items():
+                pass
+        else:
+            self.value()
+
+
+@dataclass
+class BundleStats:
+    """Counts and aggregates over the full alerts/signals arrays of a streamed bundle."""
+    max_items: int
+    alerts_total: int = 0
+    signals_total: int = 0
+    alerts_kept: int = 0
+    signals_kept: int = 0
+    alert_priorities: Dict[str, int] = field(default_factory=dict)
+    alert_statuses: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def truncated(self) -> bool:
+        return self.alerts_total > self.alerts_kept or self.signals_total > self.signals_kept
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {**asdict(self), "truncated": self.truncated}
+
+
+def load_bundle_stream(stream: BinaryIO, max_items: int = 200) -> Tuple[EvidenceBundle, BundleStats]:
+    """
+    Parse and validate a bundle incrementally. At most max_items alerts and
+    signals are materialized (plus the preferred triage signals that appear
+    later), so peak memory does not grow with the bundle size.
+    """
+    reader = _Reader(stream)
+    stats = BundleStats(max_items=max_items)
+    top: Dict[str, Any] = {}
+    alerts: List[Alert] = []
+    signals: List[Signal] = []
+    late_preferred = 0
+
+    for key in reader.members():
+        if key == "alerts":
+            for item in reader.items():
+                alert = Alert.model_validate(item)
+                stats.alerts_total += 1
+                stats.alert_priorities[alert.priority] = stats.alert_priorities.get(alert.priority, 0) + 1
+                stats.alert_statuses[alert.status] = stats.alert_statuses.get(alert.status, 0) + 1
+                if len(alerts) < max_items:
+                    alerts.append(alert)
+        elif key == "signals":
+            for item in reader.items():
+                signal = Signal.model_validate(item)
+                stats.signals_total += 1
+                if len(signals) < max_items:
+                    signals.append(signal)
+                elif signal.key in PREFERRED_SIGNAL_KEYS and late_preferred < len(PREFERRED_SIGNAL_KEYS):
+                    # the summary ranks these first wherever they appear
+                    signals.append(signal)
+                    late_preferred += 1
+        else:
+            top[key] = reader.value()
+
+    stats.alerts_kept = len(alerts)
+    stats.signals_kept = len(signals)
+    bundle = EvidenceBundle.model_validate({**top, "alerts": alerts, "signals": signals})
+    return bundle, stats
+
+
+def page_bundle_stream(stream: BinaryIO, section: str, offset: int = 0, limit: int = 100) -> Dict[str, Any]:
+    """One page of the bundle's alerts or signals, streamed; only the page is kept in memory."""
+    model = {"alerts": Alert, "signals": Signal}.get(section)
+    if model is None:
+        raise ValueError("section must be 'alerts' or 'signals'")
+
+    reader = _Reader(stream)
+    items: List[Dict[str, Any]] = []
+    total = 0
+    for key in reader.members():
+        if key != section:
+            reader.skip()
+            continue
+        for item in reader.items():
+            if offset <= total < offset + limit:
+                items.append(model.model_validate(item).model_dump())
+            total += 1
+        break
+
+    next_offset = offset + len(items)
+    return {
+        "section": section,
+        "offset": offset,
+        "limit": limit,
+        "total": total,
+        "items": items,
+        "next_offset": next_offset if next_offset < total else None,
+    }
@@ -1,34 +1,165 @@
 from __future__ import annotations
 
+import asyncio
+import time
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
-from typing import Dict, Any
+from typing import Any, Awaitable, Callable, Dict, Optional
 
-def triage_incident_run(
+TERMINAL_STATES = {"success", "failed", "upstream_failed"}
+
+
+async def wait_for_dag_run(
+    get_dag_run: Callable[[str], Awaitable[Dict[str, Any]]],
+    dag_run_id: str,
+    timeout_seconds: float = 600.0,
+    initial_backoff: float = 1.0,
+    max_backoff: float = 10.0,
+) -> Dict[str, Any]:
+    """Poll a DAG run with exponential backoff until it succeeds, fails, or times out."""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout_seconds
+    delay = initial_backoff
+    polls = 0
+    while True:
+        polls += 1
+        run = await get_dag_run(dag_run_id)
+        state = run.get("state")
+        if state in TERMINAL_STATES or loop.time() + delay > deadline:
+            return {"dag_run": run, "state": state, "polls": polls}
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, max_backoff)
+
+
+@dataclass
+class _TrackedRun:
+    task: Optional[asyncio.Task] = None
+    trigger: Optional[Dict[str, Any]] = None
+    triggered: asyncio.Event = field(default_factory=asyncio.Event)
+    finished_at: Optional[float] = None
+
+
+class DagRunTracker:
+    """
+    At most one evidence DAG run per incident_id.
+    Repeated triage calls attach to the in-flight run (or to a run that finished
+    less than reuse_seconds ago) instead of triggering new Airflow work.
+    """
+
+    def __init__(self, reuse_seconds: float = 60.0) -> None:
+        self.reuse_seconds = reuse_seconds
+        self._runs: dict[str, _TrackedRun] = {}
+
+    def _prune(self) -> None:
+        now = time.monotonic()
+        for iid in [i for i, t in self._runs.items() if t.finished_at is not None and now - t.finished_at > self.reuse_seconds]:
+            del self._runs[iid]
+
+    def _reusable(self, incident_id: str) -> Optional[_TrackedRun]:
+        tracked = self._runs.get(incident_id)
+        if tracked is None:
+            return None
+        if tracked.finished_at is not None:
+            # only a successful run is worth reusing; after a failure (or a tracking timeout) a retry triggers anew
+            succeeded = (
+                not tracked.task.cancelled()
+                and tracked.task.exception() is None
+                and tracked.task.result().get("state") == "success"
+            )
+            if not succeeded or time.monotonic() - tracked.finished_at > self.reuse_seconds:
+                del self._runs[incident_id]
+                return None
+        return tracked
+
+    async def track(
+        self,
+        incident_id: str,
+        trigger: Callable[[], Awaitable[Dict[str, Any]]],
+        get_dag_run: Callable[[str], Awaitable[Dict[str, Any]]],
+        wait_seconds: float,
+        track_seconds: float = 600.0,
+    ) -> Dict[str, Any]:
+        self._prune()
+        tracked = self._reusable(incident_id)
+        attached = tracked is not None
+        if tracked is None:
+            tracked = _TrackedRun()
+            tracked.task = asyncio.create_task(self._run(tracked, trigger, get_dag_run, track_seconds))
+            self._runs[incident_id] = tracked
+
+        try:
+            result = await asyncio.wait_for(asyncio.shield(tracked.task), wait_seconds)
+        except asyncio.TimeoutError:
+            # still running: report the run we're tracking; later calls attach to it
+            if not tracked.triggered.is_set():
+                try:
+                    await asyncio.wait_for(asyncio.shield(tracked.triggered.wait()), 15)
+                except asyncio.TimeoutError:
+                    pass
+            result = {"dag_run": (tracked.trigger or {}).get("dag_run"), "state": "running", "pending": True}
+        return {**result, "trigger": tracked.trigger, "attached": attached}
+
+    async def _run(self, tracked: _TrackedRun, trigger, get_dag_run, track_seconds: float) -> Dict[str, Any]:
+        try:
+            tracked.trigger = await trigger()
+            tracked.triggered.set()
+            dag_run_id = tracked.trigger["dag_run"]["dag_run_id"]
+            return await wait_for_dag_run(get_dag_run, dag_run_id, timeout_seconds=track_seconds)
+        finally:
+            tracked.triggered.set()
+            tracked.finished_at = time.monotonic()
+
+
+async def triage_incident_run(
     incident_id: str,
     service: str,
     alerts_fetch_active,
     airflow_trigger_incident_dag,
     airflow_get_incident_artifact,
+    airflow_get_dag_run=None,
+    tracker: Optional[DagRunTracker] = None,
+    wait_seconds: float = 60.0,
     tickets_create=None,
 ) -> Dict[str, Any]:
     """
     Pure function orchestration: easy to test, no MCP imports.
+    The step callables are async (awaited on the server's event loop).
+    With airflow_get_dag_run + tracker, the DAG run is followed to completion
+    (backoff polling, early exit on failure) before the artifact is read, and
+    concurrent/repeated calls for the same incident share one run.
     """
     # 1) Evidence: current alerts
-    alerts = alerts_fetch_active(services=[service], since_minutes=30, max_alerts=50)
+    alerts = await alerts_fetch_active(services=[service], since_minutes=30, max_alerts=50)
 
-    # 2) Kick off Airflow evidence pipeline
-    dag_run = airflow_trigger_incident_dag(incident_id=incident_id, service=service)
+    # 2) Kick off Airflow evidence pipeline (or attach to the one already running)
+    if tracker is not None and airflow_get_dag_run is not None:
+        run = await tracker.track(
+            incident_id,
+            trigger=lambda: airflow_trigger_incident_dag(incident_id=incident_id, service=service),
+            get_dag_run=airflow_get_dag_run,
+            wait_seconds=wait_seconds,
+        )
+        dag_run = (run.get("trigger") or {}).get("dag_run")
+        state = run.get("state")
+        airflow_out = {"dag_run": run.get("dag_run") or dag_run, "state": state, "attached": run["attached"]}
+    else:
+        dag_run = await airflow_trigger_incident_dag(incident_id=incident_id, service=service)
+        state = None
+        airflow_out = {"dag_run": dag_run}
 
-    # 3) Pull artifact (may not exist immediately; caller can re-call)
-    artifact = airflow_get_incident_artifact(incident_id=incident_id)
+    # 3) Pull artifact once the run succeeded (skip the blind read on failure / still running)
+    if state in (None, "success"):
+        artifact = await airflow_get_incident_artifact(incident_id=incident_id)
+    else:
+        artifact = {"found": False, "skipped": f"dag run state: {state}"}
 
     # 4) Simple summary (keep deterministic; don’t “invent”)
+    status = {"failed": "evidence_failed", "upstream_failed": "evidence_failed", "running": "evidence_pending"}.get(state, "triage_started")
     summary = {
         "incident_id": incident_id,
         "service": service,
-        "status": "triage_started",
-        "alerts_count": len(alerts.get("alerts", [])),
+        "status": status,
+        "alerts_count": alerts.get("grouping", {}).get("total_alerts", len(alerts.get("alerts", []))),
         "artifact_found": artifact.get("found", False),
         "next_steps": [
             "Confirm if a deploy happened in the last 30 minutes",
@@ -40,13 +171,13 @@ def triage_incident_run(
     out = {
         "summary": summary,
         "alerts": alerts,
-        "airflow": {"dag_run": dag_run},
+        "airflow": airflow_out,
         "artifact": artifact,
     }
 
     # Optional: ticket
     if tickets_create is not None:
-        ticket = tickets_create(
+        ticket = await tickets_create(
             title=f"[{service}] Incident {incident_id} triage started",
             body=f"Auto-triage summary: {summary}",
             severity="SEV2",
@@ -54,4 +185,3 @@ def triage_incident_run(
         out["ticket"] = ticket
 
     return out
-
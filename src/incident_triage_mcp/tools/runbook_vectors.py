@@ -0,0 +1,321 @@
+"""
+Semantic runbook retrieval over hashed n-gram vectors.
+
+Runbooks are split into chunks (Markdown sections, capped at CHUNK_WORDS), and
+each chunk is embedded locally with no model download: every token contributes
+a signed word feature plus its character trigrams, hashed into `dim` buckets,
+IDF-weighted per bucket and L2-normalized. Trigrams give partial credit across
+word forms that share no exact token ("saturated" / "saturation",
+"deployment" / "deploys").
+
+On disk the index is two files: <path> (a float32 .npy matrix, one row per
+chunk, memory-mapped on load) and <path>.json (chunk -> runbook table, IDF
+weights). A query is one matrix-vector product plus argpartition top-k.
+"""
+from __future__ import annotations
+
+import json
+import os
+import re
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from incident_triage_mcp.tools.runbooks import _tokenize, read_runbook, source_signature
+
+try:
+    import numpy as np
+except ImportError:  # optional: pip install 'incident-triage-mcp[semantic]'
+    np = None
+
+SEARCH_MODES = ("lexical", "semantic", "hybrid")
+DEFAULT_DIM = 512
+CHUNK_WORDS = 120
+_HEADING = re.compile(r"^#{1,6}\s", re.MULTILINE)
+_TRIGRAM_WEIGHT = 0.5
+
+# doc_id, title, text, summary
+Document = Tuple[str, str, str, str]
+
+
+def _numpy():
+    if np is None:
+        raise RuntimeError("RUNBOOKS_SEARCH_MODE=semantic|hybrid requires the optional 'numpy' package")
+    return np
+
+
+def chunk_text(title: str, text: str, max_words: int = CHUNK_WORDS) -> List[str]:
+    """Split on Markdown headings, then cap each section; every chunk carries the runbook title."""
+    chunks = []
+    for section in _HEADING.split(text):
+        words = section.split()
+        for i in range(0, len(words), max_words):
+            chunks.append(title + "\n" + " ".join(words[i : i + max_words]))
+    return chunks or [title]
+
+
+class _Featurizer:
+    """token -> (bucket, signed weight) pairs; memoized, runbook vocabularies are small."""
+
+    def __init__(self, dim: int) -> None:
+        self.dim = dim
+        self._cache: Dict[str, List[Tuple[int, float]]] = {}
+
+    def features(self, token: str) -> List[Tuple[int, float]]:
+        feats = self._cache.get(token)
+        if feats is None:
+            feats = [self._hash(b"w:" + token.encode("utf-8"), 1.0)]
+            padded = f"<{token}>"
+            for i in range(len(padded) - 2):
+                feats.append(self._hash(b"g:" + padded[i : i + 3].encode("utf-8"), _TRIGRAM_WEIGHT))
+            self._cache[token] = feats
+        return feats
+
+    def _hash(self, key: bytes, weight: float) -> Tuple[int, float]:
+        h = zlib.crc32(key)  # stable across processes, unlike hash()
+        return h % self.dim, weight if h & 0x80000000 else -weight
+
+    def raw(self, texts: Iterable[str]):
+        """Unweighted (rows x dim) float32 term-feature matrix."""
+        rows, cols, vals = [], [], []
+        n = 0
+        for row, text in enumerate(texts):
+            n = row + 1
+            counts: Dict[str, int] = {}
+            for t in _tokenize(text):
+                counts[t] = counts.get(t, 0) + 1
+            for t, tf in counts.items():
+                for col, w in self.features(t):
+                    rows.append(row)
+                    cols.append(col)
+                    vals.append(w * tf)
+        m = np.zeros((n, self.dim), dtype=np.float32)
+        if rows:
+            np.add.at(m, (np.asarray(rows), np.asarray(cols)), np.asarray(vals, dtype=np.float32))
+        return m
+
+
+def _normalize_rows(m):
+    norms = np.linalg.norm(m, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return m / norms
+
+
+class RunbookVectors:
+    """
+    Chunk-level embedding matrix for runbooks plus the chunk -> runbook table.
+    search() returns the same hit shape as the BM25 indexes (score in 0..1 is
+    the best chunk's cosine similarity).
+    """
+
+    def __init__(
+        self,
+        matrix,
+        chunk_doc,
+        docs: List[List[str]],
+        idf,
+        source: Optional[List[int]] = None,
+    ) -> None:
+        self.matrix = matrix
+        self.chunk_doc = chunk_doc
+        self.docs = docs
+        self.idf = idf
+        self.dim = int(matrix.shape[1]) if matrix.ndim == 2 else len(idf)
+        # source_signature() of the runbooks directory these vectors were built from ([] if unknown)
+        self.source = list(source or [])
+        self._featurizer = _Featurizer(self.dim)
+
+    def __len__(self) -> int:
+        return len(self.docs)
+
+    @property
+    def chunks(self) -> int:
+        return int(self.matrix.shape[0])
+
+    @classmethod
+    def from_documents(cls, documents: Iterable[Document], dim: int = DEFAULT_DIM, source: Optional[List[int]] = None) -> "RunbookVectors":
+        _numpy()
+        docs: List[List[str]] = []
+        texts: List[str] = []
+        chunk_doc: List[int] = []
+        for doc_id, title, text, summary in documents:
+            for chunk in chunk_text(title, text):
+                texts.append(chunk)
+                chunk_doc.append(len(docs))
+            docs.append([doc_id, title, summary])
+        raw = _Featurizer(dim).raw(texts)
+        # bucket-level IDF: buckets hit by every chunk (stopwords, common trigrams) carry little signal
+        df = np.count_nonzero(raw, axis=0).astype(np.float32)
+        idf = np.log((1.0 + len(texts)) / (1.0 + df)).astype(np.float32) + 1.0
+        matrix = _normalize_rows(raw * idf).astype(np.float32)
+        return cls(matrix, np.asarray(chunk_doc, dtype=np.int32), docs, idf, source)
+
+    @classmethod
+    def from_dir(cls, runbooks_dir: str, dim: int = DEFAULT_DIM) -> "RunbookVectors":
+        base = Path(runbooks_dir)
+        # taken before reading: a runbook edited mid-build leaves the vectors stale, not marked fresh
+        source = source_signature(runbooks_dir)
+        documents = []
+        for p in sorted(base.glob("*.md")):
+            title, body, summary = read_runbook(p)
+            documents.append((p.stem, title, body, summary))
+        return cls.from_documents(documents, dim=dim, source=source)
+
+    @classmethod
+    def load(cls, path: str) -> "RunbookVectors":
+        _numpy()
+        meta = json.loads(Path(path + ".json").read_bytes())
+        matrix = np.load(path, mmap_mode="r")
+        if matrix.ndim != 2 or matrix.shape[0] != len(meta["chunk_doc"]):
+            raise ValueError(f"{path}: matrix and metadata disagree (partially replaced?)")
+        return cls(
+            matrix,
+            np.asarray(meta["chunk_doc"], dtype=np.int32),
+            meta["docs"],
+            np.asarray(meta["idf"], dtype=np.float32),
+            meta.get("source"),
+        )
+
+    def save(self, path: str) -> None:
+        """Write <path> (.npy) and <path>.json, each via an atomic rename."""
+        target = Path(path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        meta = {
+            "dim": self.dim,
+            "source": self.source,
+            "docs": self.docs,
+            "chunk_doc": self.chunk_doc.tolist(),
+            "idf": [round(float(x), 6) for x in self.idf],
+        }
+        tmp = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+        with open(tmp, "wb") as f:
+            np.save(f, np.ascontiguousarray(self.matrix, dtype=np.float32))
+        os.replace(tmp, target)
+        tmp_meta = target.with_name(f".{target.name}.json.{os.getpid()}.tmp")
+        tmp_meta.write_text(json.dumps(meta, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp_meta, target.with_name(target.name + ".json"))
+
+    def embed(self, query: str):
+        q = self._featurizer.raw([query])[0] * self.idf
+        norm = float(np.linalg.norm(q))
+        return q / norm if norm else q
+
+    def search(self, query: str, limit: int = 5) -> List[Dict[str, Any]]:
+        if not self.chunks or limit <= 0:
+            return []
+        q = self.embed(query)
+        if not q.any():
+            return []
+        scores = self.matrix @ q
+        # a runbook can own several of the best chunks: over-fetch, then keep each runbook's best
+        k = min(self.chunks, limit * 8)
+        top = np.argpartition(-scores, k - 1)[:k] if k < self.chunks else np.arange(self.chunks)
+        best: Dict[int, float] = {}
+        for i in top[np.argsort(-scores[top], kind="stable")]:
+            d = int(self.chunk_doc[i])
+            if d not in best:
+                best[d] = float(scores[i])
+                if len(best) == limit:
+                    break
+        out = []
+        for d, s in best.items():
+            if s <= 0.0:
+                continue
+            doc_id, title, summary = self.docs[d]
+            out.append({"doc_id": doc_id, "title": title, "score": round(min(1.0, s), 3), "summary": summary})
+        return out
+
+
+class MappedRunbookVectors:
+    """
+    A vectors file on disk, re-mapped when it is replaced (one stat per refresh_seconds).
+    With runbooks_dir, the file is also rewritten first whenever the directory's
+    source_signature() moved on, the same check the prebuilt BM25 index uses.
+    """
+
+    def __init__(self, path: str, refresh_seconds: float = 5.0, runbooks_dir: Optional[str] = None) -> None:
+        self.path = path
+        self.refresh_seconds = refresh_seconds
+        self.runbooks_dir = runbooks_dir
+        if runbooks_dir is not None:
+            build_vectors_file(runbooks_dir, path)
+        self._lock = threading.Lock()
+        self._last_refresh = time.monotonic()
+        self._stat = self._fingerprint()
+        self.vectors = RunbookVectors.load(path)
+
+    def _fingerprint(self) -> tuple:
+        st = os.stat(self.path + ".json")
+        return st.st_ino, st.st_mtime_ns, st.st_size
+
+    def search(self, query: str, limit: int = 5) -> List[Dict[str, Any]]:
+        now = time.monotonic()
+        if now - self._last_refresh >= self.refresh_seconds:
+            with self._lock:
+                self._last_refresh = now
+                try:
+                    if self.runbooks_dir is not None and source_signature(self.runbooks_dir) != self.vectors.source:
+                        build_vectors_file(self.runbooks_dir, self.path, dim=self.vectors.dim)
+                    fp = self._fingerprint()
+                    if fp != self._stat:
+                        self.vectors = RunbookVectors.load(self.path)
+                        self._stat = fp
+                except (FileNotFoundError, ValueError):
+                    pass  # mid-replace or removed: keep serving the last good matrix
+        return self.vectors.search(query, limit)
+
+
+class LiveRunbookVectors:
+    """
+    Vectors embedded in memory from runbooks_dir, rebuilt when its source_signature()
+    changes (one directory scan per refresh_seconds), so semantic scores track the
+    same edits as the BM25 index. IDF is corpus-wide, so a change re-embeds every chunk.
+    """
+
+    def __init__(self, runbooks_dir: str, refresh_seconds: float = 5.0, dim: int = DEFAULT_DIM) -> None:
+        self.runbooks_dir = runbooks_dir
+        self.refresh_seconds = refresh_seconds
+        self._lock = threading.Lock()
+        self._last_refresh = time.monotonic()
+        self.vectors = RunbookVectors.from_dir(runbooks_dir, dim=dim)
+
+    def search(self, query: str, limit: int = 5) -> List[Dict[str, Any]]:
+        now = time.monotonic()
+        if now - self._last_refresh >= self.refresh_seconds:
+            with self._lock:
+                self._last_refresh = now
+                try:
+                    if source_signature(self.runbooks_dir) != self.vectors.source:
+                        self.vectors = RunbookVectors.from_dir(self.runbooks_dir, dim=self.vectors.dim)
+                except FileNotFoundError:
+                    pass  # runbooks directory gone: keep serving the last build
+        return self.vectors.search(query, limit)
+
+
+def build_vectors_file(runbooks_dir: str, path: str, force: bool = False, dim: int = DEFAULT_DIM) -> bool:
+    """Same freshness rule as build_index_file: skipped while the directory's source_signature() is unchanged."""
+    source = source_signature(runbooks_dir)
+    if not force:
+        try:
+            meta = json.loads(Path(path + ".json").read_bytes())
+            if Path(path).exists() and meta.get("source") == source and meta.get("dim") == dim:
+                return False
+        except (FileNotFoundError, ValueError):
+            pass
+    RunbookVectors.from_dir(runbooks_dir, dim=dim).save(path)
+    return True
+
+
+def blend(lexical: List[Dict[str, Any]], semantic: List[Dict[str, Any]], weight: float, limit: int) -> List[Dict[str, Any]]:
+    """weight * semantic + (1 - weight) * lexical per runbook; both scores are already in 0..1."""
+    merged: Dict[str, Dict[str, Any]] = {}
+    for hits, w in ((lexical, 1.0 - weight), (semantic, weight)):
+        for h in hits:
+            m = merged.setdefault(h["doc_id"], {**h, "score": 0.0})
+            m["score"] += w * h["score"]
+    ranked = sorted(merged.values(), key=lambda h: (-h["score"], h["doc_id"]))[:limit]
+    for h in ranked:
+        h["score"] = round(h["score"], 3)
+    return ranked
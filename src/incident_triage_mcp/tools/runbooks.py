@@ -1,29 +1,475 @@
 from __future__ import annotations
 
+from array import array
+from dataclasses import dataclass
 from pathlib import Path
-import re
+from typing import Optional
+import argparse
+import heapq
+import json
 import math
+import mmap
+import os
+import re
+import struct
+import sys
+import threading
+import time
+
+_SPLIT = re.compile(r"[^a-zA-Z0-9]+")
+_MAGIC = b"RBIDX\x00\x00\x02"
+
+
+def _normalize(t: str) -> str:
+    # Cheap plural folding so "timeout" matches "timeouts" now that we match
+    # whole tokens instead of substrings.
+    if len(t) > 3 and t.endswith("s") and not t.endswith("ss"):
+        return t[:-1]
+    return t
+
 
 def _tokenize(s: str) -> list[str]:
-    return [t for t in re.split(r"[^a-zA-Z0-9]+", s.lower()) if t]
+    return [_normalize(t) for t in _SPLIT.split(s.lower()) if t]
 
-def _score(query_tokens: list[str], text: str) -> float:
-    hay = text.lower()
-    hits = sum(1 for t in query_tokens if t in hay)
-    return 1.0 - math.exp(-hits / 4.0)
 
-def search_runbooks(runbooks_dir: str, query: str, limit: int = 5) -> list[dict]:
+def source_signature(runbooks_dir: str) -> list[int]:
+    """
+    [directory mtime, *.md count, newest *.md mtime] of a runbooks directory.
+    Changes on adds, removes and renames (directory mtime, count) and on in-place
+    edits (newest file mtime); one scandir, no file reads.
+    """
     base = Path(runbooks_dir)
-    if not base.exists():
+    count = newest = 0
+    with os.scandir(base) as it:
+        for entry in it:
+            if entry.name.endswith(".md") and entry.is_file():
+                count += 1
+                newest = max(newest, entry.stat().st_mtime_ns)
+    return [base.stat().st_mtime_ns, count, newest]
+
+
+def read_runbook(path: Path) -> tuple[str, str, str]:
+    """(title, body, summary) of one Markdown runbook; the title is its first line."""
+    body = path.read_text(encoding="utf-8", errors="ignore")
+    lines = body.splitlines()
+    title = lines[0].lstrip("# ").strip() if body.strip() else path.stem
+    summary = " ".join(lines[0:20])[:220]
+    return title, body, summary
+
+
+@dataclass
+class _Doc:
+    doc_id: str
+    title: str
+    summary: str
+    length: int
+    terms: dict[str, int]
+    mtime_ns: int = 0
+
+
+class RunbookIndex:
+    """
+    In-process inverted index over runbooks, ranked with BM25.
+
+    - Documents are tokenized once; postings map term -> {doc_id: tf}.
+    - refresh() re-reads only files whose mtime changed (and drops deleted ones).
+    - Refresh checks are throttled by refresh_seconds so searches stay in memory.
+    """
+
+    def __init__(
+        self,
+        runbooks_dir: Optional[str] = None,
+        refresh_seconds: float = 5.0,
+        k1: float = 1.2,
+        b: float = 0.75,
+    ) -> None:
+        self.base = Path(runbooks_dir) if runbooks_dir else None
+        self.refresh_seconds = refresh_seconds
+        self.k1 = k1
+        self.b = b
+        self._docs: dict[str, _Doc] = {}
+        self._postings: dict[str, dict[str, int]] = {}
+        self._total_len = 0
+        self._last_refresh = 0.0
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def add_document(self, doc_id: str, title: str, text: str, summary: str, mtime_ns: int = 0) -> None:
+        tokens = _tokenize(title + "\n" + text)
+        terms: dict[str, int] = {}
+        for t in tokens:
+            terms[t] = terms.get(t, 0) + 1
+        with self._lock:
+            self.remove_document(doc_id)
+            self._docs[doc_id] = _Doc(doc_id, title, summary, len(tokens), terms, mtime_ns)
+            self._total_len += len(tokens)
+            for t, tf in terms.items():
+                self._postings.setdefault(t, {})[doc_id] = tf
+
+    def remove_document(self, doc_id: str) -> None:
+        with self._lock:
+            doc = self._docs.pop(doc_id, None)
+            if doc is None:
+                return
+            self._total_len -= doc.length
+            for t in doc.terms:
+                posting = self._postings.get(t)
+                if posting is None:
+                    continue
+                posting.pop(doc_id, None)
+                if not posting:
+                    del self._postings[t]
+
+    def refresh(self, force: bool = False) -> int:
+        """Sync the index with runbooks_dir. Returns the number of (re)indexed/removed docs."""
+        if self.base is None:
+            return 0
+        now = time.monotonic()
+        with self._lock:
+            if not force and self._last_refresh and now - self._last_refresh < self.refresh_seconds:
+                return 0
+            self._last_refresh = now
+
+            seen: dict[str, int] = {}
+            if self.base.is_dir():
+                with os.scandir(self.base) as it:
+                    for entry in it:
+                        if entry.name.endswith(".md") and entry.is_file():
+                            seen[entry.name[:-3]] = entry.stat().st_mtime_ns
+
+            changed = 0
+            for doc_id in [d for d in self._docs if d not in seen]:
+                self.remove_document(doc_id)
+                changed += 1
+            for doc_id, mtime_ns in seen.items():
+                doc = self._docs.get(doc_id)
+                if doc is not None and doc.mtime_ns == mtime_ns:
+                    continue
+                title, body, summary = read_runbook(self.base / f"{doc_id}.md")
+                self.add_document(doc_id, title, body, summary, mtime_ns=mtime_ns)
+                changed += 1
+            return changed
+
+    def search(self, query: str, limit: int = 5) -> list[dict]:
+        self.refresh()
+        q = list(dict.fromkeys(_tokenize(query)))
+        if not q:
+            return []
+        with self._lock:
+            n = len(self._docs)
+            if not n:
+                return []
+            docs = self._docs
+            ranked, upper = _bm25(
+                q, n, self._total_len / n or 1.0, self.k1, self.b,
+                lambda t: self._postings.get(t, {}).items(),
+                lambda doc_id: docs[doc_id].length,
+                limit,
+            )
+            return [_hit(doc_id, docs[doc_id].title, docs[doc_id].summary, s, upper) for doc_id, s in ranked]
+
+    def save(self, path: str, source: Optional[list[int]] = None) -> None:
+        """Serialize to the prebuilt index format (see PrebuiltRunbookIndex); atomic replace."""
+        with self._lock:
+            doc_ids = sorted(self._docs)
+            ordinal = {d: i for i, d in enumerate(doc_ids)}
+            terms = sorted(self._postings)
+            doc_len = array("I", (self._docs[d].length for d in doc_ids))
+            doc_off, doc_blob = array("I", [0]), bytearray()
+            for d in doc_ids:
+                doc_blob += json.dumps([d, self._docs[d].title, self._docs[d].summary], ensure_ascii=False).encode("utf-8")
+                doc_off.append(len(doc_blob))
+            term_off, post_off, blob, postings = array("I", [0]), array("I", [0]), bytearray(), array("I")
+            for t in terms:
+                blob += t.encode("utf-8")
+                term_off.append(len(blob))
+                for doc_id, tf in sorted(self._postings[t].items(), key=lambda x: ordinal[x[0]]):
+                    postings.append(ordinal[doc_id])
+                    postings.append(tf)
+                post_off.append(len(postings) // 2)
+            meta = {
+                "k1": self.k1,
+                "b": self.b,
+                "total_len": self._total_len,
+                "n_docs": len(doc_ids),
+                "n_terms": len(terms),
+                "source": source or [],
+            }
+        if sys.byteorder != "little":
+            for a in (doc_len, doc_off, term_off, post_off, postings):
+                a.byteswap()
+        meta_raw = json.dumps(meta, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        meta_raw += b" " * (-len(meta_raw) % 4)  # keep the uint32 sections aligned
+        target = Path(path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+        with open(tmp, "wb") as f:
+            f.write(_MAGIC)
+            f.write(struct.pack("<I", len(meta_raw)))
+            f.write(meta_raw)
+            for a in (doc_len, doc_off, term_off, post_off, postings):
+                f.write(a.tobytes())
+            f.write(blob)
+            f.write(doc_blob)
+        os.replace(tmp, target)
+
+
+def _bm25(q, n, avgdl, k1, b, postings, doc_len, limit):
+    """Shared BM25 scorer: returns the top `limit` (doc, score) pairs and the saturation upper bound."""
+    acc: dict = {}
+    upper = 0.0
+    for t in q:
+        posting = postings(t)
+        df = len(posting)
+        idf = math.log(1.0 + (n - df + 0.5) / (df + 0.5))
+        upper += idf * (k1 + 1.0)
+        for doc, tf in posting:
+            dl = doc_len(doc)
+            acc[doc] = acc.get(doc, 0.0) + idf * tf * (k1 + 1.0) / (tf + k1 * (1.0 - b + b * dl / avgdl))
+    # ties broken by doc (prebuilt ordinals follow doc_id order), so both index kinds rank identically
+    return heapq.nsmallest(limit, acc.items(), key=lambda x: (-x[1], x[0])), upper
+
+
+def _hit(doc_id: str, title: str, summary: str, score: float, upper: float) -> dict:
+    # BM25 is unbounded; normalize by the saturation upper bound so scores stay in 0..1
+    return {"doc_id": doc_id, "title": title, "score": round(min(1.0, score / upper), 3), "summary": summary}
+
+
+class _Postings:
+    """(doc, tf) pairs of one term, read straight out of the mapped file."""
+
+    __slots__ = ("_data", "_start", "_end")
+
+    def __init__(self, data: memoryview, start: int, end: int) -> None:
+        self._data = data
+        self._start = start
+        self._end = end
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    def __iter__(self):
+        data = self._data
+        for i in range(self._start * 2, self._end * 2, 2):
+            yield data[i], data[i + 1]
+
+
+class PrebuiltRunbookIndex:
+    """
+    Read-only BM25 index loaded from a file written by RunbookIndex.save().
+
+    Layout (little-endian uint32 sections, memory-mapped, nothing decoded up front):
+        magic | meta_len | meta JSON (scalars) | doc_len[n_docs] | doc_off[n_docs+1]
+        | term_off[n_terms+1] | post_off[n_terms+1] | postings[(doc, tf) ...]
+        | sorted term bytes | doc entries (JSON [doc_id, title, summary] each)
+
+    Terms are found by binary search over the mapped term table and only the
+    returned hits' doc entries are decoded, so opening the index costs the same
+    whatever the corpus size. refresh() re-maps the file when
+    it is replaced (one stat per refresh_seconds). With runbooks_dir, refresh()
+    first rewrites the file when the directory's source_signature() moved on, so
+    added and edited runbooks show up as they do with RunbookIndex.
+    """
+
+    def __init__(self, path: str, refresh_seconds: float = 5.0, runbooks_dir: Optional[str] = None) -> None:
+        self.path = Path(path)
+        self.refresh_seconds = refresh_seconds
+        self.runbooks_dir = runbooks_dir
+        self._lock = threading.RLock()
+        self._last_refresh = 0.0
+        self._stat: tuple = ()
+        if runbooks_dir is not None:
+            build_index_file(runbooks_dir, path)
+        self._load()
+
+    def _load(self) -> None:
+        with open(self.path, "rb") as f:
+            st = os.fstat(f.fileno())
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            if mm[: len(_MAGIC)] != _MAGIC:
+                raise ValueError(f"{self.path}: not a runbook index")
+            if sys.byteorder != "little":
+                raise ValueError("prebuilt runbook indexes are little-endian only")
+            (meta_len,) = struct.unpack_from("<I", mm, len(_MAGIC))
+            pos = len(_MAGIC) + 4
+            meta = json.loads(bytes(mm[pos : pos + meta_len]))
+            pos += meta_len
+        except Exception:
+            mm.close()
+            raise
+        n_docs, n_terms = meta["n_docs"], meta["n_terms"]
+        words = memoryview(mm)[pos:]
+        words = words[: len(words) - len(words) % 4].cast("I")
+        doc_len = words[:n_docs]
+        doc_off = words[n_docs : 2 * n_docs + 1]
+        term_start = 2 * n_docs + 1
+        term_off = words[term_start : term_start + n_terms + 1]
+        post_off = words[term_start + n_terms + 1 : term_start + 2 * n_terms + 2]
+        post_start = term_start + 2 * n_terms + 2
+        n_pairs = post_off[n_terms] if n_terms else 0
+        postings = words[post_start : post_start + 2 * n_pairs]
+        blob_start = pos + 4 * (post_start + 2 * n_pairs)
+        doc_start = blob_start + (term_off[n_terms] if n_terms else 0)
+
+        with self._lock:
+            self._mm = mm
+            self._meta = meta
+            self._n_docs = n_docs
+            self._doc_len = doc_len
+            self._doc_off = doc_off
+            self._doc_blob = memoryview(mm)[doc_start:]
+            self._term_off = term_off
+            self._post_off = post_off
+            self._postings = postings
+            self._blob = memoryview(mm)[blob_start:]
+            self._n_terms = n_terms
+            # the previous map is left to GC: an in-flight search may still hold views into it
+            self._stat = (st.st_ino, st.st_mtime_ns, st.st_size)
+
+    def __len__(self) -> int:
+        return self._n_docs
+
+    @property
+    def source(self) -> list[int]:
+        """source_signature() of the runbooks directory the file was built from ([] if unknown)."""
+        return list(self._meta.get("source") or [])
+
+    def refresh(self, force: bool = False) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            if not force and now - self._last_refresh < self.refresh_seconds:
+                return False
+            self._last_refresh = now
+            if self.runbooks_dir is not None:
+                try:
+                    if source_signature(self.runbooks_dir) != self.source:
+                        build_index_file(self.runbooks_dir, str(self.path))
+                except FileNotFoundError:
+                    pass  # runbooks directory gone: keep serving the last build
+            try:
+                st = self.path.stat()
+            except FileNotFoundError:
+                return False  # keep serving the last good index
+            if (st.st_ino, st.st_mtime_ns, st.st_size) == self._stat:
+                return False
+            self._load()
+            return True
+
+    def _doc(self, i: int) -> list:
+        return json.loads(bytes(self._doc_blob[self._doc_off[i] : self._doc_off[i + 1]]))
+
+    def _term(self, i: int) -> bytes:
+        return bytes(self._blob[self._term_off[i] : self._term_off[i + 1]])
+
+    def _lookup(self, term: str) -> _Postings:
+        key = term.encode("utf-8")
+        lo, hi = 0, self._n_terms
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._term(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self._n_terms and self._term(lo) == key:
+            return _Postings(self._postings, self._post_off[lo], self._post_off[lo + 1])
+        return _Postings(self._postings, 0, 0)
+
+    def search(self, query: str, limit: int = 5) -> list[dict]:
+        self.refresh()
+        q = list(dict.fromkeys(_tokenize(query)))
+        if not q:
+            return []
+        with self._lock:
+            n = self._n_docs
+            if not n:
+                return []
+            ranked, upper = _bm25(
+                q, n, self._meta["total_len"] / n or 1.0, self._meta["k1"], self._meta["b"],
+                self._lookup, self._doc_len.__getitem__, limit,
+            )
+            return [_hit(*self._doc(i), s, upper) for i, s in ranked]
+
+
+_INDEXES: dict[str, RunbookIndex | PrebuiltRunbookIndex] = {}
+_INDEXES_LOCK = threading.Lock()
+
+
+def get_index(runbooks_dir: str, refresh_seconds: float = 5.0) -> RunbookIndex:
+    """Process-wide index per directory; built on first use, then refreshed incrementally."""
+    key = str(Path(runbooks_dir).expanduser().resolve())
+    with _INDEXES_LOCK:
+        idx = _INDEXES.get(key)
+        if idx is None:
+            idx = RunbookIndex(key, refresh_seconds=refresh_seconds)
+            idx.refresh(force=True)
+            _INDEXES[key] = idx
+    return idx
+
+
+def get_prebuilt(index_path: str, refresh_seconds: float = 5.0, runbooks_dir: Optional[str] = None) -> PrebuiltRunbookIndex:
+    """
+    Process-wide mapping of a prebuilt index file; re-mapped when the file is replaced,
+    and rebuilt from runbooks_dir (if given) when a runbook changes.
+    """
+    key = "prebuilt:" + str(Path(index_path).expanduser().resolve())
+    with _INDEXES_LOCK:
+        idx = _INDEXES.get(key)
+        if idx is None:
+            idx = PrebuiltRunbookIndex(key[len("prebuilt:"):], refresh_seconds=refresh_seconds, runbooks_dir=runbooks_dir)
+            _INDEXES[key] = idx
+    return idx
+
+
+def search_runbooks(runbooks_dir: str, query: str, limit: int = 5) -> list[dict]:
+    if not Path(runbooks_dir).exists():
         return []
-    q = _tokenize(query)
-    scored = []
-    for p in base.glob("*.md"):
-        body = p.read_text(encoding="utf-8", errors="ignore")
-        s = _score(q, body)
-        if s > 0:
-            title = body.splitlines()[0].lstrip("# ").strip() if body.strip() else p.stem
-            summary = " ".join(body.splitlines()[0:20])[:220]
-            scored.append((s, {"doc_id": p.stem, "title": title, "score": round(s, 3), "summary": summary}))
-    scored.sort(key=lambda x: x[0], reverse=True)
-    return [d for _, d in scored[:limit]]
\ No newline at end of file
+    return get_index(runbooks_dir).search(query, limit)
+
+
+def build_index_file(runbooks_dir: str, index_path: str, force: bool = False) -> bool:
+    """
+    (Re)write the prebuilt index for runbooks_dir. Skipped when the existing file
+    was built from the same source_signature() (no runbook added, removed, renamed
+    or edited since), which costs one directory scan. Returns True if the file was written.
+    """
+    source = source_signature(runbooks_dir)
+    if not force and Path(index_path).exists():
+        try:
+            if PrebuiltRunbookIndex(index_path).source == source:
+                return False
+        except ValueError:
+            pass  # unreadable or foreign file: rebuild it
+    idx = RunbookIndex(runbooks_dir)
+    idx.refresh(force=True)
+    idx.save(index_path, source=source)
+    return True
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Build the prebuilt runbook search index.")
+    ap.add_argument("--runbooks-dir", default=os.getenv("RUNBOOKS_DIR", "./runbooks"))
+    ap.add_argument("--out", default=os.getenv("RUNBOOKS_INDEX_PATH") or None, help="default: $RUNBOOKS_INDEX_PATH")
+    ap.add_argument(
+        "--vectors",
+        default=os.getenv("RUNBOOKS_VECTORS_PATH") or None,
+        help="also build the semantic vectors (.npy); default: $RUNBOOKS_VECTORS_PATH",
+    )
+    ap.add_argument("--force", action="store_true", help="rebuild even if no runbook changed")
+    args = ap.parse_args()
+    if not args.out and not args.vectors:
+        ap.error("--out (RUNBOOKS_INDEX_PATH) or --vectors (RUNBOOKS_VECTORS_PATH) is required")
+    if args.out:
+        written = build_index_file(args.runbooks_dir, args.out, force=args.force)
+        print(f"{args.out}: {'written' if written else 'up to date'}")
+    if args.vectors:
+        from incident_triage_mcp.tools.runbook_vectors import build_vectors_file
+
+        written = build_vectors_file(args.runbooks_dir, args.vectors, force=args.force)
+        print(f"{args.vectors}: {'written' if written else 'up to date'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from incident_triage_mcp.tools.evidence import locate_bundle
+
+# fingerprint(incident_id) -> content hash of the stored bundle, None if there is no bundle
+Fingerprint = Callable[[str], Optional[str]]
+# load(incident_id) -> {"bundle_sha256", "summary"} materialized by the DAG, None if absent
+LoadSummary = Callable[[str], Optional[Dict[str, Any]]]
+
+
+def s3_summary_source(store) -> Tuple[Fingerprint, LoadSummary]:
+    """HEAD the bundle (bundle-sha256 metadata, ETag for older bundles); GET summaries/v1/<id>.json."""
+    def fingerprint(incident_id: str) -> Optional[str]:
+        head = store.head_evidence_bundle(incident_id)
+        if not head["found"]:
+            return None
+        return head.get("sha256") or f"etag:{head.get('etag')}"
+
+    return fingerprint, store.read_summary
+
+
+def _file_sha256(path: Path, chunk_size: int = 1024 * 1024) -> str:
+    # chunked, so fingerprinting a large bundle does not hold it in memory
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        while chunk := f.read(chunk_size):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def fs_summary_source(artifact_dir: str, max_hashes: int = 4096) -> Tuple[Fingerprint, LoadSummary]:
+    """
+    sha256 of the bundle file (re-hashed only when its mtime/size change, remembered
+    for the max_hashes most recently fingerprinted bundles); <dir>/summaries/<id>.json.
+    """
+    hashes: "OrderedDict[str, Tuple[int, int, str]]" = OrderedDict()
+    lock = threading.Lock()
+
+    def fingerprint(incident_id: str) -> Optional[str]:
+        located = locate_bundle(artifact_dir, incident_id)
+        if located is None:
+            return None
+        path, st, _ = located
+        key = str(path)
+        with lock:
+            known = hashes.get(key)
+            if known is not None and known[:2] == (st.st_mtime_ns, st.st_size):
+                hashes.move_to_end(key)
+                return known[2]
+        digest = _file_sha256(path)
+        with lock:
+            hashes[key] = (st.st_mtime_ns, st.st_size, digest)
+            hashes.move_to_end(key)
+            while len(hashes) > max_hashes:
+                hashes.popitem(last=False)
+        return digest
+
+    def load(incident_id: str) -> Optional[Dict[str, Any]]:
+        try:
+            return json.loads((Path(artifact_dir) / "summaries" / f"{incident_id}.json").read_bytes())
+        except FileNotFoundError:
+            return None
+
+    return fingerprint, load
+
+
+class SummaryCache:
+    """
+    Triage summaries keyed by the bundle's content hash.
+    get() fingerprints the bundle (S3 HEAD / stat) and returns, in order:
+    - the in-memory summary for that hash
+    - the DAG-materialized summary artifact, if its bundle_sha256 matches
+    Otherwise the caller computes the summary and put()s it.
+    """
+
+    def __init__(self, fingerprint: Fingerprint, load: LoadSummary, max_entries: int = 128) -> None:
+        self._fingerprint = fingerprint
+        self._load = load
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[str, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._counters = {"memory": 0, "artifact": 0, "computed": 0, "stale_artifacts": 0}
+
+    def get(self, incident_id: str) -> Dict[str, Any]:
+        sha = self._fingerprint(incident_id)
+        if sha is None:
+            return {"found": False}
+
+        with self._lock:
+            entry = self._entries.get(incident_id)
+            if entry is not None and entry[0] == sha:
+                self._entries.move_to_end(incident_id)
+                self._counters["memory"] += 1
+                return {"found": True, "bundle_sha256": sha, "summary": entry[1], "source": "memory"}
+
+        doc = self._load(incident_id)
+        if doc is not None:
+            if doc.get("bundle_sha256") == sha and doc.get("summary"):
+                self._store(incident_id, sha, doc["summary"])
+                with self._lock:
+                    self._counters["artifact"] += 1
+                return {"found": True, "bundle_sha256": sha, "summary": doc["summary"], "source": "artifact"}
+            with self._lock:
+                self._counters["stale_artifacts"] += 1
+        return {"found": True, "bundle_sha256": sha}
+
+    def put(self, incident_id: str, sha: str, summary: Dict[str, Any]) -> None:
+        self._store(incident_id, sha, summary)
+        with self._lock:
+            self._counters["computed"] += 1
+
+    def _store(self, incident_id: str, sha: str, summary: Dict[str, Any]) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[incident_id] = (sha, summary)
+            self._entries.move_to_end(incident_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {**self._counters, "size": len(self._entries), "max_entries": self.max_entries}
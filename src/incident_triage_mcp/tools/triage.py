@@ -1,24 +1,31 @@
 from __future__ import annotations
-from typing import Any, Dict, List, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 from datetime import datetime, timezone
 from incident_triage_mcp.domain_models import EvidenceBundle, TriageSummary, Signal
 
+if TYPE_CHECKING:
+    from incident_triage_mcp.tools.evidence_stream import BundleStats
+
+# Common triage signals, ranked ahead of everything else
+PREFERRED_SIGNAL_KEYS = frozenset({"error_rate", "latency_p95_ms", "rps", "cpu", "memory", "db_timeouts", "top_endpoint"})
+
 
 def _utc_now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
-def _pick_priority(bundle: EvidenceBundle) -> str:
-    prios = [a.priority for a in bundle.alerts] or ["P3"]
+def _pick_priority(bundle: EvidenceBundle, stats: Optional["BundleStats"] = None) -> str:
+    prios = list(stats.alert_priorities) if stats is not None else [a.priority for a in bundle.alerts]
+    prios = prios or ["P3"]
     order = {"P1":1, "P2": 2, "P3": 3, "P4": 4}
     prios_sorted = sorted(prios, key=lambda p: order.get(p,99))
-    return prios_sorted(0)
+    return prios_sorted[0]
 
-def _pick_status(bundle: EvidenceBundle) -> str:
+def _pick_status(bundle: EvidenceBundle, stats: Optional["BundleStats"] = None) -> str:
     if not bundle.alerts:
         return "unknown"
     # If any triggered => triggered, else warning, else resolved
-    statuses = {a.status for a in bundle.alerts}
+    statuses = set(stats.alert_statuses) if stats is not None else {a.status for a in bundle.alerts}
     if "triggered" in statuses:
         return "triggered"
     if "warning" in statuses:
@@ -30,9 +37,8 @@ def _pick_status(bundle: EvidenceBundle) -> str:
 
 def _select_top_signals(signals: List[Signal], limit: int = 4) -> List[Signal]:
     # Prefer common triage signals if present
-    preferred_keys = {"error_rate", "latency_p95_ms", "rps", "cpu", "memory", "db_timeouts", "top_endpoint"}
-    preferred = [s for s in signals if s.key in preferred_keys]
-    others = [s for s in signals if s.key not in preferred_keys]
+    preferred = [s for s in signals if s.key in PREFERRED_SIGNAL_KEYS]
+    others = [s for s in signals if s.key not in PREFERRED_SIGNAL_KEYS]
     return (preferred + others)[:limit]
 
 
@@ -48,26 +54,36 @@ def _headline(bundle: EvidenceBundle, status: str, priority: str) -> str:
     return f"[{priority}] {bundle.service} incident is {status}{tail}".strip()
 
 
-def build_triage_summary(bundle_dict: Dict[str, Any], evidence_uri: str | None = None) -> Dict[str, Any]:
-    bundle = EvidenceBundle.model_validate(bundle_dict)
-
-    priority = _pick_priority(bundle)
-    status = _pick_status(bundle)
+def summarize_bundle(
+    bundle: EvidenceBundle,
+    evidence_uri: str | None = None,
+    stats: Optional["BundleStats"] = None,
+) -> TriageSummary:
+    """
+    Summary from an already-validated bundle. Every field is taken from validated
+    models, so the result is built with model_construct (no second validation pass).
+    For streamed (size-capped) bundles, stats carries the full-array counts.
+    """
+    priority = _pick_priority(bundle, stats)
+    status = _pick_status(bundle, stats)
+    alerts_total = stats.alerts_total if stats is not None else len(bundle.alerts)
     top_signals = _select_top_signals(bundle.signals, limit=4)
     top_alerts = bundle.alerts[:3]
     runbooks = sorted(bundle.runbook_hits, key=lambda r: r.score, reverse=True)[:3]
 
     findings = []
     if top_alerts:
-        findings.append(f"{len(bundle.alerts)} alert(s) in window; top: {top_alerts[0].name}")
+        findings.append(f"{alerts_total} alert(s) in window; top: {top_alerts[0].name}")
     if any(s.key == "top_endpoint" for s in bundle.signals):
         ep = next((s.value for s in bundle.signals if s.key == "top_endpoint"), None)
         if ep:
             findings.append(f"Top impacted endpoint: {ep}")
     if runbooks:
         findings.append(f"Top runbook match: {runbooks[0].title} (score={runbooks[0].score})")
+    if bundle.partial:
+        findings.append(f"Evidence incomplete; missing: {', '.join(bundle.missing_evidence) or 'unknown'}")
 
-    summary = TriageSummary(
+    return TriageSummary.model_construct(
         incident_id=bundle.incident_id,
         service=bundle.service,
         priority=priority,
@@ -88,4 +104,17 @@ def build_triage_summary(bundle_dict: Dict[str, Any], evidence_uri: str | None =
         generated_at_iso=_utc_now_iso(),
     )
 
-    return summary.model_dump()
\ No newline at end of file
+
+def summarize_raw(raw: bytes, evidence_uri: str | None = None) -> Dict[str, Any]:
+    """
+    Validate serialized bundle bytes and summarize them in one call. Bytes in,
+    plain dict out, so CpuPool can run it in another process without
+    pickling model objects either way.
+    """
+    return summarize_bundle(EvidenceBundle.model_validate_json(raw), evidence_uri).model_dump()
+
+
+def build_triage_summary(bundle_dict: Dict[str, Any] | EvidenceBundle, evidence_uri: str | None = None) -> Dict[str, Any]:
+    # already-validated bundles (e.g. from the evidence cache) are used as-is
+    bundle = bundle_dict if isinstance(bundle_dict, EvidenceBundle) else EvidenceBundle.model_validate(bundle_dict)
+    return summarize_bundle(bundle, evidence_uri).model_dump()
@@ -1,7 +1,15 @@
 from __future__ import annotations
 
+import asyncio
+import os
+import sys
 import time
-from typing import Any, Dict, Callable
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional
+
+import anyio
+
+from incident_triage_mcp.evidence_format import incident_id_from_name
 
 def wait_for(
     getter: Callable[[str], Dict[str, Any]],
@@ -27,4 +35,115 @@ def wait_for(
         "attempts": attempts,
         "timeout_seconds": timeout_seconds,
         "poll_seconds": poll_seconds,
-    }
\ No newline at end of file
+    }
+
+
+@dataclass
+class _Wait:
+    wake: asyncio.Event = field(default_factory=asyncio.Event)
+    task: Optional[asyncio.Task] = None
+    waiters: int = 0
+    attempts: int = 0
+
+
+class EvidenceWaiter:
+    """
+    Notification-driven waits for evidence bundles.
+    - one probe per incident_id, shared by every caller waiting on it
+    - probes are cheap existence checks (S3 HEAD / stat), never full GETs
+    - probes back off exponentially and are woken early by notify():
+      DAG webhook pings, S3 event notifications, or the fs watcher
+    """
+
+    def __init__(
+        self,
+        exists: Callable[[str], bool],
+        initial_backoff: float = 0.25,
+        max_backoff: float = 5.0,
+        watch_dir: Optional[str] = None,
+    ) -> None:
+        self._exists = exists
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self.watch_dir = watch_dir
+        self._waits: dict[str, _Wait] = {}
+        self._watcher: Optional[asyncio.Task] = None
+
+    def notify(self, incident_id: str) -> bool:
+        """Wake the probe for incident_id (if anyone is waiting). Must run on the event loop."""
+        w = self._waits.get(incident_id)
+        if w is None:
+            return False
+        w.wake.set()
+        return True
+
+    async def wait(self, incident_id: str, timeout_seconds: float, max_backoff: Optional[float] = None) -> Dict[str, Any]:
+        self._ensure_watcher()
+        w = self._waits.get(incident_id)
+        shared = w is not None
+        if w is None:
+            w = _Wait()
+            backoff_cap = min(self.max_backoff, max_backoff or self.max_backoff)
+            w.task = asyncio.create_task(self._probe(incident_id, w, backoff_cap))
+            self._waits[incident_id] = w
+        w.waiters += 1
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        try:
+            await asyncio.wait_for(asyncio.shield(w.task), timeout_seconds)
+            found = True
+        except asyncio.TimeoutError:
+            found = False
+        finally:
+            w.waiters -= 1
+            if w.waiters <= 0 or w.task.done():
+                if self._waits.get(incident_id) is w:
+                    del self._waits[incident_id]
+                if w.waiters <= 0 and not w.task.done():
+                    w.task.cancel()
+
+        return {
+            "found": found,
+            "attempts": w.attempts,
+            "waited_seconds": round(loop.time() - started, 3),
+            "shared": shared,
+        }
+
+    async def _probe(self, incident_id: str, w: _Wait, backoff_cap: float) -> None:
+        delay = self.initial_backoff
+        while True:
+            w.attempts += 1
+            if await anyio.to_thread.run_sync(self._exists, incident_id):
+                return
+            try:
+                await asyncio.wait_for(w.wake.wait(), delay)
+            except asyncio.TimeoutError:
+                pass
+            w.wake.clear()
+            delay = min(delay * 2, backoff_cap)
+
+    def _ensure_watcher(self) -> None:
+        if self.watch_dir is None or self._watcher is not None:
+            return
+        try:
+            from watchfiles import awatch
+        except ImportError:
+            # no inotify-style watcher available: backoff probes alone cover the fs store
+            # (clearing watch_dir also keeps this from being reported more than once)
+            print(
+                f"[evidence_waiter] watchfiles not installed, polling {self.watch_dir} instead "
+                "(pip install 'incident-triage-mcp[watch]')",
+                file=sys.stderr,
+            )
+            self.watch_dir = None
+            return
+        self._watcher = asyncio.create_task(self._watch(awatch))
+
+    async def _watch(self, awatch) -> None:
+        os.makedirs(self.watch_dir, exist_ok=True)
+        async for changes in awatch(self.watch_dir):
+            for _, path in changes:
+                incident_id = incident_id_from_name(os.path.basename(path))
+                if incident_id is not None:
+                    self.notify(incident_id)